@@ -0,0 +1 @@
+"""Offline throughput / latency benchmarks – run ``python -m benchmarks.run``."""
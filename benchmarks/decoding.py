@@ -0,0 +1,87 @@
+import argparse
+import json
+import sys
+import timeit
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from connector.decoding import decode, dumps, loads
+from connector.models import Item, ItemPage
+
+"""
+python -m benchmarks.decoding [--items 1000] [--repeat 5] [--output decoding.json]
+
+CPU cost of turning one page body into an ItemPage, per strategy:
+
+• validate_json    – what the client does: bytes → model in one pass
+• loads + validate – parse to dicts first, then model_validate()
+• model_construct  – parse to dicts, build models without validation
+
+The last row is why there is no "trusted source" decode mode: skipping
+validation in Python is slower than pydantic-core validating the bytes.
+"""
+
+
+def _page_body(items: int) -> bytes:
+    return dumps(
+        {
+            "items": [
+                {"id": i, "name": f"Item {i}", "value": i * 1.5}
+                for i in range(1, items + 1)
+            ],
+            "page": 1,
+            "total_pages": 1,
+            "next_page": None,
+        }
+    )
+
+
+def _construct(body: bytes) -> ItemPage:
+    data = loads(body)
+    data["items"] = [Item.model_construct(**item) for item in data["items"]]
+    return ItemPage.model_construct(**data)
+
+
+CASES: Dict[str, Callable[[bytes], Any]] = {
+    "validate_json": lambda body: decode(ItemPage, body),
+    "loads + validate": lambda body: ItemPage.model_validate(loads(body)),
+    "model_construct": _construct,
+}
+
+
+def run(items: int, repeat: int) -> List[Dict[str, object]]:
+    body = _page_body(items)
+    number = max(1, 20_000 // items)
+    rows = []
+    for name, fn in CASES.items():
+        best = min(timeit.repeat(partial(fn, body), number=number, repeat=repeat))
+        rows.append(
+            {
+                "case": name,
+                "items": items,
+                "ms_per_page": round(best / number * 1000, 3),
+            }
+        )
+    return rows
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.decoding")
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="also write the rows as JSON here")
+    args = parser.parse_args(argv)
+
+    rows = run(args.items, args.repeat)
+    print(f"{'case':<20}{'ms/page':>10}")
+    for row in rows:
+        print(f"{row['case']:<20}{row['ms_per_page']:>10}")
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(rows, fh, indent=2)
+        print(f"\nwrote {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+import contextlib
+import gc
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
+
+from httpx._transports.asgi import ASGITransport
+
+from connector import metrics
+from connector.client import APIClient
+from simapi import config as sim_config
+from simapi import main as sim
+
+"""
+Measurement helpers shared by the scenarios.
+
+Everything runs in-process: the connector talks to the FastAPI sim through
+ASGITransport (as tests/conftest.py does), so CPU figures include the sim's
+own work and numbers are only comparable between runs on the same machine.
+"""
+
+BASE_URL = "http://bench"
+
+
+@contextlib.contextmanager
+def sim_dataset(size: int, page_size: int, **faults: Any) -> Iterator[None]:
+    """
+    Temporarily serve ``size`` generated items, ``page_size`` per page, with
+    optional fault injection (any simapi.config.SimConfig field).
+    """
+    saved = sim_config.state.config
+    sim_config.configure(items=size, page_size=page_size, **faults)
+    try:
+        yield
+    finally:
+        sim_config.state.apply(saved)
+
+
+def make_client(concurrency: int, *, adaptive: bool = False) -> APIClient:
+    client = APIClient(
+        base_url=BASE_URL,
+        transport=ASGITransport(app=sim.app),
+        concurrency_limit=concurrency,
+    )
+    if not adaptive:
+        client._limiter = None  # fixed fan-out so runs are comparable
+    return client
+
+
+class LatencyRecorder(metrics.MetricsHook):
+    def __init__(self) -> None:
+        self.request: List[float] = []
+        self.token: List[float] = []
+
+    def on_request(self, method, endpoint, status, latency) -> None:
+        self.request.append(latency)
+
+    def on_token_refresh(self, latency, ok) -> None:
+        self.token.append(latency)
+
+
+def percentile(sorted_values: List[float], q: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(q * len(sorted_values)))
+    return sorted_values[index]
+
+
+async def measure(
+    run: Callable[[], Awaitable[int]],
+    *,
+    latency: str = "request",
+    trace_memory: bool = False,
+) -> Dict[str, Any]:
+    """
+    Time one ``run()`` (which returns the number of items it processed).
+
+    tracemalloc slows allocation-heavy code a lot, so peak memory is taken
+    from a separate pass (``trace_memory=True``) rather than the timed one.
+    """
+    recorder = LatencyRecorder()
+    metrics.add_hook(recorder)
+    gc.collect()
+    if trace_memory:
+        tracemalloc.start()
+    cpu, wall = time.process_time(), time.perf_counter()
+    try:
+        items = await run()
+    finally:
+        wall = time.perf_counter() - wall
+        cpu = time.process_time() - cpu
+        peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+        if trace_memory:
+            tracemalloc.stop()
+        metrics.remove_hook(recorder)
+
+    lat = sorted(getattr(recorder, latency))
+    ms = {
+        f"p{int(q * 100)}": None if v is None else round(v * 1000, 3)
+        for q in (0.5, 0.95, 0.99)
+        for v in (percentile(lat, q),)
+    }
+    return {
+        "items": items,
+        "requests": len(recorder.request) + len(recorder.token),
+        "wall_s": round(wall, 6),
+        "items_per_sec": round(items / wall, 1) if wall else None,
+        "cpu_us_per_item": round(cpu / items * 1e6, 2) if items else None,
+        "latency_ms": ms,
+        "peak_mem_kb": None if peak is None else round(peak / 1024, 1),
+    }
@@ -0,0 +1,259 @@
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from connector.logger import logger
+
+from .harness import make_client, measure, sim_dataset
+from .scenarios import SCENARIOS
+
+"""
+python -m benchmarks.run [--sizes 1000,10000] [--concurrency 1,10,50]
+                         [--sim latency=exponential --sim latency_ms=5]
+                         [--output bench_results.json]
+                         [--compare baseline.json [--fail-on-regression]]
+
+Results are a JSON document {"meta": {...}, "results": [row, ...]} where each
+row is keyed by (scenario, size, concurrency) so two files can be diffed
+with --compare.
+"""
+
+FORMAT_VERSION = 1
+
+# (metric, True when higher is better)
+COMPARED: Tuple[Tuple[str, bool], ...] = (
+    ("items_per_sec", True),
+    ("cpu_us_per_item", False),
+    ("p95_ms", False),
+)
+
+
+async def run_case(
+    name: str,
+    size: int,
+    concurrency: int,
+    page_size: int,
+    repeat: int,
+    sim: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    scenario = SCENARIOS[name]
+    with sim_dataset(size, page_size, **(sim or {})):
+        client = make_client(concurrency)
+        try:
+            await client._oauth.get_token()  # warm-up: not part of the timing
+            if scenario.setup is not None:
+                await scenario.setup(client, size)
+
+            async def _run() -> int:
+                return await scenario.run(client, size, concurrency)
+
+            runs = [
+                await measure(_run, latency=scenario.latency) for _ in range(repeat)
+            ]
+            memory = await measure(_run, latency=scenario.latency, trace_memory=True)
+        finally:
+            await client.close()
+    # the median run by wall time is the one reported
+    runs.sort(key=lambda r: r["wall_s"])
+    row = runs[len(runs) // 2]
+    row.update(
+        scenario=name,
+        size=size if scenario.sized else 0,
+        concurrency=concurrency,
+        page_size=page_size,
+        repeat=repeat,
+        items_per_sec_stdev=round(
+            statistics.pstdev(r["items_per_sec"] or 0 for r in runs), 1
+        ),
+        peak_mem_kb=memory["peak_mem_kb"],
+    )
+    return row
+
+
+async def run_suite(
+    *,
+    sizes: Sequence[int],
+    concurrency: Sequence[int],
+    scenarios: Iterable[str] = SCENARIOS,
+    page_size: int = 100,
+    repeat: int = 3,
+    sim: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """``sim``: extra SimConfig fields (latency, faults) for every case."""
+    results: List[Dict[str, Any]] = []
+    for name in scenarios:
+        case_sizes = sizes if SCENARIOS[name].sized else sizes[:1]
+        for size in case_sizes:
+            for limit in concurrency:
+                results.append(
+                    await run_case(name, size, limit, page_size, repeat, sim)
+                )
+    return {"meta": _meta(page_size, repeat, sim), "results": results}
+
+
+def _meta(
+    page_size: int, repeat: int, sim: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "format": FORMAT_VERSION,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "page_size": page_size,
+        "repeat": repeat,
+        "sim": sim or {},
+    }
+
+
+def _key(row: Dict[str, Any]) -> Tuple[str, int, int]:
+    return row["scenario"], row["size"], row["concurrency"]
+
+
+def _metric(row: Dict[str, Any], metric: str) -> Optional[float]:
+    if metric == "p95_ms":
+        return row["latency_ms"]["p95"]
+    return row.get(metric)
+
+
+def compare(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 0.1
+) -> List[Dict[str, Any]]:
+    """
+    Relative change of every compared metric for cases present in both runs.
+    ``regression`` is set when a metric got worse by more than ``threshold``.
+    """
+    before = {_key(r): r for r in baseline["results"]}
+    rows = []
+    for row in current["results"]:
+        old = before.get(_key(row))
+        if old is None:
+            continue
+        for metric, higher_is_better in COMPARED:
+            a, b = _metric(old, metric), _metric(row, metric)
+            if not a or b is None:
+                continue
+            change = (b - a) / a
+            worse = -change if higher_is_better else change
+            rows.append(
+                {
+                    "case": "/".join(map(str, _key(row))),
+                    "metric": metric,
+                    "baseline": a,
+                    "current": b,
+                    "change": round(change, 4),
+                    "regression": worse > threshold,
+                }
+            )
+    return rows
+
+
+def _print_results(results: List[Dict[str, Any]]) -> None:
+    print(
+        f"{'scenario':<26}{'size':>8}{'conc':>6}{'items/s':>12}"
+        f"{'p50 ms':>9}{'p95 ms':>9}{'cpu us/it':>11}{'peak KiB':>10}"
+    )
+    for r in results:
+        lat = r["latency_ms"]
+        print(
+            f"{r['scenario']:<26}{r['size']:>8}{r['concurrency']:>6}"
+            f"{r['items_per_sec'] or 0:>12.1f}{lat['p50'] or 0:>9.2f}"
+            f"{lat['p95'] or 0:>9.2f}{r['cpu_us_per_item'] or 0:>11.1f}"
+            f"{r['peak_mem_kb'] or 0:>10.0f}"
+        )
+
+
+def _print_comparison(rows: List[Dict[str, Any]]) -> None:
+    for r in rows:
+        flag = "  REGRESSION" if r["regression"] else ""
+        print(
+            f"{r['case']:<40}{r['metric']:<16}{r['baseline']:>12}"
+            f" -> {r['current']:<12}{r['change']:+.1%}{flag}"
+        )
+
+
+def _ints(value: str) -> List[int]:
+    return [int(v) for v in value.split(",") if v]
+
+
+def _sim_option(value: str) -> Tuple[str, Any]:
+    key, _, raw = value.partition("=")
+    try:
+        return key, json.loads(raw)
+    except ValueError:
+        return key, raw  # plain strings, e.g. latency=lognormal
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run")
+    parser.add_argument("--sizes", type=_ints, default=[1000, 10000])
+    parser.add_argument("--concurrency", type=_ints, default=[1, 10, 50])
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--scenarios",
+        type=lambda v: v.split(","),
+        default=list(SCENARIOS),
+        help=",".join(SCENARIOS),
+    )
+    parser.add_argument(
+        "--sim",
+        type=_sim_option,
+        action="append",
+        default=[],
+        metavar="FIELD=VALUE",
+        help="sim fault/latency setting, e.g. latency=exponential latency_ms=5",
+    )
+    parser.add_argument("--output", type=Path, default=Path("bench_results.json"))
+    parser.add_argument("--compare", type=Path, help="baseline results JSON")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args(argv)
+
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(sorted(unknown))}")
+
+    logger.setLevel(logging.ERROR)  # refresh / rate-spike logs would dominate
+    report = asyncio.run(
+        run_suite(
+            sizes=args.sizes,
+            concurrency=args.concurrency,
+            scenarios=args.scenarios,
+            page_size=args.page_size,
+            repeat=args.repeat,
+            sim=dict(args.sim),
+        )
+    )
+    args.output.write_text(json.dumps(report, indent=2))
+    _print_results(report["results"])
+    print(f"\nwrote {args.output}")
+
+    if args.compare:
+        rows = compare(json.loads(args.compare.read_text()), report, args.threshold)
+        print(f"\ncompared with {args.compare} (threshold {args.threshold:.0%}):")
+        _print_comparison(rows)
+        if args.fail_on_regression and any(r["regression"] for r in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
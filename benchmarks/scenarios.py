@@ -0,0 +1,95 @@
+import asyncio
+import weakref
+from typing import Awaitable, Callable, Dict, NamedTuple, Optional
+
+from connector.client import APIClient
+from connector.sync import IncrementalSync, ItemStore
+from connector.utils import gather_limited
+from simapi.config import state as sim_state
+
+"""
+Benchmark scenarios. Each one drives a warmed-up client and returns the
+number of items (or calls) it processed, which measure() turns into a rate.
+"""
+
+TOKEN_ROUNDS = 50
+CHANGED_FRACTION = 0.01  # items mutated before each incremental sync
+
+
+class Scenario(NamedTuple):
+    run: Callable[[APIClient, int, int], Awaitable[int]]
+    sized: bool  # False: dataset size does not matter, run once per limit
+    latency: str  # which latencies to report: "request" or "token"
+    # untimed preparation, run once per (scenario, size, concurrency)
+    setup: Optional[Callable[[APIClient, int], Awaitable[None]]] = None
+
+
+async def list_all_concurrent(client: APIClient, size: int, concurrency: int) -> int:
+    return len(await client.list_all_items(concurrent=True))
+
+
+async def list_all_sequential(client: APIClient, size: int, concurrency: int) -> int:
+    return len(await client.list_all_items(concurrent=False))
+
+
+async def get_project_fanout(client: APIClient, size: int, concurrency: int) -> int:
+    ids = range(1, size + 1)
+    projects = await gather_limited(
+        (client.get_project(i) for i in ids), concurrency
+    )
+    return len(projects)
+
+
+async def token_refresh_contention(
+    client: APIClient, size: int, concurrency: int
+) -> int:
+    """``concurrency`` callers hit an expired token at once, TOKEN_ROUNDS times."""
+    oauth = client._oauth
+    for _ in range(TOKEN_ROUNDS):
+        oauth._token = None
+        await asyncio.gather(*(oauth.get_token() for _ in range(concurrency)))
+    return TOKEN_ROUNDS * concurrency
+
+
+_STORES: "weakref.WeakKeyDictionary[APIClient, ItemStore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _syncer(client: APIClient, since: bool) -> IncrementalSync:
+    return IncrementalSync(client, _STORES[client], since_param="since" if since else None)
+
+
+def _mutate(size: int) -> None:
+    # the newest items, as edits tend to cluster: only their pages change
+    count = max(1, int(size * CHANGED_FRACTION))
+    sim_state.mutate(range(size - count + 1, size + 1))
+
+
+async def _fill_store(client: APIClient, size: int) -> None:
+    _STORES[client] = ItemStore()
+    await _syncer(client, since=True).run(full=True)
+
+
+async def incremental_pages(client: APIClient, size: int, concurrency: int) -> int:
+    """Conditional page pass (ETag / body hash) after 1 % of items changed."""
+    _mutate(size)
+    await _syncer(client, since=False).run()
+    return size
+
+
+async def incremental_delta(client: APIClient, size: int, concurrency: int) -> int:
+    """Change-feed sync after 1 % of items changed."""
+    _mutate(size)
+    await _syncer(client, since=True).run()
+    return size
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "list_all_concurrent": Scenario(list_all_concurrent, True, "request"),
+    "list_all_sequential": Scenario(list_all_sequential, True, "request"),
+    "get_project_fanout": Scenario(get_project_fanout, True, "request"),
+    "token_refresh_contention": Scenario(token_refresh_contention, False, "token"),
+    "incremental_pages": Scenario(incremental_pages, True, "request", _fill_store),
+    "incremental_delta": Scenario(incremental_delta, True, "request", _fill_store),
+}
@@ -0,0 +1,93 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List, Optional, Sequence
+
+"""
+python -m benchmarks.startup [--repeat 15] [--output startup.json]
+
+Cold-start cost of the connector package, each case in a fresh interpreter
+(so nothing is already in sys.modules). ``eager`` is what every job paid
+before imports were made lazy: the whole client stack plus Settings.
+"""
+
+CASES: Dict[str, str] = {
+    "import connector": "import connector",
+    "registry, cold index": (
+        "from connector import registry; registry.available_connectors()"
+    ),
+    "registry, warm index": (
+        "from connector import registry; registry.available_connectors()"
+    ),
+    "get_connector('sim')": (
+        "from connector.registry import get_connector; get_connector('sim')"
+    ),
+    "eager (client + settings)": (
+        "import connector.client, connector.config; connector.config.get_settings()"
+    ),
+}
+
+_PROBE = """
+import time
+t = time.perf_counter()
+{code}
+print((time.perf_counter() - t) * 1000)
+"""
+
+
+def _once(code: str, env: Dict[str, str]) -> float:
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(code=code)],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    return float(out.stdout.splitlines()[-1])
+
+
+def run(repeat: int) -> List[Dict[str, object]]:
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        index = os.path.join(tmp, "plugins.json")
+        env = {**os.environ, "CONNECTOR_PLUGIN_INDEX": index}
+        for name, code in CASES.items():
+            samples = []
+            for _ in range(repeat):
+                if name.endswith("cold index") and os.path.exists(index):
+                    os.remove(index)
+                samples.append(_once(code, env))
+            rows.append(
+                {
+                    "case": name,
+                    "median_ms": round(statistics.median(samples), 2),
+                    "min_ms": round(min(samples), 2),
+                    "repeat": repeat,
+                }
+            )
+    return rows
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.startup")
+    parser.add_argument("--repeat", type=int, default=15)
+    parser.add_argument("--output", help="also write the rows as JSON here")
+    args = parser.parse_args(argv)
+
+    rows = run(args.repeat)
+    print(f"{'case':<28}{'median ms':>12}{'min ms':>10}")
+    for row in rows:
+        print(f"{row['case']:<28}{row['median_ms']:>12}{row['min_ms']:>10}")
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(rows, fh, indent=2)
+        print(f"\nwrote {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+"""Async third‑party API connector – export public interface.
+
+Attributes are imported on first access, so ``import connector`` (or any
+light submodule such as connector.registry) does not pull in httpx,
+pydantic or the settings machinery.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .client import APIClient, default_client
+    from .exceptions import (
+        APIClientError,
+        AuthenticationError,
+        NotFoundError,
+        RateLimitError,
+        ServerError,
+    )
+    from .models import Item, ItemPage, TokenResponse
+    from .registry import get_connector
+
+# public name → submodule defining it
+_EXPORTS: Dict[str, str] = {
+    "APIClient": "client",
+    "default_client": "client",
+    "Item": "models",
+    "ItemPage": "models",
+    "TokenResponse": "models",
+    "APIClientError": "exceptions",
+    "AuthenticationError": "exceptions",
+    "NotFoundError": "exceptions",
+    "RateLimitError": "exceptions",
+    "ServerError": "exceptions",
+    "get_connector": "registry",
+}
+
+__all__ = [
+    "APIClient",
+    "default_client",
+    "Item",
+    "ItemPage",
+    "TokenResponse",
+    "APIClientError",
+    "AuthenticationError",
+    "NotFoundError",
+    "RateLimitError",
+    "ServerError",
+    "get_connector",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
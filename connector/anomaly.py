@@ -1,31 +1,179 @@
 import time
-from collections import deque
-from typing import Deque
+from typing import Any, Callable, Dict, List, Optional
 
-from .config import get_settings
 from .logger import logger
 
-_settings = get_settings()
+"""
+Request-rate / auth-failure anomaly detection.
+
+Counts live in fixed per-second ring buckets (O(1) per event, constant
+memory no matter the load). Alerts of the same kind are rate limited: at
+most one log line per ``alert_interval``, with the number suppressed in
+between reported on the next one.
+"""
+
+
+class BucketCounter:
+    """Events in the last ``window`` seconds, one ring slot per second."""
+
+    def __init__(self, window: int = 60, clock: Callable[[], float] = time.monotonic):
+        self.window = window
+        self._clock = clock
+        self._counts: List[int] = [0] * window
+        self._head = int(clock())  # newest second accounted for
+        self._total = 0
+
+    def _advance(self, now: int) -> None:
+        # zero the slots of seconds that fell out of the window (≤ window steps)
+        gap = now - self._head
+        if gap <= 0:
+            return
+        if gap >= self.window:
+            self._counts = [0] * self.window
+            self._total = 0
+        else:
+            for sec in range(self._head + 1, now + 1):
+                slot = sec % self.window
+                self._total -= self._counts[slot]
+                self._counts[slot] = 0
+        self._head = now
+
+    def add(self, n: int = 1) -> int:
+        """Count ``n`` events now; returns the total over the window."""
+        now = int(self._clock())
+        self._advance(now)
+        self._counts[now % self.window] += n
+        self._total += n
+        return self._total
+
+    @property
+    def total(self) -> int:
+        self._advance(int(self._clock()))
+        return self._total
+
+
+def status_class(status: Optional[int]) -> str:
+    return "error" if status is None else f"{status // 100}xx"
 
 
 class AnomalyDetector:
-    def __init__(self, threshold: int = _settings.rate_threshold_per_minute):
-        self.threshold = threshold
-        self._timestamps: Deque[float] = deque(maxlen=1000)
-
-    def record_request(self):
-        now = time.time()
-        self._timestamps.append(now)
-        # prune >60s old
-        while self._timestamps and self._timestamps[0] < now - 60:
-            self._timestamps.popleft()
-        if len(self._timestamps) > self.threshold:
-            logger.warning(
-                "High request rate detected: %s requests in last 60s",
-                len(self._timestamps),
+    def __init__(
+        self,
+        threshold: int = 100,
+        *,
+        auth_failure_threshold: int = 5,
+        server_error_threshold: int = 50,
+        alert_interval: float = 60.0,
+        window: int = 60,
+        name: str = "",
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.threshold = threshold  # requests per window
+        self.auth_failure_threshold = auth_failure_threshold
+        self.server_error_threshold = server_error_threshold
+        self.alert_interval = alert_interval
+        self.window = window
+        self.name = name
+        self._clock = clock
+        self._requests = BucketCounter(window, clock)
+        self._auth_failures = BucketCounter(window, clock)
+        self._endpoints: Dict[str, BucketCounter] = {}
+        self._statuses: Dict[str, BucketCounter] = {}
+        self._last_alert: Dict[str, float] = {}
+        self._suppressed: Dict[str, int] = {}
+        self.alerts = 0
+
+    def _counter(self, table: Dict[str, BucketCounter], key: str) -> BucketCounter:
+        counter = table.get(key)
+        if counter is None:
+            counter = table[key] = BucketCounter(self.window, self._clock)
+        return counter
+
+    # ------------- recording -------------
+    def record_request(self, endpoint: Optional[str] = None) -> None:
+        total = self._requests.add()
+        if endpoint is not None:
+            self._counter(self._endpoints, endpoint).add()
+        if total > self.threshold:
+            self._alert(
+                "rate",
+                "High request rate detected: %s requests in last %ss",
+                total,
+                self.window,
+            )
+
+    def record_status(
+        self, status: Optional[int], endpoint: Optional[str] = None
+    ) -> None:
+        """Count one response (``None`` = network error) by status class."""
+        cls = status_class(status)
+        count = self._counter(self._statuses, cls).add()
+        if cls in ("5xx", "error") and count >= self.server_error_threshold:
+            self._alert(
+                f"server:{cls}",
+                "%s %s responses in last %ss (latest on %s)",
+                count,
+                cls,
+                self.window,
+                endpoint or "?",
+            )
+
+    def record_401(self) -> None:
+        count = self._auth_failures.add()
+        if count >= self.auth_failure_threshold:
+            self._alert(
+                "auth",
+                "Repeated 401 Unauthorized responses (%s in last %ss) – "
+                "possible credential misuse.",
+                count,
+                self.window,
+                level="error",
             )
 
-    def record_401(self):
-        logger.error(
-            "Repeated 401 Unauthorized responses – possible credential misuse."
+    # ------------- alerting -------------
+    def _alert(self, kind: str, msg: str, *args: Any, level: str = "warning") -> None:
+        now = self._clock()
+        last = self._last_alert.get(kind)
+        if last is not None and now - last < self.alert_interval:
+            self._suppressed[kind] = self._suppressed.get(kind, 0) + 1
+            return
+        self._last_alert[kind] = now
+        self.alerts += 1
+        suppressed = self._suppressed.pop(kind, 0)
+        if self.name:
+            msg = f"[{self.name}] {msg}"
+        if suppressed:
+            msg += " (%s similar alerts suppressed)"
+            args += (suppressed,)
+        getattr(logger, level)(msg, *args)
+
+    # ------------- monitoring -------------
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "requests": self._requests.total,
+            "auth_failures": self._auth_failures.total,
+            "endpoints": {k: c.total for k, c in self._endpoints.items()},
+            "statuses": {k: c.total for k, c in self._statuses.items()},
+            "alerts": self.alerts,
+            "suppressed": sum(self._suppressed.values()),
+        }
+
+
+_DETECTORS: Dict[str, AnomalyDetector] = {}
+
+
+def get_detector(provider: str, **kw: Any) -> AnomalyDetector:
+    """
+    One detector per provider, shared by every client instance. The first
+    call's settings win; later calls asking for different ones get a warning.
+    """
+    detector = _DETECTORS.get(provider)
+    if detector is None:
+        detector = _DETECTORS[provider] = AnomalyDetector(name=provider, **kw)
+        return detector
+    ignored = {k: v for k, v in kw.items() if getattr(detector, k, v) != v}
+    if ignored:
+        logger.warning(
+            "Anomaly detector for %s already exists; ignoring %s", provider, ignored
         )
+    return detector
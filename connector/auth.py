@@ -1,49 +1,311 @@
 import asyncio
+import contextlib
+import json
+import os
 import time
-from typing import Optional
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
 import httpx
 
 from connector.config import Settings
 
+from . import metrics
 from .exceptions import AuthenticationError
 from .logger import logger
 from .models import TokenResponse
+from .ratelimit import RateLimiter
+
+try:  # cross-process locking of the token cache (POSIX only)
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore
 
 _TOKEN_ENDPOINT = "/oauth2/token"
+_REFRESH_MARGIN = 60  # seconds a token is treated as expired before it really is
+_MIN_BACKGROUND_DELAY = 1.0
+_BACKGROUND_RETRY_DELAY = 5.0
+
+
+class TokenCache:
+    """
+    Tokens shared between processes through a small JSON file, so restarts
+    and sibling workers reuse a valid token instead of stampeding the token
+    endpoint. Refreshes are serialized with an exclusive lock on a side file
+    (flock; without fcntl the cache still works, just unlocked).
+    """
+
+    def __init__(self, path: "str | os.PathLike[str]"):
+        self.path = Path(path)
+        self._lock_path = self.path.with_name(self.path.name + ".lock")
+
+    def _read(self) -> Dict[str, Any]:
+        try:
+            return json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            logger.warning("Ignoring corrupt token cache %s", self.path)
+            return {}
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        """(token, expires_at) if a still-valid token is cached for ``key``."""
+        entry = self._read().get(key)
+        if entry and entry[1] > time.time():
+            return entry[0], entry[1]
+        return None
+
+    def put(self, key: str, token: str, expires_at: float) -> None:
+        now = time.time()
+        data = {k: v for k, v in self._read().items() if v[1] > now}
+        data[key] = [token, expires_at]
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        # tokens are credentials: owner read/write only
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as fh:
+            json.dump(data, fh)
+        os.replace(tmp, self.path)
+
+    @contextlib.contextmanager
+    def locked(self) -> Iterator[None]:
+        """Blocking exclusive lock – call from a worker thread."""
+        with open(self._lock_path, "a") as fh:
+            if fcntl is not None:
+                fcntl.flock(fh, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(fh, fcntl.LOCK_UN)
 
 
 class OAuth2Manager:
-    def __init__(self, client: httpx.AsyncClient, settings: Settings):
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        settings: Settings,
+        *,
+        background_refresh: Optional[bool] = None,
+        credential: int = 1,
+        token_cache: Optional[TokenCache] = None,
+    ):
         self._client = client
         self._settings = settings
+        self.credential = credential  # 1 = the plain <provider>_client_id pair
+        self._cache = token_cache
         self._token: Optional[str] = None
         self._expires_at: float = 0.0
-        self._lock = asyncio.Lock()
+        self._refresh_task: Optional["asyncio.Future[None]"] = None
+        self._background_enabled = (
+            settings.token_background_refresh
+            if background_refresh is None
+            else background_refresh
+        )
+        self._background: Optional["asyncio.Task[None]"] = None
+
+    def _is_valid(self) -> bool:
+        return bool(self._token) and not (
+            self._expires_at and time.time() >= self._expires_at
+        )
 
     async def get_token(self) -> str:
-        async with self._lock:
-            if not self._token or (
-                self._expires_at and time.time() >= self._expires_at
-            ):
-                await self._refresh()
+        # fast path: a valid cached token needs no lock and no await
+        if self._is_valid():
+            if self._background_enabled and self._background is None:
+                self.start_background_refresh()
+            return self._token  # type: ignore
+        return await self.refresh()
+
+    async def refresh(self, stale_token: Optional[str] = None) -> str:
+        """
+        Single-flight refresh: concurrent callers share one token POST.
+
+        Pass the token a request was rejected with as ``stale_token``; if
+        another caller already replaced it, the new token is returned
+        without hitting the token endpoint again.
+        """
+        if stale_token is not None and self._token != stale_token and self._is_valid():
             return self._token  # type: ignore
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.ensure_future(self._refresh())
+        # shield: a cancelled waiter must not abort the shared POST
+        await asyncio.shield(self._refresh_task)
+        return self._token  # type: ignore
 
-    async def _refresh(self):
+    async def _refresh(self) -> None:
+        if self._cache is None:
+            return await self._fetch_token()
+        key = f"{self._settings.provider}|{self._client.base_url}|{self.credential}"
+        lock = self._cache.locked()
+        await asyncio.to_thread(lock.__enter__)
+        try:
+            cached = await asyncio.to_thread(self._cache.get, key)
+            if cached is not None and cached[0] != self._token:
+                # another process (or our previous life) already refreshed
+                self._token, self._expires_at = cached
+                logger.info("Using cached token for credential %s", self.credential)
+                return
+            await self._fetch_token()
+            await asyncio.to_thread(
+                self._cache.put, key, self._token, self._expires_at
+            )
+        finally:
+            await asyncio.to_thread(lock.__exit__, None, None, None)
+
+    async def _fetch_token(self) -> None:
         logger.info("Refreshing OAuth2 token …")
+        n = self.credential
         data = {
             "grant_type": "client_credentials",
-            "client_id": await self._settings.client_id_async(),
-            "client_secret": await self._settings.client_secret_async(),
+            "client_id": await self._settings.client_id_async(n),
+            "client_secret": await self._settings.client_secret_async(n),
         }
         # Never log secrets
         logger.debug("Token request: POST %s", _TOKEN_ENDPOINT)
-        resp = await self._client.post(_TOKEN_ENDPOINT, data=data)
-        if resp.status_code != 200:
+        started = time.perf_counter()
+        try:
+            resp = await self._client.post(_TOKEN_ENDPOINT, data=data)
+        except httpx.HTTPError:
+            if self._settings.metrics_enabled:
+                metrics.record_token_refresh(time.perf_counter() - started, False)
+            raise
+        ok = resp.status_code == 200
+        if self._settings.metrics_enabled:
+            metrics.record_token_refresh(time.perf_counter() - started, ok)
+        if not ok:
+            if resp.status_code in (400, 401):
+                # credentials may have been rotated – re-read them next time
+                self._settings.invalidate_secrets()
             raise AuthenticationError(
                 f"Token endpoint failed ({resp.status_code}) – {resp.text}"
             )
         tr = TokenResponse.parse_obj(resp.json())
         self._token = tr.access_token
-        self._expires_at = time.time() + tr.expires_in - 60  # refresh 60s early
+        # refresh early, but never so early that short-lived tokens look expired
+        margin = min(_REFRESH_MARGIN, tr.expires_in / 2)
+        self._expires_at = time.time() + tr.expires_in - margin
         logger.info("Obtained new token (valid %ss)", tr.expires_in)
+
+    # ------------- proactive refresh -------------
+    def start_background_refresh(self) -> None:
+        """Refresh ahead of expiry so requests never wait on the token endpoint."""
+        if self._background is None or self._background.done():
+            self._background = asyncio.ensure_future(self._background_loop())
+
+    async def _background_loop(self) -> None:
+        lead = self._settings.token_refresh_lead
+        while True:
+            delay = self._expires_at - time.time() - lead
+            await asyncio.sleep(max(_MIN_BACKGROUND_DELAY, delay))
+            try:
+                await self.refresh()
+            except Exception as exc:  # keep the loop alive; requests still refresh
+                logger.warning("Background token refresh failed: %s", exc)
+                await asyncio.sleep(_BACKGROUND_RETRY_DELAY)
+
+    async def aclose(self) -> None:
+        if self._background is not None:
+            self._background.cancel()
+            await asyncio.gather(self._background, return_exceptions=True)
+            self._background = None
+
+
+class TokenPool:
+    """
+    Several credentials for one provider, each with its own OAuth2Manager
+    (and so its own token and quota). pick() routes a request to the
+    credential with the fewest requests in flight (or round robin), skipping
+    credentials that were recently throttled with a 429 or whose
+    X-RateLimit-Remaining hit 0. Each credential paces itself from its own
+    quota headers through a private RateLimiter.
+    """
+
+    def __init__(
+        self,
+        managers: Sequence[OAuth2Manager],
+        routing: str = "least_loaded",
+        burst: int = 10,
+    ):
+        if not managers:
+            raise ValueError("TokenPool needs at least one credential")
+        if routing not in ("least_loaded", "round_robin"):
+            raise ValueError(f"Unknown credential routing {routing!r}")
+        self.managers: List[OAuth2Manager] = list(managers)
+        self.routing = routing
+        n = len(self.managers)
+        self._in_flight = [0] * n
+        self._requests = [0] * n
+        self._throttled_until = [0.0] * n
+        self._throttles = [0] * n
+        self._limiters = [RateLimiter(None, burst) for _ in range(n)]
+        self._next = 0
+
+    def _ready(self) -> List[int]:
+        now = time.monotonic()
+        return [i for i, t in enumerate(self._throttled_until) if t <= now]
+
+    def available(self) -> bool:
+        """True while at least one credential is not throttled."""
+        return bool(self._ready())
+
+    def pick(self) -> OAuth2Manager:
+        ready = self._ready()
+        if not ready:  # all throttled: the one that recovers first
+            ready = [min(range(len(self.managers)), key=self._throttled_until.__getitem__)]
+        if self.routing == "round_robin":
+            n = len(self.managers)
+            index = min(ready, key=lambda i: (i - self._next) % n)
+            self._next = index + 1
+        else:
+            # routed-so-far breaks ties, so a burst picked before any request
+            # is on the wire still spreads evenly
+            index = min(ready, key=lambda i: (self._in_flight[i], self._requests[i]))
+        self._requests[index] += 1
+        return self.managers[index]
+
+    def begin(self, manager: OAuth2Manager) -> None:
+        self._in_flight[manager.credential - 1] += 1
+
+    def end(self, manager: OAuth2Manager) -> None:
+        self._in_flight[manager.credential - 1] -= 1
+
+    def limiter(self, manager: OAuth2Manager) -> RateLimiter:
+        """The quota limiter of ``manager``'s client ID."""
+        return self._limiters[manager.credential - 1]
+
+    def observe(self, manager: OAuth2Manager, headers: Any) -> Optional[float]:
+        """
+        Feed a response's rate-limit headers to ``manager``'s own limiter;
+        returns the Retry-After delay, if any. An exhausted quota
+        (Remaining: 0) takes the credential out of rotation until the reset.
+        """
+        limiter = self.limiter(manager)
+        retry_after = limiter.observe(headers)
+        if limiter.paused_for > 0:
+            self.throttle(manager, limiter.paused_for)
+        return retry_after
+
+    def throttle(self, manager: OAuth2Manager, seconds: float) -> None:
+        """Keep ``manager`` out of rotation for ``seconds`` (429 / no quota)."""
+        i = manager.credential - 1
+        self._throttled_until[i] = max(
+            self._throttled_until[i], time.monotonic() + seconds
+        )
+        self._limiters[i].pause(seconds)
+        self._throttles[i] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        return {
+            m.credential: {
+                "in_flight": self._in_flight[i],
+                "requests": self._requests[i],
+                "throttles": self._throttles[i],
+                "throttled_for": max(0.0, self._throttled_until[i] - now),
+            }
+            for i, m in enumerate(self.managers)
+        }
+
+    async def aclose(self) -> None:
+        for manager in self.managers:
+            await manager.aclose()
@@ -1,9 +1,18 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Iterable
+from typing import Any, AsyncIterator, Dict, Iterable, Optional
 
 from connector.client import APIClient
+from connector.decoding import json_response, response_decoder
+from connector.export import ExportResult, PathLike, export_pages
+from connector.utils import iter_prefetched
+
+
+def _field(page: Any, key: str, default: Any = None) -> Any:
+    if isinstance(page, dict):
+        return page.get(key, default)
+    return getattr(page, key, default)
 
 
 class BaseConnector(APIClient, ABC):
@@ -14,14 +23,22 @@ class BaseConnector(APIClient, ABC):
 
     #: map logical names → (method, path_template)
     ENDPOINTS: Dict[str, tuple[str, str]] = {}
+    #: per-id endpoint → bulk endpoint taking repeated ?ids= (optional)
+    BATCH_ENDPOINTS: Dict[str, str] = {}
 
     # helpers for subclasses
     async def _call(
-        self, name: str, *, path_params: Dict[str, Any] | None = None, **request_kw
+        self,
+        name: str,
+        *,
+        path_params: Dict[str, Any] | None = None,
+        model: Any = None,
+        **request_kw,
     ) -> Any:
         """
         Generic request helper – resolves method & path from ENDPOINTS,
         expands {vars} in the path, then delegates to self._request().
+        With ``model`` the body is decoded straight from bytes into it.
         """
         if name not in self.ENDPOINTS:
             raise ValueError(f"Unknown endpoint {name!r} for {type(self).__name__}")
@@ -29,10 +46,110 @@ class BaseConnector(APIClient, ABC):
         method, path_tmpl = self.ENDPOINTS[name]
         path_params = path_params or {}
         path = path_tmpl.format(**path_params)
-        resp = await self._request(method, path, **request_kw)
-        return resp.json()
+        decode = json_response if model is None else response_decoder(model)
+        if method == "GET":
+            return await self._get_decoded(path, decode, **request_kw)
+        return decode(await self._request(method, path, **request_kw))
+
+    async def _get_one(
+        self, name: str, key: Any, *, id_param: str = "id", model: Any = None
+    ) -> Any:
+        """Per-id lookup, micro-batched when BATCH_LOOKUPS is on."""
+        fetch = self._one_fetcher(name, id_param, model)
+        return await self._load(name, key, fetch, self._batch_decoder(model))
+
+    async def _get_many(
+        self, name: str, keys: Iterable[Any], *, id_param: str = "id", model: Any = None
+    ) -> list:
+        """Bulk per-id lookup – uses BATCH_ENDPOINTS[name] when declared."""
+        fetch = self._one_fetcher(name, id_param, model)
+        return await self._load_many(name, keys, fetch, self._batch_decoder(model))
+
+    def _one_fetcher(self, name: str, id_param: str, model: Any):
+        async def _fetch(key: Any) -> Any:
+            return await self._call(name, path_params={id_param: key}, model=model)
+
+        return _fetch
+
+    def _batch_decoder(self, model: Any):
+        return self._record_decoder(model) if model is not None else (lambda r: r)
+
+    async def _iter_pages(
+        self,
+        name: str,
+        *,
+        items_key: str = "items",
+        page_param: str = "page",
+        prefetch: Optional[int] = None,
+        model: Any = None,
+        **request_kw,
+    ) -> AsyncIterator[Any]:
+        """
+        Stream the records of a page-numbered endpoint, in order.
+
+        Expects the provider to answer with ``items_key`` plus
+        ``total_pages``/``next_page`` (the ItemPage shape). At most
+        ``prefetch`` pages are requested ahead of the consumer; without
+        ``total_pages`` the ``next_page`` links are followed one at a time. With a page
+        ``model`` each page is decoded in one pass and its records yielded.
+        """
+        params = dict(request_kw.pop("params", None) or {})
+
+        async def _page(number: int) -> Any:
+            return await self._call(
+                name, params={**params, page_param: number}, model=model, **request_kw
+            )
+
+        first = await _page(1)
+        for record in _field(first, items_key):
+            yield record
+        total = _field(first, "total_pages")
+        start = _field(first, "next_page")
+        if total is None:
+            # no page count to prefetch against – follow next_page links
+            while start is not None:
+                data = await _page(start)
+                for record in _field(data, items_key):
+                    yield record
+                start = _field(data, "next_page")
+            return
+        if start is None and total <= _field(first, "page", 1):
+            return
+
+        pages = range(start or 2, total + 1)
+        async for data in iter_prefetched(
+            _page, pages, prefetch or self.concurrency_limit
+        ):
+            for record in _field(data, items_key):
+                yield record
+
+    async def _export_pages(
+        self,
+        name: str,
+        path: PathLike,
+        *,
+        page_param: str = "page",
+        items_key: str = "items",
+        **kw,
+    ) -> ExportResult:
+        """NDJSON export of a page-numbered endpoint (see export_pages)."""
+
+        async def _page(number: int) -> Any:
+            return await self._call(name, params={page_param: number})
+
+        kw.setdefault("prefetch", self.concurrency_limit)
+        return await export_pages(_page, path, items_key=items_key, **kw)
 
     # canonical user API
     @abstractmethod
     async def list_users(self, **kw) -> Iterable[dict]:
         """Every connector must implement this high-level call."""
+
+    async def iter_users(self, **kw) -> AsyncIterator[Any]:
+        """
+        Streaming variant of list_users(). Adapters whose provider paginates
+        should override this with _iter_pages(); the default just walks the
+        materialized list.
+        """
+        for user in await self.list_users(**kw):
+            yield user
@@ -0,0 +1,105 @@
+import asyncio
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    TypeVar,
+)
+
+from .exceptions import NotFoundError
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+"""
+DataLoader-style micro-batching.
+
+Individual load(key) calls issued within a short window are collected and
+handed to one batch function, which returns {key: value} for the keys it
+found. Keys missing from the result raise NotFoundError for their caller.
+"""
+
+
+class BatchLoader(Generic[K, V]):
+    def __init__(
+        self,
+        batch_fn: Callable[[List[K]], Awaitable[Dict[K, V]]],
+        *,
+        max_batch_size: int = 100,
+        window: float = 0.002,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+        self._batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.window = window
+        self._pending: Dict[K, List["asyncio.Future[V]"]] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._running: Set["asyncio.Task[None]"] = set()
+        self.batches = 0
+
+    async def load(self, key: K) -> V:
+        fut = self._enqueue(key)
+        if len(self._pending) >= self.max_batch_size:
+            self._dispatch()
+        elif self._timer is None:
+            loop = asyncio.get_running_loop()
+            self._timer = loop.call_later(self.window, self._dispatch)
+        return await fut
+
+    async def load_many(self, keys: Iterable[K]) -> List[V]:
+        """Bulk lookup – dispatched at once instead of waiting for the window."""
+        futs = []
+        for key in keys:
+            futs.append(self._enqueue(key))
+            if len(self._pending) >= self.max_batch_size:
+                self._dispatch()
+        self._dispatch()
+        return list(await asyncio.gather(*futs))
+
+    def _enqueue(self, key: K) -> "asyncio.Future[V]":
+        fut = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(key, []).append(fut)
+        return fut
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, {}
+        self.batches += 1
+        task = asyncio.ensure_future(self._run(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: Dict[K, List["asyncio.Future[V]"]]) -> None:
+        try:
+            found = await self._batch_fn(list(batch))
+        except BaseException as exc:
+            for futs in batch.values():
+                for fut in futs:
+                    if fut.done():
+                        continue
+                    if isinstance(exc, Exception):
+                        fut.set_exception(exc)
+                    else:
+                        fut.cancel()
+            if not isinstance(exc, Exception):
+                raise
+            return
+        for key, futs in batch.items():
+            for fut in futs:
+                if fut.done():
+                    continue
+                if key in found:
+                    fut.set_result(found[key])
+                else:
+                    fut.set_exception(NotFoundError(str(key)))
@@ -0,0 +1,130 @@
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from .logger import logger
+
+"""
+Per-host circuit breaker.
+
+closed    – requests flow; outcomes go into a rolling window
+open      – failure rate crossed the threshold: fail fast for reset_timeout
+half_open – a few probe requests are let through; a success closes the
+            circuit, a failure re-opens it
+"""
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        *,
+        failure_threshold: float = 0.5,
+        window: int = 20,
+        min_requests: int = 10,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        name: str = "",
+    ):
+        self.failure_threshold = failure_threshold
+        self.min_requests = min_requests
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.window = window
+        self.name = name
+        self._outcomes: Deque[bool] = deque(maxlen=window)  # True = failure
+        self._failures = 0
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        self.rejected = 0
+        self.trips = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == OPEN:
+            if time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._state, self._probes = HALF_OPEN, 0
+        return self._state
+
+    def allow(self) -> bool:
+        """Whether a request may go out now (counts half-open probes)."""
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and self._probes < self.half_open_max_calls:
+            self._probes += 1
+            return True
+        self.rejected += 1
+        return False
+
+    def record(self, failure: Optional[bool]) -> None:
+        """
+        Outcome of an allowed request: True = failure (5xx / network),
+        False = success, None = neutral (4xx, 429, cancelled).
+        """
+        if self._state == HALF_OPEN:
+            self._probes = max(0, self._probes - 1)
+            if failure is None:
+                return
+            if failure:
+                self._trip()
+            else:
+                logger.info("Circuit for %s closed again", self.name)
+                self._state = CLOSED
+                self._outcomes.clear()
+                self._failures = 0
+            return
+        if failure is None or self._state == OPEN:
+            return
+        if len(self._outcomes) == self._outcomes.maxlen and self._outcomes[0]:
+            self._failures -= 1
+        self._outcomes.append(failure)
+        self._failures += failure
+        if (
+            len(self._outcomes) >= self.min_requests
+            and self._failures / len(self._outcomes) >= self.failure_threshold
+        ):
+            self._trip()
+
+    def _trip(self) -> None:
+        self._state = OPEN
+        self._opened_at = time.monotonic()
+        self._probes = 0
+        self.trips += 1
+        logger.warning(
+            "Circuit for %s opened – failing fast for %ss",
+            self.name,
+            self.reset_timeout,
+        )
+
+    def snapshot(self) -> Dict[str, Any]:
+        total = len(self._outcomes)
+        return {
+            "state": self.state,
+            "failure_rate": self._failures / total if total else 0.0,
+            "window": total,
+            "trips": self.trips,
+            "rejected": self.rejected,
+        }
+
+
+_BREAKERS: Dict[str, CircuitBreaker] = {}
+
+
+def get_breaker(base_url: str, **kw) -> CircuitBreaker:
+    """
+    One breaker per base_url, shared by every APIClient. The first caller's
+    thresholds win; later callers asking for different ones get a warning.
+    """
+    breaker = _BREAKERS.get(base_url)
+    if breaker is None:
+        breaker = _BREAKERS[base_url] = CircuitBreaker(name=base_url, **kw)
+        return breaker
+    ignored = {k: v for k, v in kw.items() if getattr(breaker, k, v) != v}
+    if ignored:
+        logger.warning(
+            "Circuit breaker for %s already exists; ignoring %s", base_url, ignored
+        )
+    return breaker
@@ -0,0 +1,178 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+"""
+Opt-in in-memory cache for idempotent GET responses.
+
+• bounded LRU, per-endpoint TTLs (longest matching path prefix wins)
+• honours Cache-Control: no-store / no-cache / max-age
+• stale entries with an ETag / Last-Modified are revalidated with
+  If-None-Match / If-Modified-Since – a 304 reuses the cached body
+• keys include provider, base_url and a digest of the bearer token, so
+  entries never leak across credentials
+"""
+
+_CacheKey = Tuple[str, str, str]
+_CONDITIONAL_HEADERS = {"if-none-match", "if-modified-since"}
+
+
+class CachedResponse:
+    __slots__ = (
+        "status_code",
+        "headers",
+        "content",
+        "etag",
+        "last_modified",
+        "expires_at",
+    )
+
+    def __init__(self, resp: httpx.Response, ttl: float):
+        self.status_code = resp.status_code
+        self.headers: List[Tuple[str, str]] = list(resp.headers.multi_items())
+        self.content = resp.content
+        self.etag = resp.headers.get("etag")
+        self.last_modified = resp.headers.get("last-modified")
+        self.expires_at = time.monotonic() + ttl
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+    @property
+    def revalidatable(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            self.status_code,
+            headers=self.headers,
+            content=self.content,
+            request=request,
+        )
+
+
+def _cache_control(resp: httpx.Response) -> Dict[str, Optional[str]]:
+    directives: Dict[str, Optional[str]] = {}
+    for part in resp.headers.get("cache-control", "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+    return directives
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        default_ttl: float = 60.0,
+        ttls: Optional[Dict[str, float]] = None,
+    ):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        # longest prefix first so "/projects/archive" beats "/projects"
+        self._ttls = sorted((ttls or {}).items(), key=lambda kv: -len(kv[0]))
+        self._entries: "OrderedDict[_CacheKey, CachedResponse]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(scope: str, url: str, token: str) -> _CacheKey:
+        digest = hashlib.sha256(token.encode()).hexdigest()[:32]
+        return (scope, digest, url)
+
+    @staticmethod
+    def cacheable_request(headers: Dict[str, str]) -> bool:
+        """Caller-supplied validators / no-cache bypass the cache entirely."""
+        for name, value in headers.items():
+            lname = name.lower()
+            if lname in _CONDITIONAL_HEADERS:
+                return False
+            if lname == "cache-control" and "no-cache" in value.lower():
+                return False
+        return True
+
+    def ttl_for(self, path: str) -> float:
+        for prefix, ttl in self._ttls:
+            if path.startswith(prefix):
+                return ttl
+        return self.default_ttl
+
+    def _response_ttl(self, cc: Dict[str, Optional[str]], path: str) -> float:
+        if "no-cache" in cc:
+            return 0.0
+        max_age = cc.get("max-age")
+        if max_age:
+            try:
+                return float(max_age)
+            except ValueError:
+                pass
+        return self.ttl_for(path)
+
+    def lookup(self, key: _CacheKey) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        if entry.fresh:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return entry
+
+    def store(self, key: _CacheKey, resp: httpx.Response, path: str) -> None:
+        if resp.status_code != 200:
+            return
+        cc = _cache_control(resp)
+        if "no-store" in cc:
+            self._entries.pop(key, None)
+            return
+        ttl = self._response_ttl(cc, path)
+        entry = CachedResponse(resp, ttl)
+        if ttl <= 0 and not entry.revalidatable:
+            return
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def revalidated(
+        self, key: _CacheKey, entry: CachedResponse, resp: httpx.Response, path: str
+    ) -> httpx.Response:
+        """Turn a 304 into the cached 200 and extend the entry's lifetime."""
+        self.revalidations += 1
+        ttl = self._response_ttl(_cache_control(resp), path)
+        entry.expires_at = time.monotonic() + ttl
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        return entry.to_response(resp.request)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "evictions": self.evictions,
+        }
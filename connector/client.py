@@ -1,24 +1,83 @@
 import asyncio
-from typing import List, Optional
+import logging
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import httpx
 
-from .anomaly import AnomalyDetector
-from .auth import OAuth2Manager
+from . import metrics
+from .anomaly import get_detector
+from .auth import OAuth2Manager, TokenCache, TokenPool
+from .batching import BatchLoader
+from .breaker import CircuitBreaker, get_breaker
+from .cache import ResponseCache
+from .columnar import ItemColumns
+from .concurrency import AdaptiveLimiter
 from .config import get_settings
+from .decoding import decode_obj, json_response, loads, response_decoder
 from .exceptions import (
     APIClientError,
     AuthenticationError,
+    CircuitOpenError,
+    DeadlineExceededError,
     NotFoundError,
+    RateLimitError,
+    ServerError,
 )
-from .logger import logger, redact_headers
+from .export import ExportResult, PathLike, export_pages
+from .hedging import Hedger
+from .logger import Redacted, logger
 from .models import Item, ItemPage
-from .utils import gather_limited
+from .ratelimit import RateLimiter, get_rate_limiter
+from .retry import Deadline, RetryBudget, RetryPolicy
+from .singleflight import SingleFlight
+from .transport import build_timeout, get_transport_manager
+from .utils import gather_limited, iter_limited, iter_prefetched
+
+T = TypeVar("T")
+
+
+def _retry_reason(resp: Optional[httpx.Response]) -> str:
+    if resp is None:
+        return "network"
+    return "429" if resp.status_code == 429 else "5xx"
+
+
+def _retryable(status: int) -> bool:
+    return status == 429 or status >= 500
+
+
+def _breaker_outcome(status: Optional[int]) -> Optional[bool]:
+    # network errors / 5xx count as failures; 429 is "alive but busy"
+    if status is None or status >= 500:
+        return True
+    return None if status == 429 else False
 
 
 class APIClient:
     """High‑level async client for the third‑party API."""
 
+    #: map logical names → (method, path_template)
+    ENDPOINTS: Dict[str, Tuple[str, str]] = {
+        "get_projects": ("GET", "/projects/batch"),
+    }
+    #: per-id endpoint → bulk endpoint (in ENDPOINTS) taking repeated ?ids=
+    BATCH_ENDPOINTS: Dict[str, str] = {"get_project": "get_projects"}
+    #: change-feed query parameter of the list endpoint, if any (connector.sync)
+    SINCE_PARAM: Optional[str] = None
+
     def __init__(
         self,
         base_url: Optional[str] = None,
@@ -28,81 +87,590 @@ class APIClient:
         max_retries: Optional[int] = None,
         backoff_factor: Optional[float] = None,
         concurrency_limit: Optional[int] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        retry_policy: Optional[RetryPolicy] = None,
     ):
         s = get_settings()
         self.base_url = (base_url or s.base_url).rstrip("/")
-        self._client = httpx.AsyncClient(base_url=self.base_url, timeout=10)
-        self._oauth = OAuth2Manager(self._client, s)
+        # pooled client shared with every other instance for this host, unless
+        # a custom transport (tests, ASGI apps) asks for a private one
+        self._shared_client: Optional[httpx.AsyncClient] = None
+        if transport is not None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url, transport=transport, timeout=build_timeout(s)
+            )
+        else:
+            self._client = get_transport_manager().acquire(self.base_url, s)
+            self._shared_client = self._client
+        self._closed = False
+        token_cache = TokenCache(s.token_cache_path) if s.token_cache_path else None
+        self._oauth = OAuth2Manager(self._client, s, token_cache=token_cache)
+        # more than one credential: spread requests over a pool of tokens
+        self._credentials: Optional[TokenPool] = None
+        if s.credential_count > 1:
+            self._credentials = TokenPool(
+                [self._oauth]
+                + [
+                    OAuth2Manager(
+                        self._client, s, credential=n, token_cache=token_cache
+                    )
+                    for n in range(2, s.credential_count + 1)
+                ],
+                s.credential_routing,
+                s.rate_limit_burst,
+            )
+        self._credential_cooldown = s.credential_cooldown
         self._max_retries = max_retries or s.max_retries
         self._backoff_factor = backoff_factor or s.backoff_factor
         self._concurrency_limit = concurrency_limit or s.concurrency_limit
-        self._detector = AnomalyDetector()
+        self._retry = retry_policy or RetryPolicy(
+            self._max_retries,
+            self._backoff_factor,
+            s.retry_backoff_cap,
+            max_auth_refreshes=s.max_auth_refreshes,
+            budget=RetryBudget(
+                s.retry_budget_ratio,
+                s.retry_budget_min_per_second,
+                s.retry_budget_burst,
+            ),
+        )
+        self._default_deadline = s.request_deadline
+        self._limiter: Optional[AdaptiveLimiter] = None
+        if s.adaptive_concurrency:
+            self._limiter = AdaptiveLimiter(
+                self._concurrency_limit,
+                min_limit=s.concurrency_min,
+                max_limit=max(s.concurrency_max, self._concurrency_limit),
+                latency_spike_factor=s.latency_spike_factor,
+            )
+        # shared by every client of this provider/base_url
+        self._rate_limiter = get_rate_limiter(
+            s.provider, self.base_url, s.rate_limit_per_second, s.rate_limit_burst
+        )
+        self._cache: Optional[ResponseCache] = None
+        if s.response_cache:
+            self._cache = ResponseCache(
+                s.cache_max_entries, s.cache_ttl, s.cache_ttls or None
+            )
+        self._cache_scope = f"{s.provider}|{self.base_url}"
+        # identical concurrent GETs share one request + decoded result
+        self._inflight: Optional[SingleFlight] = (
+            SingleFlight() if s.coalesce_requests else None
+        )
+        # micro-batching of per-id lookups (see _load)
+        self._batch_lookups = s.batch_lookups
+        self._batch_window = s.batch_window
+        self._batch_max_size = s.batch_max_size
+        self._loaders: Dict[str, BatchLoader] = {}
+        self._breaker: Optional[CircuitBreaker] = None
+        if s.breaker_enabled:
+            self._breaker = get_breaker(
+                self.base_url,
+                failure_threshold=s.breaker_failure_threshold,
+                window=s.breaker_window,
+                min_requests=s.breaker_min_requests,
+                reset_timeout=s.breaker_reset_timeout,
+                half_open_max_calls=s.breaker_half_open_calls,
+            )
+        self._hedger: Optional[Hedger] = None
+        if s.hedging_enabled:
+            self._hedger = Hedger(
+                s.hedge_percentile, s.hedge_min_delay, s.hedge_min_samples
+            )
+        self._detector = get_detector(
+            s.provider,
+            threshold=s.rate_threshold_per_minute,
+            auth_failure_threshold=s.anomaly_401_threshold,
+            server_error_threshold=s.anomaly_5xx_threshold,
+            alert_interval=s.anomaly_alert_interval,
+        )
+        self._metrics = s.metrics_enabled
+        # global admission (see connector.orchestrator); None = unbounded
+        self._admission: Optional[Any] = None
+
+    @property
+    def concurrency_limit(self) -> int:
+        """Current fan-out limit (moves over time when adaptive)."""
+        return self._limiter.limit if self._limiter else self._concurrency_limit
+
+    def _fanout_limit(self):
+        return self._limiter or self._concurrency_limit
+
+    def use_scheduler(self, gate: Optional[Any]) -> None:
+        """
+        Make every HTTP attempt take a slot from ``gate`` (anything with
+        async acquire() / release(), e.g. a FairScheduler FlowGate) first.
+        """
+        self._admission = gate
 
     # ------------- Low‑level request helper -------------
     async def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
-        """Authenticated request with retry, logging, error handling."""
-        self._detector.record_request()
-        token = await self._oauth.get_token()
+        """
+        Authenticated request with retry, logging, error handling.
+
+        ``deadline=<seconds>`` bounds the whole call, retries and waits
+        included (default: REQUEST_DEADLINE).
+        """
+        seconds = kwargs.pop("deadline", None) or self._default_deadline
+        deadline = Deadline(seconds) if seconds else None
+        oauth = self._credentials.pick() if self._credentials else self._oauth
+        token = await self._within(deadline, oauth.get_token())
         headers = kwargs.pop("headers", {})
+        url = path if path.startswith("http") else self.base_url + path
+
+        cache_key = cache_entry = None
+        if (
+            self._cache is not None
+            and method == "GET"
+            and ResponseCache.cacheable_request(headers)
+        ):
+            cache_url = httpx.URL(url)
+            if kwargs.get("params"):
+                cache_url = cache_url.copy_merge_params(kwargs["params"])
+            cache_key = self._cache.key(self._cache_scope, str(cache_url), token)
+            cache_entry = self._cache.lookup(cache_key)
+            if cache_entry is not None:
+                if cache_entry.fresh:
+                    return cache_entry.to_response(httpx.Request(method, cache_url))
+                headers.update(cache_entry.conditional_headers())
+
+        endpoint = metrics.normalize_endpoint(path)
+        self._detector.record_request(endpoint)
+        self._retry.record_request()
         headers["Authorization"] = f"Bearer {token}"
-        # redact before logging
-        logger.debug("Request: %s %s headers=%s", method, path, redact_headers(headers))
+        if logger.isEnabledFor(logging.DEBUG):
+            # redacted lazily – only if a handler actually emits the record
+            logger.debug("Request: %s %s headers=%s", method, path, Redacted(headers))
         last_exc: Optional[Exception] = None
-        url = path if path.startswith("http") else self.base_url + path
+        last_resp: Optional[httpx.Response] = None
+        retry_after: Optional[float] = None
+        attempt = refreshes = 0
+        delay = 0.0
 
-        for attempt in range(1, self._max_retries + 1):
+        while True:
+            attempt += 1
+            last_exc = last_resp = None
+            if self._breaker is not None and not self._breaker.allow():
+                raise CircuitOpenError(f"Circuit open for {self.base_url}")
+            if deadline is not None:
+                kwargs["timeout"] = deadline.clamp(self._client.timeout)
+            # reset by _admitted() once admitted: latency excludes queueing
+            sent_at = [time.monotonic()]
             try:
-                resp = await self._client.request(
-                    method, url, headers=headers, **kwargs
+                resp = await self._within(
+                    deadline,
+                    self._attempt(method, url, headers, kwargs, oauth, sent_at),
                 )
             except httpx.HTTPError as exc:
-                last_exc = exc
+                self._feedback(None, None)
+                self._detector.record_status(None, endpoint)
+                if self._metrics:
+                    elapsed = time.monotonic() - sent_at[0]
+                    metrics.record_request(method, endpoint, "error", elapsed)
+                last_exc, retry_after = exc, None
                 logger.warning(
-                    "Network error (%s) attempt %s/%s", exc, attempt, self._max_retries
+                    "Network error (%s) attempt %s/%s",
+                    exc,
+                    attempt,
+                    self._retry.max_attempts,
                 )
+            except BaseException:
+                if self._breaker is not None:
+                    self._breaker.record(None)  # cancelled: frees a probe slot
+                raise
             else:
+                elapsed = time.monotonic() - sent_at[0]
+                self._feedback(elapsed, resp.status_code)
+                self._detector.record_status(resp.status_code, endpoint)
+                if self._metrics:
+                    status = str(resp.status_code)
+                    metrics.record_request(method, endpoint, status, elapsed)
+                if self._credentials is not None:
+                    # quota headers describe this client ID, not the provider
+                    retry_after = self._credentials.observe(oauth, resp.headers)
+                else:
+                    retry_after = self._rate_limiter.observe(resp.headers)
                 if resp.status_code < 400:
                     logger.debug("Response %s %s", resp.status_code, url)
+                    if cache_key is not None:
+                        resp = self._cache_response(cache_key, cache_entry, resp)
                     return resp
                 if resp.status_code == 401:
-                    # maybe token expired – refresh once automatically
+                    # token expired/revoked – refresh (shared with other callers);
+                    # limited separately so a bad credential can't loop
                     self._detector.record_401()
-                    try:
-                        await self._oauth._refresh()
-                    except AuthenticationError:
-                        raise
-                    continue  # retry with fresh token
+                    refreshes += 1
+                    if refreshes > self._retry.max_auth_refreshes:
+                        raise AuthenticationError(
+                            f"Still unauthorized after {refreshes - 1} refresh(es)"
+                        )
+                    if self._metrics:
+                        metrics.record_retry(endpoint, "401")
+                    token = await self._within(
+                        deadline, oauth.refresh(stale_token=token)
+                    )
+                    headers["Authorization"] = f"Bearer {token}"
+                    if cache_key is not None:
+                        cache_key = self._cache.key(cache_key[0], cache_key[2], token)
+                    attempt -= 1  # a refresh is not a retry
+                    continue
                 if resp.status_code == 404:
                     raise NotFoundError(path)
-                if resp.status_code == 429:
-                    logger.warning("429 Too Many Requests – backing off")
-                    await asyncio.sleep(self._backoff_factor * (2 ** (attempt - 1)))
-                    continue  # retry
-                if 500 <= resp.status_code < 600:
+                if resp.status_code != 429 and resp.status_code < 500:
+                    # for other 4xx errors, no retry
+                    raise APIClientError(f"HTTP {resp.status_code}: {resp.text}")
+                last_resp = resp
+                logger.warning(
+                    "HTTP %s, attempt %s/%s",
+                    resp.status_code,
+                    attempt,
+                    self._retry.max_attempts,
+                )
+
+            if not self._retry.can_retry(attempt):
+                break
+            delay = self._retry.backoff(attempt, delay, retry_after)
+            # a Retry-After beyond the backoff cap: fail now rather than park
+            # the caller (or, for 429, the whole provider) for that long
+            too_long = retry_after is not None and retry_after > delay
+            if deadline is not None and delay >= deadline.remaining():
+                raise DeadlineExceededError(
+                    f"{method} {path}: retry in {delay:.2f}s would pass the deadline"
+                )
+            if self._metrics:
+                metrics.record_retry(endpoint, _retry_reason(last_resp))
+            if last_resp is not None and last_resp.status_code == 429:
+                pool = self._credentials
+                if pool is not None:
+                    pool.throttle(oauth, retry_after or self._credential_cooldown)
+                    if pool.available():
+                        # another credential still has quota: switch, don't wait
+                        oauth = pool.pick()
+                        token = await self._within(deadline, oauth.get_token())
+                        headers["Authorization"] = f"Bearer {token}"
+                        if cache_key is not None:
+                            cache_key = self._cache.key(
+                                cache_key[0], cache_key[2], token
+                            )
+                        continue
+                if too_long:
                     logger.warning(
-                        "Server error %s, attempt %s", resp.status_code, attempt
+                        "429 with Retry-After %.0fs (cap %ss) – giving up",
+                        retry_after,
+                        self._retry.max_delay,
                     )
-                    await asyncio.sleep(self._backoff_factor * (2 ** (attempt - 1)))
-                    continue
-                # for other 4xx errors, no retry
-                raise APIClientError(f"HTTP {resp.status_code}: {resp.text}")
-            # network error path
-            await asyncio.sleep(self._backoff_factor * (2 ** (attempt - 1)))
+                    break
+                logger.warning("429 Too Many Requests – pausing %.2fs", delay)
+                # shared limiter: every in-flight caller waits this out
+                self._rate_limiter.pause(delay)
+            elif too_long:
+                logger.warning(
+                    "Retry-After %.0fs exceeds the %ss cap – giving up",
+                    retry_after,
+                    self._retry.max_delay,
+                )
+                break
+            else:
+                await asyncio.sleep(delay)
+
+        if last_resp is not None:
+            if last_resp.status_code == 429:
+                raise RateLimitError(f"HTTP 429 after {attempt} attempt(s)")
+            status = last_resp.status_code
+            raise ServerError(f"HTTP {status} after {attempt} attempt(s)")
         if last_exc:
             raise APIClientError("Max retries exceeded", last_exc)
         raise APIClientError("Request failed after retries")
 
+    async def _attempt(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        kwargs: Dict[str, Any],
+        credential: Optional[OAuth2Manager] = None,
+        sent_at: Optional[List[float]] = None,
+    ) -> httpx.Response:
+        pool = self._credentials
+        if pool is None or credential is None:
+            return await self._admitted(method, url, headers, kwargs, None, sent_at)
+        pool.begin(credential)
+        try:
+            return await self._admitted(
+                method, url, headers, kwargs, credential, sent_at
+            )
+        finally:
+            pool.end(credential)
+
+    async def _admitted(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        kwargs: Dict[str, Any],
+        credential: Optional[OAuth2Manager] = None,
+        sent_at: Optional[List[float]] = None,
+    ) -> httpx.Response:
+        def _send() -> Awaitable[httpx.Response]:
+            if sent_at is not None:
+                sent_at[0] = time.monotonic()
+            return self._send(method, url, headers, kwargs, credential)
+
+        return await self._gated(_send, credential)
+
+    async def _gated(
+        self,
+        send: Callable[[], Awaitable[T]],
+        credential: Optional[OAuth2Manager] = None,
+    ) -> T:
+        """Run ``send`` once admitted by the gate and paced by the rate limiter."""
+        gate = self._admission
+        if gate is None:
+            await self._pace(credential)
+            return await send()
+        limiters = self._limiters(credential)
+        while True:
+            # sit out 429 / exhausted-quota pauses before queueing: a paused
+            # provider must not hold slots other providers could use
+            for limiter in limiters:
+                await limiter.wait_unpaused()
+            await gate.acquire()
+            if not any(limiter.paused_for for limiter in limiters):
+                break
+            gate.release()  # paused again while we queued
+        try:
+            # pacing token last: one taken before a long admission wait would
+            # be spent long after the limiter allowed it, bunching requests
+            await self._pace(credential)
+            return await send()
+        finally:
+            gate.release()
+
+    def _limiters(self, credential: Optional[OAuth2Manager]) -> List[RateLimiter]:
+        limiters = [self._rate_limiter]
+        if credential is not None and self._credentials is not None:
+            # that client ID's own quota (X-RateLimit-* hints, 429 pauses)
+            limiters.append(self._credentials.limiter(credential))
+        return limiters
+
+    async def _pace(self, credential: Optional[OAuth2Manager]) -> None:
+        for limiter in self._limiters(credential):
+            await limiter.acquire()
+
+    @staticmethod
+    async def _within(deadline: Optional[Deadline], aw: Awaitable[T]) -> T:
+        if deadline is None:
+            return await aw
+        try:
+            return await asyncio.wait_for(aw, deadline.remaining())
+        except asyncio.TimeoutError:
+            raise DeadlineExceededError(
+                f"Deadline of {deadline.seconds}s exceeded"
+            ) from None
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        kwargs: Dict[str, Any],
+        credential: Optional[OAuth2Manager] = None,
+    ) -> httpx.Response:
+        def _once() -> Awaitable[httpx.Response]:
+            kw = kwargs
+            if self._metrics:
+                # fresh trace per attempt (hedges included)
+                extensions = dict(kwargs.get("extensions") or {})
+                extensions["trace"] = metrics.pool_wait_trace()
+                kw = {**kwargs, "extensions": extensions}
+            return self._client.request(method, url, headers=headers, **kw)
+
+        if self._hedger is not None and method == "GET":
+
+            async def _hedge() -> httpx.Response:
+                # one more request: it needs the breaker's consent, its own
+                # pacing token and admission slot
+                breaker = self._breaker
+                if breaker is not None and not breaker.allow():
+                    raise CircuitOpenError(f"Circuit open for {self.base_url}")
+                try:
+                    resp = await self._gated(_once, credential)
+                except httpx.HTTPError:
+                    if breaker is not None:
+                        breaker.record(True)
+                    raise
+                except BaseException:
+                    if breaker is not None:
+                        breaker.record(None)  # lost the race / cancelled
+                    raise
+                if breaker is not None:
+                    breaker.record(_breaker_outcome(resp.status_code))
+                return resp
+
+            return await self._hedger.run(
+                _once, _hedge, accept=lambda r: not _retryable(r.status_code)
+            )
+        return await _once()
+
+    def resilience_snapshot(self) -> Dict[str, Any]:
+        """Breaker / hedging / limiter / retry budget / anomaly state."""
+        return {
+            "breaker": self._breaker.snapshot() if self._breaker else None,
+            "hedging": self._hedger.snapshot() if self._hedger else None,
+            "concurrency": self._limiter.snapshot() if self._limiter else None,
+            "retry_budget": self._retry.budget.snapshot()
+            if self._retry.budget
+            else None,
+            "anomaly": self._detector.snapshot(),
+            "credentials": self._credentials.snapshot() if self._credentials else None,
+        }
+
+    def _cache_response(self, key, entry, resp: httpx.Response) -> httpx.Response:
+        path = resp.request.url.path
+        if resp.status_code == 304 and entry is not None:
+            return self._cache.revalidated(key, entry, resp, path)
+        self._cache.store(key, resp, path)
+        return resp
+
+    @property
+    def response_cache(self) -> Optional[ResponseCache]:
+        """The GET response cache (None unless enabled); see .stats()."""
+        return self._cache
+
+    def _feedback(self, latency: Optional[float], status: Optional[int]) -> None:
+        if self._limiter is not None:
+            self._limiter.record(latency, status)
+        if self._breaker is not None:
+            self._breaker.record(_breaker_outcome(status))
+
+    async def _get_decoded(
+        self, path: str, decode: Callable[[httpx.Response], T], **kwargs
+    ) -> T:
+        """
+        GET ``path`` and decode it. Identical concurrent calls (same path,
+        params and decoder) are coalesced into one request; every waiter gets
+        the same decoded object – or the same exception.
+        """
+
+        async def _fetch() -> T:
+            return decode(await self._request("GET", path, **kwargs))
+
+        params = kwargs.get("params")
+        if self._inflight is None or set(kwargs) - {"params"}:
+            return await _fetch()  # custom headers/timeouts: don't share
+        key = (path, str(httpx.QueryParams(params)) if params else "", decode)
+        return await self._inflight.do(key, _fetch)
+
     # High‑level helpers
     async def list_items_page(self, page: int = 1) -> ItemPage:
-        resp = await self._request("GET", f"/items?page={page}")
-        return ItemPage.parse_obj(resp.json())
-    
+        return await self._get_decoded(
+            f"/items?page={page}", response_decoder(ItemPage)
+        )
+
+    async def _fetch_project(self, project_id: int) -> Item:
+        return await self._get_decoded(
+            f"/projects/{project_id}", response_decoder(Item)
+        )
+
     async def get_project(self, project_id: int) -> Item:
-        resp = await self._request("GET", f"/projects/{project_id}")
-        return Item.model_validate(resp.json())
+        return await self._load(
+            "get_project", project_id, self._fetch_project, self._record_decoder(Item)
+        )
+
+    async def get_projects(self, project_ids: Iterable[int]) -> List[Item]:
+        """Bulk lookup, in the order given; raises NotFoundError on any miss."""
+        return await self._load_many(
+            "get_project", project_ids, self._fetch_project, self._record_decoder(Item)
+        )
+
+    def _record_decoder(self, model: Any) -> Callable[[Any], Any]:
+        def _decode(record: Any) -> Any:
+            return decode_obj(model, record)
+
+        return _decode
+
+    # ------------- per-id micro-batching -------------
+    async def _load(
+        self,
+        name: str,
+        key: Any,
+        fetch_one: Callable[[Any], Any],
+        decode: Callable[[Any], Any] = lambda record: record,
+    ) -> Any:
+        """
+        Per-id lookup through endpoint ``name``. With BATCH_LOOKUPS on, calls
+        issued within BATCH_WINDOW are sent together via _fetch_batch().
+        """
+        if not self._batch_lookups:
+            return await fetch_one(key)
+        return await self._batch_loader(name, fetch_one, decode).load(key)
+
+    async def _load_many(
+        self,
+        name: str,
+        keys: Iterable[Any],
+        fetch_one: Callable[[Any], Any],
+        decode: Callable[[Any], Any] = lambda record: record,
+    ) -> List[Any]:
+        return await self._batch_loader(name, fetch_one, decode).load_many(keys)
+
+    def _batch_loader(self, name: str, fetch_one, decode) -> BatchLoader:
+        loader = self._loaders.get(name)
+        if loader is None:
+
+            async def _batch(keys: List[Any]) -> Dict[Any, Any]:
+                return await self._fetch_batch(name, keys, fetch_one, decode)
+
+            loader = self._loaders[name] = BatchLoader(
+                _batch, max_batch_size=self._batch_max_size, window=self._batch_window
+            )
+        return loader
+
+    async def _fetch_batch(
+        self,
+        name: str,
+        keys: List[Any],
+        fetch_one: Callable[[Any], Any],
+        decode: Callable[[Any], Any],
+        id_field: str = "id",
+    ) -> Dict[Any, Any]:
+        """
+        One request to the provider's bulk endpoint when the class declares
+        one, otherwise bounded parallel single fetches.
+        """
+        batch_name = self.BATCH_ENDPOINTS.get(name)
+        if batch_name in self.ENDPOINTS:
+            method, path = self.ENDPOINTS[batch_name]  # type: ignore[index]
+            resp = await self._request(method, path, params={"ids": keys})
+            records = loads(resp.content)["items"]
+            return {r[id_field]: decode(r) for r in records}
+
+        async def _one(key: Any):
+            try:
+                return key, await fetch_one(key)
+            except NotFoundError:
+                return key, None
 
-    async def list_all_items(self, concurrent: bool = True) -> List[Item]:
-        """Fetch every item across pages – optionally concurrent."""
+        pairs = await gather_limited((_one(k) for k in keys), self._fanout_limit())
+        return {k: v for k, v in pairs if v is not None}
+
+    async def _list_items_page_raw(self, page: int = 1) -> Dict[str, Any]:
+        """Page as plain JSON – no model objects (columnar/export paths)."""
+        return await self._get_decoded(f"/items?page={page}", json_response)
+
+    async def list_all_items(
+        self, concurrent: bool = True, format: str = "items"
+    ) -> Union[List[Item], ItemColumns]:
+        """
+        Fetch every item across pages – optionally concurrent.
+
+        ``format="columns"`` returns an ItemColumns store filled page by page
+        without creating per-item model objects.
+        """
+        if format == "columns":
+            return await self._collect_columns(concurrent)
+        if format != "items":
+            raise ValueError(f"Unknown format {format!r} (use 'items' or 'columns')")
         first = await self.list_items_page(1)
         items: List[Item] = list(first.items)
         if first.total_pages <= 1:
@@ -110,11 +678,11 @@ class APIClient:
 
         pages = range(2, first.total_pages + 1)
         if concurrent:
-            coros = [self.list_items_page(p) for p in pages]
-            results: List[ItemPage] = await gather_limited(
-                coros, self._concurrency_limit
-            )
-            for page_obj in results:
+            # lazily created page fetches, consumed in page order as they land
+            fetches = (self.list_items_page(p) for p in pages)
+            async for _, page_obj in iter_limited(
+                fetches, self._fanout_limit(), ordered=True
+            ):
                 items.extend(page_obj.items)
         else:
             for p in pages:
@@ -122,8 +690,59 @@ class APIClient:
                 items.extend(ip.items)
         return items
 
+    async def _collect_columns(self, concurrent: bool) -> ItemColumns:
+        cols = ItemColumns()
+        first = await self._list_items_page_raw(1)
+        cols.extend(first["items"])
+        pages = range(2, first["total_pages"] + 1)
+        # concurrent pages still land in order, one page buffered per slot
+        prefetch = self.concurrency_limit if concurrent else 1
+        async for data in iter_prefetched(self._list_items_page_raw, pages, prefetch):
+            cols.extend(data["items"])
+        return cols
+
+    async def export_items(self, path: PathLike, **kw) -> ExportResult:
+        """
+        Stream every item to NDJSON at ``path`` with checkpoint/resume.
+        Keyword arguments go to connector.export.export_pages().
+        """
+        kw.setdefault("prefetch", self.concurrency_limit)
+        return await export_pages(self._list_items_page_raw, path, **kw)
+
+    async def iter_items(self, prefetch: Optional[int] = None) -> AsyncIterator[Item]:
+        """
+        Stream every item across pages, in page order, as pages arrive.
+
+        At most ``prefetch`` pages (default: the concurrency limit) are
+        fetched ahead of the consumer, so memory stays bounded.
+        """
+        first = await self.list_items_page(1)
+        for item in first.items:
+            yield item
+        if first.next_page is None and first.total_pages <= first.page:
+            return
+
+        start = first.next_page or first.page + 1
+        pages = range(start, first.total_pages + 1)
+        async for page_obj in iter_prefetched(
+            self.list_items_page, pages, prefetch or self.concurrency_limit
+        ):
+            for item in page_obj.items:
+                yield item
+
     async def close(self):
-        await self._client.aclose()
+        if self._closed:
+            return
+        self._closed = True
+        if self._credentials is not None:
+            await self._credentials.aclose()
+        else:
+            await self._oauth.aclose()
+        shared, self._shared_client = self._shared_client, None
+        if shared is not None:
+            await get_transport_manager().release(shared)
+        if self._client is not shared:
+            await self._client.aclose()
 
 
 # Convenience singleton for quick import
@@ -0,0 +1,109 @@
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Union, overload
+
+from .models import Item
+
+"""
+Columnar storage for bulk Item pulls.
+
+Instead of one pydantic object per row (hundreds of bytes each) rows are
+appended straight into compact typed columns:
+
+• id    -> array('q')  (8 bytes / row)
+• value -> array('d')  (8 bytes / row)
+• name  -> UTF-8 bytes in one bytearray + array('q') end offsets
+
+Items are only materialized on demand (indexing / iteration / to_items()).
+"""
+
+
+class ItemColumns:
+    def __init__(self) -> None:
+        self.ids = array("q")
+        self.values = array("d")
+        self._name_data = bytearray()
+        self._name_ends = array("q")
+
+    # ------------- building -------------
+    def append(self, id: int, name: str, value: float) -> None:
+        # convert every field before touching a column: a bad record must
+        # not leave the columns with different lengths
+        row_id = array("q", (id,))
+        row_value = array("d", (value,))
+        encoded = name.encode()
+        self.ids += row_id
+        self.values += row_value
+        self._name_data += encoded
+        self._name_ends.append(len(self._name_data))
+
+    def extend(self, records: Iterable[Mapping[str, Any]]) -> None:
+        """Append raw JSON records ({"id", "name", "value"}) from a page."""
+        for r in records:
+            self.append(r["id"], r["name"], r["value"])
+
+    # ------------- reading -------------
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def name(self, index: int) -> str:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ItemColumns index out of range")
+        start = self._name_ends[index - 1] if index else 0
+        return self._name_data[start : self._name_ends[index]].decode()
+
+    @property
+    def names(self) -> List[str]:
+        return [self.name(i) for i in range(len(self))]
+
+    @overload
+    def __getitem__(self, index: int) -> Item: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Item]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Item, List[Item]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        return Item.model_construct(
+            id=self.ids[index], name=self.name(index), value=self.values[index]
+        )
+
+    def __iter__(self) -> Iterator[Item]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def to_items(self) -> List[Item]:
+        return list(self)
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """Zero-copy NumPy views of the numeric columns (needs numpy)."""
+        try:
+            import numpy as np
+        except ImportError as exc:  # optional dependency
+            raise ImportError("ItemColumns.to_numpy() requires numpy") from exc
+        return {
+            "id": np.frombuffer(self.ids, dtype=np.int64),
+            "value": np.frombuffer(self.values, dtype=np.float64),
+            "name": np.array(self.names, dtype=object),
+        }
+
+    # ------------- monitoring -------------
+    def memory_footprint(self) -> Dict[str, int]:
+        """Bytes held by each column buffer."""
+        return {
+            "id": self.ids.itemsize * len(self.ids),
+            "value": self.values.itemsize * len(self.values),
+            "name": len(self._name_data)
+            + self._name_ends.itemsize * len(self._name_ends),
+        }
+
+    @property
+    def nbytes(self) -> int:
+        return sum(self.memory_footprint().values())
+
+    def __repr__(self) -> str:
+        return f"ItemColumns(rows={len(self)}, nbytes={self.nbytes})"
@@ -0,0 +1,141 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from .logger import logger
+
+"""
+Adaptive (AIMD) concurrency limiter.
+
+Behaves like an asyncio.Semaphore whose size moves with the provider's
+health: it grows by roughly one slot per "window" of healthy responses and
+is cut multiplicatively on 429 / 5xx / latency spikes.
+"""
+
+
+class AdaptiveLimiter:
+    def __init__(
+        self,
+        initial: int,
+        *,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        decrease_factor: float = 0.5,
+        latency_spike_factor: float = 2.0,
+        cooldown: float = 1.0,
+    ):
+        if min_limit < 1 or max_limit < min_limit:
+            raise ValueError("require 1 <= min_limit <= max_limit")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self._limit = float(min(max(initial, min_limit), max_limit))
+        self._decrease_factor = decrease_factor
+        self._spike_factor = latency_spike_factor
+        self._cooldown = cooldown
+        self._in_flight = 0
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+        self._baseline: Optional[float] = None  # EWMA of healthy latency
+        self._last_decrease = 0.0
+        self._increases = 0
+        self._decreases = 0
+
+    # ------------- monitoring -------------
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "waiting": len(self._waiters),
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "baseline_latency": self._baseline,
+            "increases": self._increases,
+            "decreases": self._decreases,
+        }
+
+    # ------------- semaphore protocol -------------
+    async def acquire(self) -> None:
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+        fut = asyncio.get_running_loop().create_future()
+        self._waiters.append(fut)
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # slot was handed to us just as we got cancelled – pass it on
+                self.release()
+            else:
+                self._waiters.remove(fut)
+            raise
+
+    def release(self) -> None:
+        self._in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            fut = self._waiters.popleft()
+            if not fut.done():
+                self._in_flight += 1
+                fut.set_result(None)
+
+    async def __aenter__(self) -> "AdaptiveLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.release()
+
+    # ------------- feedback -------------
+    def record(self, latency: Optional[float], status: Optional[int]) -> None:
+        """
+        Feed one request outcome. ``status`` is None for network errors,
+        ``latency`` is None when unknown.
+        """
+        overloaded = status is None or status == 429 or status >= 500
+        if not overloaded and latency is not None:
+            if self._baseline is None:
+                self._baseline = latency
+            else:
+                overloaded = latency > self._baseline * self._spike_factor
+                # spikes move the baseline too: after a lasting latency shift
+                # it catches up within a few samples instead of every healthy
+                # response counting as a spike until the limit hits the floor
+                self._baseline = 0.9 * self._baseline + 0.1 * latency
+
+        if overloaded:
+            self._decrease()
+        else:
+            self._increase()
+
+    def _increase(self) -> None:
+        if self._limit >= self.max_limit:
+            return
+        before = self.limit
+        # +1 slot per `limit` healthy responses (classic AIMD)
+        self._limit = min(self.max_limit, self._limit + 1.0 / self._limit)
+        if self.limit > before:
+            self._increases += 1
+            self._wake()
+
+    def _decrease(self) -> None:
+        now = time.monotonic()
+        # one burst of errors should cut the window once, not N times
+        if now - self._last_decrease < self._cooldown:
+            return
+        self._last_decrease = now
+        new = max(float(self.min_limit), self._limit * self._decrease_factor)
+        if int(new) < self.limit:
+            self._decreases += 1
+            logger.info("Concurrency limit reduced %s → %s", self.limit, int(new))
+        self._limit = new
@@ -1,9 +1,16 @@
 import os
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Optional
 
+from pydantic import PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from connector.secret_provider import EnvProvider, FileProvider, SecretProvider
+from connector.secret_provider import (
+    CachingSecretProvider,
+    EnvProvider,
+    FileProvider,
+    SecretProvider,
+)
 
 
 class Settings(BaseSettings):
@@ -17,12 +24,80 @@ class Settings(BaseSettings):
 
     client_id: Optional[str] = None
     client_secret: Optional[str] = None
+    # secrets from the backend are cached; files are re-checked (mtime) after this
+    secret_cache_ttl: float = 300.0
+    # extra credentials: <provider>_client_id_<n> / _client_secret_<n>, n = 2…
+    credential_count: int = 1
+    credential_routing: str = "least_loaded"  # or round_robin
+    credential_cooldown: float = 1.0  # s a 429'd credential sits out (default)
+    # JSON file sharing tokens across processes/restarts (None = in memory)
+    token_cache_path: Optional[str] = None
+    _secrets: Optional[CachingSecretProvider] = PrivateAttr(None)
 
     base_url: str = "https://api.example.com"
     max_retries: int = 3
     backoff_factor: float = 1.0
+    # decorrelated jitter between backoff_factor and this cap
+    retry_backoff_cap: float = 30.0
+    # retries may add at most ratio * requests (+ a small steady trickle)
+    retry_budget_ratio: float = 0.2
+    retry_budget_min_per_second: float = 1.0
+    retry_budget_burst: float = 10.0
+    request_deadline: Optional[float] = None  # seconds per call, retries included
+    max_auth_refreshes: int = 1
+    # per-request latency/status metrics + pool-wait tracing (connector.metrics)
+    metrics_enabled: bool = True
     concurrency_limit: int = 10
+    # AIMD limiter: starts at concurrency_limit, moves within [min, max]
+    adaptive_concurrency: bool = True
+    concurrency_min: int = 1
+    concurrency_max: int = 50
+    latency_spike_factor: float = 2.0
+    # in-flight requests across all providers run by one Orchestrator
+    global_concurrency_limit: int = 32
     rate_threshold_per_minute: int = 100
+    # anomaly detector (one per provider): alert thresholds per 60s window
+    anomaly_401_threshold: int = 5
+    anomaly_5xx_threshold: int = 50
+    anomaly_alert_interval: float = 60.0  # min seconds between alike alerts
+    # shared HTTP pool (one per base_url + these settings)
+    http_max_connections: int = 100
+    http_max_keepalive: int = 20
+    http_keepalive_expiry: float = 5.0
+    http2: bool = False  # needs the optional 'h2' package
+    connect_timeout: float = 5.0
+    read_timeout: float = 10.0
+    write_timeout: float = 10.0
+    pool_timeout: float = 5.0
+    # share one request between identical concurrent GETs
+    coalesce_requests: bool = True
+    # micro-batch single-id lookups issued within batch_window seconds
+    batch_lookups: bool = False
+    batch_window: float = 0.002
+    batch_max_size: int = 100
+    # per-base_url circuit breaker (failure rate over the last `window` calls)
+    breaker_enabled: bool = True
+    breaker_failure_threshold: float = 0.5
+    breaker_window: int = 20
+    breaker_min_requests: int = 10
+    breaker_reset_timeout: float = 30.0
+    breaker_half_open_calls: int = 1
+    # opt-in hedging of GETs after the given latency percentile
+    hedging_enabled: bool = False
+    hedge_percentile: float = 0.95
+    hedge_min_delay: float = 0.05
+    hedge_min_samples: int = 20
+    # opt-in GET response cache; cache_ttls maps path prefix → seconds
+    response_cache: bool = False
+    cache_max_entries: int = 1024
+    cache_ttl: float = 60.0
+    cache_ttls: Dict[str, float] = {}
+    # refresh the OAuth2 token in the background `lead` seconds before expiry
+    token_background_refresh: bool = False
+    token_refresh_lead: float = 10.0
+    # client-side pacing; None = only what the provider's headers advertise
+    rate_limit_per_second: Optional[float] = None
+    rate_limit_burst: int = 10
 
     model_config = SettingsConfigDict(
         env_prefix="",
@@ -31,25 +106,43 @@ class Settings(BaseSettings):
     )
 
     def _provider_backend(self) -> SecretProvider:
-        return FileProvider() if self.secret_backend == "docker" else EnvProvider()
+        # built once per Settings so the secret cache survives token refreshes
+        if self._secrets is None:
+            inner = FileProvider() if self.secret_backend == "docker" else EnvProvider()
+            self._secrets = CachingSecretProvider(inner, self.secret_cache_ttl)
+        return self._secrets
 
-    def _secret_name(self, suffix: str) -> str:
-        return f"{self.provider}_{suffix}"
+    def invalidate_secrets(self) -> None:
+        """Force the next client_id/secret lookup to hit the backend again."""
+        if self._secrets is not None:
+            self._secrets.invalidate()
 
-    async def client_id_async(self) -> str:
-        if self.client_id:  # env-var path (dev/CI)
+    def _secret_name(self, suffix: str, credential: int = 1) -> str:
+        name = f"{self.provider}_{suffix}"
+        return name if credential == 1 else f"{name}_{credential}"
+
+    async def client_id_async(self, credential: int = 1) -> str:
+        if self.client_id and credential == 1:  # env-var path (dev/CI)
             return self.client_id
         return await self._provider_backend().get(
-            self._secret_name(self.client_id_suffix)
+            self._secret_name(self.client_id_suffix, credential)
         )
 
-    async def client_secret_async(self) -> str:
-        if self.client_secret:
+    async def client_secret_async(self, credential: int = 1) -> str:
+        if self.client_secret and credential == 1:
             return self.client_secret
         return await self._provider_backend().get(
-            self._secret_name(self.client_secret_suffix)
+            self._secret_name(self.client_secret_suffix, credential)
         )
 
 
+@lru_cache(maxsize=None)
 def get_settings() -> Settings:
-    return Settings()  # cached by Pydantic
+    """Process-wide Settings, read from env / .env once (see reload_settings)."""
+    return Settings()
+
+
+def reload_settings() -> Settings:
+    """Drop the memoized Settings and re-read env / .env."""
+    get_settings.cache_clear()
+    return get_settings()
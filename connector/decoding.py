@@ -0,0 +1,64 @@
+import json
+from functools import lru_cache
+from typing import Any, Callable, Union
+
+from pydantic import TypeAdapter
+
+try:  # optional speed-up for plain JSON bodies
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None  # type: ignore[assignment]
+
+"""
+Response decoding.
+
+Bytes → model in one pass via a cached TypeAdapter: pydantic-core parses
+JSON and validates without building dicts first. Plain JSON bodies (no
+model) go through orjson when it is installed. There is deliberately no
+"skip validation" mode: building models with model_construct() from parsed
+dicts is slower than validate_json (see ``python -m benchmarks.decoding``).
+"""
+
+
+@lru_cache(maxsize=None)
+def type_adapter(tp: Any) -> TypeAdapter:
+    return TypeAdapter(tp)
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def decode(tp: Any, data: Union[bytes, str]) -> Any:
+    return type_adapter(tp).validate_json(data)
+
+
+def decode_obj(tp: Any, obj: Any) -> Any:
+    """Same as decode() for data that is already parsed (e.g. batch records)."""
+    return type_adapter(tp).validate_python(obj)
+
+
+def json_response(resp: Any) -> Any:
+    """Plain JSON body, no model."""
+    return loads(resp.content)
+
+
+@lru_cache(maxsize=None)
+def response_decoder(tp: Any) -> Callable[[Any], Any]:
+    """
+    A decoder for httpx responses. Cached so the same type always yields
+    the same function – request coalescing keys on it.
+    """
+
+    def _decode(resp: Any) -> Any:
+        return decode(tp, resp.content)
+
+    return _decode
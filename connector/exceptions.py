@@ -16,3 +16,15 @@ class RateLimitError(APIClientError):
 
 class ServerError(APIClientError):
     pass
+
+
+class CircuitOpenError(APIClientError):
+    """Raised without touching the network while a host's breaker is open."""
+
+
+class DeadlineExceededError(APIClientError):
+    """Request (including retries) did not finish within its deadline."""
+
+
+class ShardingError(APIClientError):
+    """A sharded-run worker process died before finishing its tenants."""
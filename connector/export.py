@@ -0,0 +1,165 @@
+import asyncio
+import gzip
+import json
+import os
+from pathlib import Path
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+from .decoding import dumps
+from .logger import logger
+from .utils import iter_prefetched
+
+"""
+Streaming NDJSON export with checkpoint / resume.
+
+Pages are written in order as they arrive (optionally as one gzip member per
+page, which concatenates into a valid .gz file). After every page the byte
+offset and the next page number are saved atomically, so a rerun truncates
+any half-written tail and only fetches the pages that are still missing.
+The checkpoint is removed once the export completes.
+"""
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+class ExportResult(NamedTuple):
+    path: Path
+    records: int  # written by this run
+    pages_written: int  # by this run
+    pages_skipped: int  # already done by a previous run
+    total_pages: int
+    bytes: int  # final file size
+
+
+class Checkpoint:
+    """JSON side-file holding {"next_page", "total_pages", "offset", ...}."""
+
+    def __init__(self, path: PathLike):
+        self.path = Path(path)
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            logger.warning("Ignoring corrupt export checkpoint %s", self.path)
+            return None
+
+    def save(self, state: Mapping[str, Any]) -> None:
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps(state))
+        os.replace(tmp, self.path)  # atomic – never a half-written checkpoint
+
+    def clear(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+
+class NDJSONSink:
+    def __init__(self, path: PathLike, compress: bool = False):
+        self.path = Path(path)
+        self.compress = compress
+        self._fh: Any = None
+
+    def open(self, offset: int = 0) -> None:
+        """Open for appending at ``offset``, dropping anything past it."""
+        mode = "r+b" if offset and self.path.exists() else "wb"
+        self._fh = open(self.path, mode)
+        self._fh.seek(offset)
+        self._fh.truncate()
+
+    def write_page(self, records: Iterable[Any]) -> int:
+        """Write one page durably; returns the new end offset."""
+        chunk = b"".join(dumps(r) + b"\n" for r in records)
+        if self.compress:
+            chunk = gzip.compress(chunk)
+        self._fh.write(chunk)
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+        return self._fh.tell()
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+
+async def export_pages(
+    fetch_page: Callable[[int], Awaitable[Mapping[str, Any]]],
+    path: PathLike,
+    *,
+    checkpoint: Optional[PathLike] = None,
+    compress: bool = False,
+    prefetch: int = 4,
+    items_key: str = "items",
+    resume: bool = True,
+) -> ExportResult:
+    """
+    Export every page returned by ``fetch_page(n)`` (ItemPage-shaped JSON)
+    to NDJSON at ``path``. The checkpoint defaults to ``<path>.ckpt``.
+    """
+    sink = NDJSONSink(path, compress)
+    ckpt = Checkpoint(checkpoint or f"{path}.ckpt")
+    state = ckpt.load() if resume else None
+    if state is not None and (
+        state.get("compress") != compress
+        or not sink.path.exists()
+        or sink.path.stat().st_size < state["offset"]
+    ):
+        logger.warning("Export checkpoint does not match %s – restarting", path)
+        state = None
+
+    records = pages_written = 0
+    if state is None:
+        state = {"next_page": 1, "total_pages": None, "offset": 0}
+        state["compress"] = compress
+    else:
+        logger.info(
+            "Resuming export of %s at page %s/%s",
+            path,
+            state["next_page"],
+            state["total_pages"],
+        )
+    start, total = state["next_page"], state["total_pages"]
+    skipped = start - 1
+
+    def _commit(page: int, data: Mapping[str, Any]) -> None:
+        state["offset"] = sink.write_page(data[items_key])
+        state["next_page"] = page + 1
+        state["total_pages"] = total
+        ckpt.save(state)
+
+    if total is None or start <= total:
+        # the provider may have grown since the checkpoint was written, so
+        # the first page of every run refreshes total_pages
+        first = await fetch_page(start)
+        total = first.get("total_pages") or total or 1
+    await asyncio.to_thread(sink.open, state["offset"])
+    try:
+        if start <= total:
+            await asyncio.to_thread(_commit, start, first)
+            records, pages_written, start = len(first[items_key]), 1, start + 1
+        page, pages = start, range(start, total + 1)
+        async for data in iter_prefetched(fetch_page, pages, prefetch):
+            # file + checkpoint I/O stays off the event loop
+            await asyncio.to_thread(_commit, page, data)
+            records += len(data[items_key])
+            pages_written += 1
+            page += 1
+    finally:
+        sink.close()
+    await asyncio.to_thread(ckpt.clear)  # done: a rerun starts a fresh export
+
+    return ExportResult(
+        sink.path, records, pages_written, skipped, total, sink.path.stat().st_size
+    )
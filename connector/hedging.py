@@ -0,0 +1,120 @@
+import asyncio
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+"""
+Hedged requests for idempotent calls.
+
+If the first attempt has not answered after the tracked latency percentile,
+a second identical attempt is started; whichever succeeds first wins and the
+other is cancelled. A result the caller does not ``accept`` (e.g. a 503
+Response) does not win: the other attempt is still awaited.
+"""
+
+
+class LatencyTracker:
+    def __init__(self, size: int = 256, refresh_every: int = 16):
+        self._samples: Deque[float] = deque(maxlen=size)
+        self._refresh_every = refresh_every
+        self._since_refresh = 0
+        self._sorted: list = []
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def add(self, latency: float) -> None:
+        self._samples.append(latency)
+        self._since_refresh += 1
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self._samples:
+            return None
+        # re-sort lazily – the hot path only indexes a cached list
+        if self._since_refresh >= self._refresh_every or not self._sorted:
+            self._sorted = sorted(self._samples)
+            self._since_refresh = 0
+        idx = min(len(self._sorted) - 1, int(q * len(self._sorted)))
+        return self._sorted[idx]
+
+
+class Hedger:
+    def __init__(
+        self, percentile: float = 0.95, min_delay: float = 0.05, min_samples: int = 20
+    ):
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.latencies = LatencyTracker()
+        self.hedged = 0  # second attempts sent
+        self.hedge_wins = 0  # … that answered first
+
+    def delay(self) -> Optional[float]:
+        """Hedge delay, or None while there is not enough history."""
+        if len(self.latencies) < self.min_samples:
+            return None
+        return max(self.min_delay, self.latencies.percentile(self.percentile) or 0.0)
+
+    async def run(
+        self,
+        send: Callable[[], Awaitable[T]],
+        hedge: Optional[Callable[[], Awaitable[T]]] = None,
+        accept: Optional[Callable[[T], bool]] = None,
+    ) -> T:
+        """
+        ``hedge`` sends the second attempt (default: ``send``); callers use it
+        to make the extra request wait for rate limits / admission slots.
+        ``accept`` tells winning results from ones only returned when both
+        attempts fall short.
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        primary = asyncio.ensure_future(send())
+        pending = {primary}
+        error: Optional[BaseException] = None
+        fallback: Optional[Tuple[T]] = None  # finished, but not accepted
+        try:
+            done, _ = await asyncio.wait(pending, timeout=self.delay())
+            if done:
+                result = primary.result()
+                self.latencies.add(loop.time() - started)
+                return result
+
+            self.hedged += 1
+            backup = asyncio.ensure_future((hedge or send)())
+            pending = {primary, backup}
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is not None:
+                        error = task.exception()
+                        continue
+                    result = task.result()
+                    if accept is not None and not accept(result):
+                        fallback = (result,)
+                        continue
+                    self.hedge_wins += task is backup
+                    self.latencies.add(loop.time() - started)
+                    return result
+            if fallback is not None:
+                return fallback[0]
+            assert error is not None
+            raise error
+        finally:
+            # also reached when the caller is cancelled mid-wait
+            pending = {t for t in pending if not t.done()}
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "delay": self.delay(),
+            "samples": len(self.latencies),
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+        }
@@ -1,24 +0,0 @@
-"""Async third‑party API connector – export public interface."""
-
-from .client import APIClient, default_client
-from .exceptions import (
-    APIClientError,
-    AuthenticationError,
-    NotFoundError,
-    RateLimitError,
-    ServerError,
-)
-from .models import Item, ItemPage, TokenResponse
-
-__all__ = [
-    "APIClient",
-    "default_client",
-    "Item",
-    "ItemPage",
-    "TokenResponse",
-    "APIClientError",
-    "AuthenticationError",
-    "NotFoundError",
-    "RateLimitError",
-    "ServerError",
-]
@@ -1,32 +1,198 @@
+import atexit
+import json
 import logging
-from typing import Dict
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Mapping, Optional
 
 _sensitive_headers = {
     "authorization",
     "api-key",
+    "x-api-key",
     "cookie",
     "set-cookie",
 }
+_sensitive_keys = {
+    "access_token",
+    "refresh_token",
+    "id_token",
+    "client_secret",
+    "password",
+    "api_key",
+}
+REDACTED = "***"
+
+"""
+Structured logger with sensitive data redaction.
+
+Records are handed to a QueueHandler and written by a listener thread, so
+formatting, JSON encoding and stream I/O never run on the event loop.
+Redaction is lazy but guaranteed:
+
+• Redacted(...) wraps headers/bodies passed as log args and only redacts
+  when str() is called, i.e. when some handler actually emits the record
+• RedactingFilter on the queue handler wraps any other mapping arg the
+  same way, so text and JSON output are both covered
+• JsonFormatter additionally redacts ``extra`` fields
 
-"""Structured logger with sensitive data redaction."""
+Env: LOG_LEVEL (INFO), LOG_FORMAT (json | text), LOG_SAMPLE_RATE (1.0 –
+fraction of DEBUG records kept).
+"""
 
 
-def redact_headers(headers: Dict[str, str]) -> Dict[str, str]:
+def redact_headers(headers: Mapping[str, str]) -> Dict[str, str]:
     return {
-        k: ("***" if k.lower() in _sensitive_headers else v) for k, v in headers.items()
+        k: (REDACTED if k.lower() in _sensitive_headers else v)
+        for k, v in headers.items()
     }
 
 
-def configure(level: int = logging.INFO) -> logging.Logger:
+def redact(obj: Any) -> Any:
+    """Recursively mask sensitive header names / body keys."""
+    if isinstance(obj, Mapping):
+        return {
+            k: (
+                REDACTED
+                if isinstance(k, str)
+                and (k.lower() in _sensitive_headers or k.lower() in _sensitive_keys)
+                else redact(v)
+            )
+            for k, v in obj.items()
+        }
+    if isinstance(obj, (list, tuple)):
+        return [redact(v) for v in obj]
+    return obj
+
+
+class Redacted:
+    """Log arg that is copied now but redacted/rendered only if emitted."""
+
+    __slots__ = ("_obj",)
+
+    def __init__(self, obj: Any):
+        self._obj = dict(obj) if isinstance(obj, Mapping) else obj
+
+    def __str__(self) -> str:
+        return str(redact(self._obj))
+
+    __repr__ = __str__
+
+
+class JsonFormatter(logging.Formatter):
+    _STANDARD = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+    def format(self, record: logging.LogRecord) -> str:
+        args = record.args
+        if isinstance(args, Mapping):
+            args = redact(args)
+        elif args:
+            args = tuple(redact(a) if isinstance(a, Mapping) else a for a in args)
+        message = record.msg % args if args else str(record.msg)
+        doc: Dict[str, Any] = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": message,
+        }
+        for key, value in vars(record).items():
+            if key not in self._STANDARD and not key.startswith("_"):
+                doc[key] = redact(value)
+        if record.exc_info:
+            doc["exc"] = self.formatException(record.exc_info)
+        return json.dumps(doc, default=str)
+
+
+class RedactingFilter(logging.Filter):
+    """
+    Make mapping args safe to emit whatever the formatter: a lone mapping
+    arg (``%(key)s`` style) is redacted now, mappings inside an args tuple
+    are wrapped in Redacted and only rendered if the record is written.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        args = record.args
+        if isinstance(args, Mapping):
+            record.args = redact(args)
+        elif args:
+            record.args = tuple(
+                Redacted(a) if isinstance(a, Mapping) else a for a in args
+            )
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep one in every ``1 / rate`` records at or below ``max_level``.
+    Counter based – cheap and deterministic; higher levels always pass.
+    """
+
+    def __init__(self, rate: float = 1.0, max_level: int = logging.DEBUG):
+        super().__init__()
+        self.every = max(1, round(1 / rate)) if rate > 0 else 0
+        self.max_level = max_level
+        self._seen = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level:
+            return True
+        if not self.every:
+            return False
+        self._seen += 1
+        return (self._seen - 1) % self.every == 0
+
+
+class _DeferredQueueHandler(QueueHandler):
+    # the stock prepare() formats in the calling thread; leave it to the
+    # listener. Mutable args must be snapshotted by the caller (Redacted does)
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+_listener: Optional[QueueListener] = None
+
+
+def configure(
+    level: Optional[int] = None,
+    *,
+    json_format: Optional[bool] = None,
+    sample_rate: Optional[float] = None,
+) -> logging.Logger:
+    global _listener
     logger = logging.getLogger("connector")
     if logger.handlers:
         return logger  # already configured
-    handler = logging.StreamHandler()
-    fmt = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
-    handler.setFormatter(logging.Formatter(fmt))
+    if level is None:
+        level = logging.getLevelName(os.getenv("LOG_LEVEL", "INFO").upper())
+    if json_format is None:
+        json_format = os.getenv("LOG_FORMAT", "json").lower() == "json"
+    if sample_rate is None:
+        sample_rate = float(os.getenv("LOG_SAMPLE_RATE", "1"))
+
+    stream = logging.StreamHandler()
+    if json_format:
+        stream.setFormatter(JsonFormatter())
+    else:
+        fmt = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
+        stream.setFormatter(logging.Formatter(fmt))
+    handler = _DeferredQueueHandler(queue.SimpleQueue())
+    if sample_rate < 1:
+        handler.addFilter(SamplingFilter(sample_rate))
+    handler.addFilter(RedactingFilter())  # after sampling: skip dropped records
+    _listener = QueueListener(handler.queue, stream, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown)
     logger.addHandler(handler)
     logger.setLevel(level)
     return logger
 
 
+def shutdown() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
 logger = configure()
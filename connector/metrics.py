@@ -0,0 +1,329 @@
+import re
+import time
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .logger import logger
+
+"""
+Built-in instrumentation.
+
+Hot paths call the module-level record_* functions, which fan out to the
+registered MetricsHook objects. By default that is just the in-process
+MetricsRegistry (plain dict counters + fixed-bucket histograms, O(log b)
+per observation), readable via snapshot() or render_prometheus().
+
+Plug in your own backend (StatsD, OpenTelemetry, ...) with add_hook();
+drop the built-in registry with remove_hook(get_registry()).
+"""
+
+# seconds – covers in-process ASGI calls up to slow remote APIs
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+_ID_SEGMENT = re.compile(r"^(\d+|[0-9a-fA-F-]{16,})$")
+
+
+@lru_cache(maxsize=4096)
+def normalize_endpoint(path: str) -> str:
+    """'/items/42?x=1' -> '/items/{id}' so ids don't explode label cardinality."""
+    path = urlsplit(path).path or "/"
+    return "/".join(
+        "{id}" if _ID_SEGMENT.match(seg) else seg for seg in path.split("/")
+    )
+
+
+class MetricsHook:
+    """Instrumentation callbacks; override any subset (all no-ops here)."""
+
+    def on_request(
+        self, method: str, endpoint: str, status: str, latency: float
+    ) -> None:
+        pass
+
+    def on_retry(self, endpoint: str, reason: str) -> None:
+        pass
+
+    def on_token_refresh(self, latency: float, ok: bool) -> None:
+        pass
+
+    def on_pool_wait(self, seconds: float) -> None:
+        pass
+
+    def on_queue_wait(self, seconds: float) -> None:
+        pass
+
+
+class Histogram:
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot = +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-quantile (None if empty)."""
+        if not self.count:
+            return None
+        rank, seen = q * self.count, 0
+        for bound, n in zip(self.buckets, self.counts, strict=False):
+            seen += n
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
+
+
+class MetricsRegistry(MetricsHook):
+    """In-process counters and histograms."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self._buckets = buckets
+        self.reset()
+
+    def reset(self) -> None:
+        self.requests: Dict[Tuple[str, str, str], int] = {}
+        self.latency: Dict[Tuple[str, str], Histogram] = {}
+        self.retries: Dict[Tuple[str, str], int] = {}
+        self.token_refresh = Histogram(self._buckets)
+        self.token_refresh_failures = 0
+        self.pool_wait = Histogram(self._buckets)
+        self.queue_wait = Histogram(self._buckets)
+
+    # ------------- hook implementation -------------
+    def on_request(
+        self, method: str, endpoint: str, status: str, latency: float
+    ) -> None:
+        key = (method, endpoint, status)
+        self.requests[key] = self.requests.get(key, 0) + 1
+        hist = self.latency.get(key[:2])
+        if hist is None:
+            hist = self.latency[key[:2]] = Histogram(self._buckets)
+        hist.observe(latency)
+
+    def on_retry(self, endpoint: str, reason: str) -> None:
+        key = (endpoint, reason)
+        self.retries[key] = self.retries.get(key, 0) + 1
+
+    def on_token_refresh(self, latency: float, ok: bool) -> None:
+        self.token_refresh.observe(latency)
+        if not ok:
+            self.token_refresh_failures += 1
+
+    def on_pool_wait(self, seconds: float) -> None:
+        self.pool_wait.observe(seconds)
+
+    def on_queue_wait(self, seconds: float) -> None:
+        self.queue_wait.observe(seconds)
+
+    # ------------- export -------------
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "requests": {"|".join(k): v for k, v in self.requests.items()},
+            "latency": {"|".join(k): h.snapshot() for k, h in self.latency.items()},
+            "retries": {"|".join(k): v for k, v in self.retries.items()},
+            "token_refresh": self.token_refresh.snapshot(),
+            "token_refresh_failures": self.token_refresh_failures,
+            "pool_wait": self.pool_wait.snapshot(),
+            "queue_wait": self.queue_wait.snapshot(),
+        }
+
+    def render_prometheus(self, prefix: str = "connector") -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        out: List[str] = []
+
+        def counter(name: str, help_: str, labels: Tuple[str, ...], values) -> None:
+            out.append(f"# HELP {prefix}_{name} {help_}")
+            out.append(f"# TYPE {prefix}_{name} counter")
+            for key, value in values.items():
+                lbl = _labels(zip(labels, key, strict=True))
+                out.append(f"{prefix}_{name}{lbl} {value}")
+
+        def histogram(name: str, help_: str, labels: Tuple[str, ...], hists) -> None:
+            out.append(f"# HELP {prefix}_{name} {help_}")
+            out.append(f"# TYPE {prefix}_{name} histogram")
+            for key, h in hists.items():
+                pairs = list(zip(labels, key, strict=True))
+                cumulative = 0
+                bounds = h.buckets + (float("inf"),)
+                for bound, n in zip(bounds, h.counts, strict=True):
+                    cumulative += n
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lbl = _labels(pairs + [("le", le)])
+                    out.append(f"{prefix}_{name}_bucket{lbl} {cumulative}")
+                out.append(f"{prefix}_{name}_sum{_labels(pairs)} {h.sum}")
+                out.append(f"{prefix}_{name}_count{_labels(pairs)} {h.count}")
+
+        counter(
+            "requests_total",
+            "HTTP responses by endpoint and status.",
+            ("method", "endpoint", "status"),
+            self.requests,
+        )
+        histogram(
+            "request_duration_seconds",
+            "Latency of single HTTP attempts.",
+            ("method", "endpoint"),
+            self.latency,
+        )
+        counter(
+            "retries_total",
+            "Retries by endpoint and reason.",
+            ("endpoint", "reason"),
+            self.retries,
+        )
+        histogram(
+            "token_refresh_duration_seconds",
+            "OAuth2 token endpoint latency.",
+            (),
+            {(): self.token_refresh},
+        )
+        counter(
+            "token_refresh_failures_total",
+            "Failed token refreshes.",
+            (),
+            {(): self.token_refresh_failures},
+        )
+        histogram(
+            "pool_wait_seconds",
+            "Time spent waiting for a pooled connection.",
+            (),
+            {(): self.pool_wait},
+        )
+        histogram(
+            "queue_wait_seconds",
+            "Time tasks waited for a gather_limited slot.",
+            (),
+            {(): self.queue_wait},
+        )
+        return "\n".join(out) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(pairs) -> str:
+    body = ",".join(f'{k}="{_escape(str(v))}"' for k, v in pairs)
+    return f"{{{body}}}" if body else ""
+
+
+# ------------- module-level dispatch -------------
+_registry = MetricsRegistry()
+_hooks: List[MetricsHook] = [_registry]
+
+
+def get_registry() -> MetricsRegistry:
+    return _registry
+
+
+def add_hook(hook: MetricsHook) -> None:
+    if hook not in _hooks:
+        _hooks.append(hook)
+
+
+def remove_hook(hook: MetricsHook) -> None:
+    if hook in _hooks:
+        _hooks.remove(hook)
+
+
+def enabled() -> bool:
+    return bool(_hooks)
+
+
+def snapshot() -> Dict[str, Any]:
+    return _registry.snapshot()
+
+
+def render_prometheus(prefix: str = "connector") -> str:
+    return _registry.render_prometheus(prefix)
+
+
+def _emit(name: str, *args: Any) -> None:
+    for hook in _hooks:
+        try:
+            getattr(hook, name)(*args)
+        except Exception:  # a broken exporter must never fail a request
+            logger.debug("Metrics hook %r failed in %s", hook, name, exc_info=True)
+
+
+def record_request(method: str, endpoint: str, status: str, latency: float) -> None:
+    if _hooks:
+        _emit("on_request", method, endpoint, status, latency)
+
+
+def record_retry(endpoint: str, reason: str) -> None:
+    if _hooks:
+        _emit("on_retry", endpoint, reason)
+
+
+def record_token_refresh(latency: float, ok: bool) -> None:
+    if _hooks:
+        _emit("on_token_refresh", latency, ok)
+
+
+def record_pool_wait(seconds: float) -> None:
+    if _hooks:
+        _emit("on_pool_wait", seconds)
+
+
+def record_queue_wait(seconds: float) -> None:
+    if _hooks:
+        _emit("on_queue_wait", seconds)
+
+
+# first httpcore event once a connection has been handed to the request
+_CONNECTION_READY = frozenset(
+    {
+        "connection.connect_tcp.started",
+        "connection.connect_unix_socket.started",
+        "http11.send_request_headers.started",
+        "http2.send_request_headers.started",
+    }
+)
+
+
+def pool_wait_trace() -> Callable[[str, Dict[str, Any]], Awaitable[None]]:
+    """
+    An httpx ``trace`` extension measuring how long a request waited for a
+    pooled connection. Only httpcore transports emit these events; custom
+    transports (ASGI, mocks) simply never call it.
+    """
+    started = time.perf_counter()
+    done = False
+
+    async def trace(event: str, info: Dict[str, Any]) -> None:
+        nonlocal done
+        if not done and event in _CONNECTION_READY:
+            done = True
+            record_pool_wait(time.perf_counter() - started)
+
+    return trace
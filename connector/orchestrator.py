@@ -0,0 +1,319 @@
+import asyncio
+import time
+from collections import deque
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+from .base import BaseConnector
+from .config import get_settings
+from .logger import logger
+from .registry import get_connector
+
+"""
+Run many connectors side by side under one global in-flight budget.
+
+Every HTTP attempt of an attached connector takes a slot from a shared
+FairScheduler before it is sent. Free slots go to the highest priority
+provider with requests waiting; providers of equal priority share them in
+proportion to their weight (stride scheduling), so a heavy provider can use
+the whole budget when it is alone but cannot starve the others. Each
+connector still applies its own ``concurrency_limit`` on top.
+"""
+
+
+class _Flow:
+    __slots__ = (
+        "name",
+        "weight",
+        "priority",
+        "waiters",
+        "pass_",
+        "in_flight",
+        "granted",
+        "wait_time",
+    )
+
+    def __init__(self, name: str, weight: float, priority: int):
+        if weight <= 0:
+            raise ValueError("weight must be > 0")
+        self.name = name
+        self.weight = weight
+        self.priority = priority
+        self.waiters: Deque["asyncio.Future[None]"] = deque()
+        self.pass_ = 0.0  # virtual time of this flow's next grant
+        self.in_flight = 0
+        self.granted = 0
+        self.wait_time = 0.0
+
+
+class FairScheduler:
+    """Global slot budget shared by weighted, prioritised flows."""
+
+    def __init__(self, budget: int):
+        if budget < 1:
+            raise ValueError("budget must be >= 1")
+        self.budget = budget
+        self._in_flight = 0
+        self._waiting = 0
+        self._vtime = 0.0
+        self._flows: Dict[str, _Flow] = {}
+
+    def register(
+        self, name: str, *, weight: float = 1.0, priority: int = 0
+    ) -> "FlowGate":
+        """Add (or re-weight) a flow; higher ``priority`` is served first."""
+        flow = self._flows.get(name)
+        if flow is None:
+            self._flows[name] = _Flow(name, weight, priority)
+        else:
+            if weight <= 0:
+                raise ValueError("weight must be > 0")
+            flow.weight, flow.priority = weight, priority
+        return FlowGate(self, name)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def granted(self, name: str) -> int:
+        """Slots handed to ``name`` so far."""
+        return self._flows[name].granted
+
+    # ------------- slot protocol -------------
+    async def acquire(self, name: str) -> None:
+        flow = self._flows[name]
+        if self._in_flight < self.budget and not self._waiting:
+            self._grant(flow)
+            return
+        fut = asyncio.get_running_loop().create_future()
+        flow.waiters.append(fut)
+        self._waiting += 1
+        started = time.monotonic()
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                self.release(name)  # granted just as we got cancelled
+            else:
+                self._forget(flow, fut)
+            raise
+        flow.wait_time += time.monotonic() - started
+
+    def release(self, name: str) -> None:
+        flow = self._flows[name]
+        flow.in_flight -= 1
+        self._in_flight -= 1
+        self._dispatch()
+
+    # ------------- scheduling -------------
+    def _grant(self, flow: _Flow) -> None:
+        # an idle flow restarts at the current virtual time: no banked credit
+        start = max(flow.pass_, self._vtime)
+        self._vtime = start
+        flow.pass_ = start + 1 / flow.weight
+        flow.in_flight += 1
+        flow.granted += 1
+        self._in_flight += 1
+
+    def _forget(self, flow: _Flow, fut: "asyncio.Future[None]") -> None:
+        try:
+            flow.waiters.remove(fut)
+        except ValueError:
+            return
+        self._waiting -= 1
+
+    def _next(self) -> Optional[_Flow]:
+        best: Optional[_Flow] = None
+        for flow in self._flows.values():
+            if not flow.waiters:
+                continue
+            if best is None or (-flow.priority, max(flow.pass_, self._vtime)) < (
+                -best.priority,
+                max(best.pass_, self._vtime),
+            ):
+                best = flow
+        return best
+
+    def _dispatch(self) -> None:
+        while self._in_flight < self.budget and self._waiting:
+            flow = self._next()
+            if flow is None:
+                break
+            fut = flow.waiters.popleft()
+            self._waiting -= 1
+            self._grant(flow)
+            fut.set_result(None)
+
+    # ------------- monitoring -------------
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "budget": self.budget,
+            "in_flight": self._in_flight,
+            "waiting": self._waiting,
+            "flows": {
+                f.name: {
+                    "weight": f.weight,
+                    "priority": f.priority,
+                    "in_flight": f.in_flight,
+                    "waiting": len(f.waiters),
+                    "granted": f.granted,
+                    "wait_time": f.wait_time,
+                }
+                for f in self._flows.values()
+            },
+        }
+
+
+class FlowGate:
+    """One flow's view of a FairScheduler (acquire/release like a semaphore)."""
+
+    __slots__ = ("_scheduler", "name")
+
+    def __init__(self, scheduler: FairScheduler, name: str):
+        self._scheduler = scheduler
+        self.name = name
+
+    async def acquire(self) -> None:
+        await self._scheduler.acquire(self.name)
+
+    def release(self) -> None:
+        self._scheduler.release(self.name)
+
+    async def __aenter__(self) -> "FlowGate":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        self.release()
+
+
+class ProviderResult(NamedTuple):
+    provider: str
+    value: Any  # None when the call failed
+    error: Optional[BaseException]
+    elapsed: float  # seconds
+    requests: int  # HTTP attempts admitted by the scheduler
+    records: Optional[int]  # len(value) when it is sized
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.requests / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def records_per_second(self) -> Optional[float]:
+        if self.records is None:
+            return None
+        return self.records / self.elapsed if self.elapsed else 0.0
+
+
+Call = Union[str, Callable[[BaseConnector], Awaitable[Any]]]
+
+
+class Orchestrator:
+    """
+    Fan one call out over many connectors under a shared request budget.
+
+        orch = Orchestrator(budget=20)
+        orch.add_registered("sim", weight=2)
+        orch.add("crm", CrmConnector(), priority=1)
+        results = await orch.run("list_users")
+    """
+
+    def __init__(self, budget: Optional[int] = None):
+        self.scheduler = FairScheduler(budget or get_settings().global_concurrency_limit)
+        self._connectors: Dict[str, BaseConnector] = {}
+        self._owned: set = set()
+
+    def add(
+        self,
+        name: str,
+        connector: BaseConnector,
+        *,
+        weight: float = 1.0,
+        priority: int = 0,
+    ) -> BaseConnector:
+        """Attach an existing connector; its requests now use the budget."""
+        connector.use_scheduler(
+            self.scheduler.register(name, weight=weight, priority=priority)
+        )
+        self._connectors[name] = connector
+        return connector
+
+    def add_registered(
+        self, name: str, *, weight: float = 1.0, priority: int = 0, **kw: Any
+    ) -> BaseConnector:
+        """Build the registry's connector ``name`` (kw → its constructor)."""
+        connector = get_connector(name)(**kw)
+        self.add(name, connector, weight=weight, priority=priority)
+        self._owned.add(name)  # only once it exists: aclose() closes owned ones
+        return connector
+
+    @property
+    def providers(self) -> Iterable[str]:
+        return self._connectors.keys()
+
+    async def run(
+        self, call: Call, *args: Any, providers: Optional[Iterable[str]] = None, **kw
+    ) -> Dict[str, ProviderResult]:
+        """
+        Run ``call`` (a method name, or ``fn(connector) -> awaitable``) on
+        every provider concurrently. Failures are returned, not raised.
+        """
+        names = list(self._connectors if providers is None else providers)
+        results = await asyncio.gather(
+            *(self._run_one(n, call, args, kw) for n in names)
+        )
+        return dict(zip(names, results, strict=True))
+
+    async def _run_one(
+        self, name: str, call: Call, args: tuple, kw: Dict[str, Any]
+    ) -> ProviderResult:
+        connector = self._connectors[name]
+        granted = self.scheduler.granted(name)
+        started = time.perf_counter()
+        value: Any = None
+        error: Optional[BaseException] = None
+        try:
+            if isinstance(call, str):
+                value = await getattr(connector, call)(*args, **kw)
+            else:
+                value = await call(connector)
+        except Exception as exc:
+            error = exc
+            logger.warning("Orchestrated call failed for %s: %s", name, exc)
+        elapsed = time.perf_counter() - started
+        try:
+            records: Optional[int] = None if error else len(value)
+        except TypeError:
+            records = None
+        return ProviderResult(
+            name, value, error, elapsed, self.scheduler.granted(name) - granted, records
+        )
+
+    def snapshot(self) -> Dict[str, Any]:
+        return self.scheduler.snapshot()
+
+    async def aclose(self) -> None:
+        """Close the connectors this orchestrator built itself."""
+        for name in self._owned:
+            await self._connectors[name].close()
+        self._owned.clear()
+
+    async def __aenter__(self) -> "Orchestrator":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.aclose()
@@ -0,0 +1,177 @@
+import asyncio
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Tuple
+
+from .logger import logger
+
+"""
+Client-side rate limiting shared by every coroutine talking to a provider.
+
+A token bucket paces requests *before* they reach the server. The bucket is
+fed by the provider's own hints:
+
+• Retry-After           -> everybody pauses until the given time
+• X-RateLimit-Remaining -> remaining quota is spread evenly until …
+• X-RateLimit-Reset     -> … the window resets (delta or epoch seconds)
+"""
+
+_EPOCH_THRESHOLD = 1_000_000_000  # larger reset values are unix timestamps
+MAX_WAIT = 3600.0  # cap on server-requested waits ("inf", far-future dates)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return _clamp(float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return _clamp(when.timestamp() - time.time())
+
+
+def _clamp(seconds: float) -> float:
+    if seconds != seconds:  # NaN
+        return 0.0
+    return min(MAX_WAIT, max(0.0, seconds))
+
+
+def _parse_reset(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        reset = float(value)
+    except ValueError:
+        return None
+    if reset > _EPOCH_THRESHOLD:
+        reset -= time.time()
+    return _clamp(reset)
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: int = 10,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ):
+        self._clock = clock
+        self._sleep = sleep
+        self.rate = rate  # configured requests/sec; None = unlimited
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._paused_until = 0.0
+        # server-advertised budget: (requests/sec, valid until)
+        self._hint: Optional[Tuple[float, float]] = None
+
+    def _effective_rate(self, now: float) -> Optional[float]:
+        rate = self.rate
+        if self._hint is not None:
+            hint_rate, until = self._hint
+            if now < until:
+                rate = hint_rate if rate is None else min(rate, hint_rate)
+            else:
+                self._hint = None
+        return rate
+
+    @property
+    def paused_for(self) -> float:
+        return max(0.0, self._paused_until - self._clock())
+
+    async def wait_unpaused(self) -> None:
+        """Wait out any pause without taking a token."""
+        while True:
+            now = self._clock()
+            if now >= self._paused_until:
+                return
+            await self._sleep(self._paused_until - now)
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        while True:
+            now = self._clock()
+            if now < self._paused_until:
+                await self._sleep(self._paused_until - now)
+                continue
+            rate = self._effective_rate(now)
+            if rate is None:
+                return
+            self._tokens = min(
+                float(self.burst), self._tokens + (now - self._updated) * rate
+            )
+            self._updated = now
+            if self._tokens >= 1 - 1e-9:  # float refill can land a hair short
+                self._tokens -= 1
+                return
+            await self._sleep((1 - self._tokens) / rate)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back *all* callers for ``seconds`` (extends, never shortens)."""
+        until = self._clock() + seconds
+        if until > self._paused_until:
+            self._paused_until = until
+
+    def observe(self, headers: Mapping[str, str]) -> Optional[float]:
+        """
+        Update pacing from response headers.
+        Returns the Retry-After delay when the server sent one.
+        """
+        retry_after = parse_retry_after(headers.get("retry-after"))
+        remaining = headers.get("x-ratelimit-remaining")
+        reset = _parse_reset(headers.get("x-ratelimit-reset"))
+        if remaining is not None and reset is not None:
+            try:
+                left = max(0, int(float(remaining)))
+            except ValueError:
+                left = None
+            if left == 0:
+                self.pause(reset)
+            elif left is not None and reset > 0:
+                now = self._clock()
+                fresh = self._hint is None or now >= self._hint[1]
+                self._hint = (left / reset, now + reset)
+                # the bucket may have filled at the configured (or no) rate;
+                # never let it hold more than the server says is left
+                if fresh:
+                    self._tokens = float(min(self.burst, left))
+                    self._updated = now
+                else:
+                    self._tokens = min(self._tokens, float(left))
+        return retry_after
+
+
+_LIMITERS: Dict[Tuple[str, str], RateLimiter] = {}
+
+
+def get_rate_limiter(
+    provider: str, base_url: str, rate: Optional[float] = None, burst: int = 10
+) -> RateLimiter:
+    """
+    One limiter per provider/base_url, shared by every APIClient. The first
+    caller's rate and burst win; later callers asking for others get a warning.
+    """
+    key = (provider, base_url)
+    limiter = _LIMITERS.get(key)
+    if limiter is None:
+        limiter = _LIMITERS[key] = RateLimiter(rate, burst)
+        logger.debug("Rate limiter created for %s (%s rps)", base_url, rate)
+    elif (limiter.rate, limiter.burst) != (rate, max(1, burst)):
+        logger.warning(
+            "Rate limiter for %s already exists (%s rps, burst %s); "
+            "ignoring %s rps, burst %s",
+            base_url,
+            limiter.rate,
+            limiter.burst,
+            rate,
+            burst,
+        )
+    return limiter
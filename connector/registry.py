@@ -1,22 +1,123 @@
+import json
+import os
+import sys
 from importlib import import_module
-from typing import Dict, Type
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type
 
-from connector.base import BaseConnector
+if TYPE_CHECKING:
+    from connector.base import BaseConnector
+
+"""
+Connector lookup: built-in ``_PLUGINS`` plus entry points.
+
+Third-party packages register adapters under the ``connector.plugins``
+entry-point group:
+
+    [project.entry-points."connector.plugins"]
+    twitter = "acme_connectors.twitter:TwitterConnector"
+
+Scanning installed distributions (and importing importlib.metadata) costs
+tens of milliseconds, so the result is kept in an on-disk index. The index
+is only rebuilt when the fingerprint of ``sys.path`` changes (its entries
+and their directory mtimes, which move on every install/uninstall).
+Importing this module loads neither httpx nor pydantic. They are imported
+only when get_connector() resolves a class.
+"""
+
+ENTRY_POINT_GROUP = "connector.plugins"
 
 _PLUGINS: Dict[str, str] = {
     # logical-name → dotted-path where class lives
     "sim": "connectors.sim.SimConnector",
-    # add new connectors here, or load from entry-points later
+    # add new connectors here, via register(), or as entry points
 }
 
+_discovered: Optional[Dict[str, str]] = None
+
+
+def _index_path() -> Path:
+    path = os.getenv("CONNECTOR_PLUGIN_INDEX")
+    if path:
+        return Path(path)
+    cache = os.getenv("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache")
+    return Path(cache) / "async-api-connector" / "plugins.json"
+
+
+def _fingerprint() -> List[Any]:
+    fingerprint: List[Any] = []
+    for entry in sys.path:
+        try:
+            fingerprint.append([entry, os.stat(entry or ".").st_mtime_ns])
+        except OSError:
+            fingerprint.append([entry, None])
+    return fingerprint
+
+
+def _scan() -> Dict[str, str]:
+    from importlib.metadata import entry_points
+
+    return {ep.name: ep.value for ep in entry_points(group=ENTRY_POINT_GROUP)}
 
-def get_connector(name: str) -> Type[BaseConnector]:
+
+def _load_index(fingerprint: List[Any]) -> Optional[Dict[str, str]]:
+    try:
+        data = json.loads(_index_path().read_text())
+    except (OSError, ValueError):
+        return None
+    if data.get("fingerprint") != fingerprint:
+        return None
+    return data.get("plugins")
+
+
+def _save_index(fingerprint: List[Any], plugins: Dict[str, str]) -> None:
+    path = _index_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"fingerprint": fingerprint, "plugins": plugins}))
+        os.replace(tmp, path)
+    except OSError:
+        pass  # read-only image: discovery still works, just uncached
+
+
+def discovered_plugins(refresh: bool = False) -> Dict[str, str]:
+    """Entry-point connectors (name → "module:Class"), via the cached index."""
+    global _discovered
+    if _discovered is None or refresh:
+        fingerprint = _fingerprint()
+        plugins = None if refresh else _load_index(fingerprint)
+        if plugins is None:
+            plugins = _scan()
+            _save_index(fingerprint, plugins)
+        _discovered = plugins
+    return _discovered
+
+
+def available_connectors() -> Dict[str, str]:
+    """Every known connector; explicit ``_PLUGINS`` entries win."""
+    return {**discovered_plugins(), **_PLUGINS}
+
+
+def register(name: str, target: str) -> None:
+    """Register a connector at runtime ("pkg.mod.Class" or "pkg.mod:Class")."""
+    _PLUGINS[name] = target
+
+
+def get_connector(name: str) -> Type["BaseConnector"]:
     """
     Dynamically import & return the connector class without
     hard-coding provider imports in application code.
     """
-    dotted = _PLUGINS[name]
-    mod_path, cls_name = dotted.rsplit(".", 1)
+    from connector.base import BaseConnector
+
+    dotted = _PLUGINS.get(name) or discovered_plugins().get(name)
+    if dotted is None:
+        raise KeyError(name)
+    if ":" in dotted:
+        mod_path, cls_name = dotted.split(":", 1)
+    else:
+        mod_path, cls_name = dotted.rsplit(".", 1)
     cls = getattr(import_module(mod_path), cls_name)
     if not issubclass(cls, BaseConnector):
         raise TypeError(f"{cls_name} is not a BaseConnector")
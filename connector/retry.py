@@ -0,0 +1,129 @@
+import random
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+
+"""
+Retry engine used by APIClient._request().
+
+• RetryPolicy  – how many attempts, how long to wait (Retry-After first,
+                 otherwise decorrelated jitter), how many 401 refreshes
+• RetryBudget  – caps retry amplification: retries may not exceed `ratio`
+                 of requests plus a small steady trickle
+• Deadline     – an overall time budget for one call, propagated into the
+                 httpx timeouts of every attempt
+
+Sub-class RetryPolicy and pass it as APIClient(retry_policy=...) to plug in
+a different strategy.
+"""
+
+
+class RetryBudget:
+    def __init__(
+        self, ratio: float = 0.2, min_per_second: float = 1.0, burst: float = 10.0
+    ):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.burst = burst
+        self._balance = burst
+        self._updated = time.monotonic()
+        self.requests = 0
+        self.retries = 0
+        self.denied = 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._balance = min(
+            self.burst, self._balance + (now - self._updated) * self.min_per_second
+        )
+        self._updated = now
+
+    def record_request(self) -> None:
+        self.requests += 1
+        self._refill()
+        self._balance = min(self.burst, self._balance + self.ratio)
+
+    def try_retry(self) -> bool:
+        self._refill()
+        if self._balance >= 1.0:
+            self._balance -= 1.0
+            self.retries += 1
+            return True
+        self.denied += 1
+        return False
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "denied": self.denied,
+            "balance": round(self._balance, 3),
+        }
+
+
+class Deadline:
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def clamp(self, timeout: httpx.Timeout) -> httpx.Timeout:
+        """Shrink every phase of ``timeout`` to what is left of the budget."""
+        left = self.remaining()
+
+        def _cap(value: Optional[float]) -> float:
+            return left if value is None else min(value, left)
+
+        return httpx.Timeout(
+            connect=_cap(timeout.connect),
+            read=_cap(timeout.read),
+            write=_cap(timeout.write),
+            pool=_cap(timeout.pool),
+        )
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        *,
+        max_auth_refreshes: int = 1,
+        budget: Optional[RetryBudget] = None,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_auth_refreshes = max_auth_refreshes
+        self.budget = budget
+
+    def record_request(self) -> None:
+        if self.budget is not None:
+            self.budget.record_request()
+
+    def can_retry(self, attempt: int) -> bool:
+        """``attempt`` attempts have failed – may we make another one?"""
+        if attempt >= self.max_attempts:
+            return False
+        return self.budget is None or self.budget.try_retry()
+
+    def backoff(
+        self, attempt: int, previous: float, retry_after: Optional[float] = None
+    ) -> float:
+        """
+        Delay before the next attempt. A server-sent Retry-After wins (up to
+        ``max_delay``); otherwise decorrelated jitter: uniform(base,
+        previous * 3), capped.
+        """
+        if retry_after is not None:
+            return min(self.max_delay, retry_after)
+        previous = max(previous, self.base_delay)
+        return min(self.max_delay, random.uniform(self.base_delay, previous * 3))
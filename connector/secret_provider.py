@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import abc
+import asyncio
 import os
 import pathlib
+import time
+from typing import Dict, Optional, Tuple
 
 """
 SecretProvider abstraction + two concrete back-ends:
@@ -11,6 +14,8 @@ SecretProvider abstraction + two concrete back-ends:
 • FileProvider -> reads Docker secrets from /run/secrets/<name>
                  (works with docker-compose secrets & Docker Swarm if there is need for change)
 
+CachingSecretProvider wraps either one so token refreshes normally don't
+touch the backend at all (see its docstring for the invalidation rules).
 """
 
 
@@ -19,6 +24,10 @@ class SecretProvider(abc.ABC):
     async def get(self, name: str) -> str:
         ...
 
+    async def version(self, name: str) -> Optional[float]:
+        """Cheap change marker (e.g. file mtime); None if not supported."""
+        return None
+
 
 class EnvProvider(SecretProvider):
     async def get(self, name: str) -> str:
@@ -29,7 +38,74 @@ class FileProvider(SecretProvider):
     _BASE = pathlib.Path(os.getenv("DOCKER_SECRETS_DIR", "/run/secrets"))
 
     async def get(self, name: str) -> str:
-        path = self._BASE / name
-        if not path.exists():
-            raise FileNotFoundError(f"Docker secret {name!r} not found in {self._BASE}")
-        return path.read_text().strip()
+        # file I/O runs in a worker thread – never on the event loop
+        return await asyncio.to_thread(self._read, self._BASE / name)
+
+    async def version(self, name: str) -> Optional[float]:
+        return await asyncio.to_thread(self._mtime, self._BASE / name)
+
+    def _read(self, path: pathlib.Path) -> str:
+        try:
+            return path.read_text().strip()
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Docker secret {path.name!r} not found in {self._BASE}"
+            ) from None
+
+    @staticmethod
+    def _mtime(path: pathlib.Path) -> Optional[float]:
+        try:
+            return path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+
+
+class CachingSecretProvider(SecretProvider):
+    """
+    Memoizes another provider's secrets.
+
+    • within ``ttl`` seconds of a read the cached value is returned as is
+    • after that the backend's version() (file mtime) is checked and the
+      secret is only re-read when it changed – rotation is picked up
+      within ``ttl`` without re-reading unchanged files
+    • invalidate() forces the next get() to re-read (e.g. after the token
+      endpoint rejected the credentials)
+    • concurrent misses for one name share a single backend read
+    """
+
+    def __init__(self, inner: SecretProvider, ttl: float = 300.0):
+        self.inner = inner
+        self.ttl = ttl
+        # name -> (value, checked_at, version)
+        self._cache: Dict[str, Tuple[str, float, Optional[float]]] = {}
+        self._loading: Dict[str, "asyncio.Future[str]"] = {}
+
+    async def get(self, name: str) -> str:
+        entry = self._cache.get(name)
+        if entry is not None and time.monotonic() - entry[1] < self.ttl:
+            return entry[0]
+        fut = self._loading.get(name)
+        if fut is None:
+            fut = self._loading[name] = asyncio.ensure_future(self._load(name, entry))
+            fut.add_done_callback(lambda _: self._loading.pop(name, None))
+        return await asyncio.shield(fut)
+
+    async def _load(
+        self, name: str, entry: Optional[Tuple[str, float, Optional[float]]]
+    ) -> str:
+        version = await self.inner.version(name)
+        if entry is not None and version is not None and version == entry[2]:
+            value = entry[0]  # unchanged on disk – just extend the TTL
+        else:
+            value = await self.inner.get(name)
+        self._cache[name] = (value, time.monotonic(), version)
+        return value
+
+    async def version(self, name: str) -> Optional[float]:
+        return await self.inner.version(name)
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        if name is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(name, None)
@@ -0,0 +1,256 @@
+import asyncio
+import inspect
+import multiprocessing as mp
+import os
+import queue
+import time
+from importlib import import_module
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from .exceptions import ShardingError
+from .logger import logger
+
+"""
+Shard multi-tenant syncs across worker processes.
+
+One event loop saturates a core on JSON decoding and model building long
+before the network is busy. ShardedRunner starts ``workers`` processes
+(spawned, so no inherited event loop or logging thread), each with its own
+loop, connectors and token cache. Tenants are handed out through a shared
+task queue, so a slow tenant never holds back a whole shard.
+
+Workers send records back in batches as plain dicts (cheap to pickle and
+JSON-ready) through a bounded result queue. When the consumer falls
+behind, workers block on put() instead of buffering without limit.
+"""
+
+_POLL = 0.5  # s between result-queue polls while checking worker liveness
+
+
+class Tenant(NamedTuple):
+    name: str
+    connector: str = "sim"  # registry name (connector.registry)
+    call: str = "iter_users"  # async-iterator or coroutine method
+    kwargs: Optional[Dict[str, Any]] = None  # passed to ``call``
+    options: Optional[Dict[str, Any]] = None  # connector constructor kwargs
+    app: Optional[str] = None  # "module:attr" ASGI app served in-process
+
+
+class Batch(NamedTuple):
+    tenant: str
+    records: List[Any]
+
+
+class TenantDone(NamedTuple):
+    tenant: str
+    worker: int
+    records: int
+    elapsed: float
+    error: Optional[str]  # repr of the failure, None on success
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _plain(record: Any) -> Any:
+    dump = getattr(record, "model_dump", None)
+    return dump(mode="json") if dump is not None else record
+
+
+async def _records(result: Any) -> AsyncIterator[Any]:
+    """Records of a call result: async iterator, awaitable list or one object."""
+    if inspect.isawaitable(result):
+        result = await result
+        if not isinstance(result, (list, tuple)):
+            result = [result]
+    if hasattr(result, "__aiter__"):
+        async for record in result:
+            yield record
+    else:
+        for record in result:
+            yield record
+
+
+# ------------- worker process -------------
+def _worker_main(
+    worker: int,
+    tasks: "mp.Queue[Optional[Tenant]]",
+    results: "mp.Queue[Any]",
+    env: Dict[str, str],
+    batch_size: int,
+    tenants_per_worker: int,
+) -> None:
+    os.environ.update(env)  # before any Settings / SimConfig is built
+    asyncio.run(_serve(worker, tasks, results, batch_size, tenants_per_worker))
+
+
+async def _serve(
+    worker: int,
+    tasks: "mp.Queue[Optional[Tenant]]",
+    results: "mp.Queue[Any]",
+    batch_size: int,
+    tenants_per_worker: int,
+) -> None:
+    from .registry import get_connector
+
+    # one connector (and so one token) per distinct tenant configuration
+    clients: Dict[Tuple[str, str, Optional[str]], Any] = {}
+
+    def _client(tenant: Tenant) -> Any:
+        key = (tenant.connector, repr(sorted((tenant.options or {}).items())), tenant.app)
+        client = clients.get(key)
+        if client is None:
+            kw = dict(tenant.options or {})
+            if tenant.app:
+                from httpx import ASGITransport
+
+                module, attr = tenant.app.split(":", 1)
+                kw["transport"] = ASGITransport(app=getattr(import_module(module), attr))
+            client = clients[key] = get_connector(tenant.connector)(**kw)
+        return client
+
+    async def _put(message: Any) -> None:
+        # blocking put off the loop: back-pressure without stalling other tenants
+        await asyncio.to_thread(results.put, message)
+
+    async def _sync(tenant: Tenant) -> None:
+        started = time.perf_counter()
+        count, batch, error = 0, [], None
+        try:
+            result = getattr(_client(tenant), tenant.call)(**(tenant.kwargs or {}))
+            async for record in _records(result):
+                batch.append(_plain(record))
+                if len(batch) >= batch_size:
+                    await _put(Batch(tenant.name, batch))
+                    count, batch = count + len(batch), []
+            if batch:
+                await _put(Batch(tenant.name, batch))
+                count += len(batch)
+        except Exception as exc:
+            error = repr(exc)
+        elapsed = time.perf_counter() - started
+        await _put(TenantDone(tenant.name, worker, count, elapsed, error))
+
+    running: set = set()
+    try:
+        while True:
+            tenant = await asyncio.to_thread(tasks.get)
+            if tenant is None:
+                break
+            if len(running) >= tenants_per_worker:
+                _, running = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+            running.add(asyncio.ensure_future(_sync(tenant)))
+        if running:
+            await asyncio.wait(running)
+    finally:
+        for client in clients.values():
+            await client.close()
+
+
+# ------------- parent -------------
+def _reap(procs: List[Any], terminate: bool) -> None:
+    for proc in procs:
+        if terminate:
+            proc.terminate()
+        proc.join(timeout=5)
+
+
+class ShardedRunner:
+    """
+    Fan tenants out over a process pool and stream their records back.
+
+        runner = ShardedRunner(tenants, workers=4)
+        async for msg in runner.stream():   # Batch | TenantDone
+            ...
+    """
+
+    def __init__(
+        self,
+        tenants: Iterable[Tenant],
+        *,
+        workers: Optional[int] = None,
+        tenants_per_worker: int = 4,
+        batch_size: int = 500,
+        queue_size: int = 64,
+        env: Optional[Dict[str, str]] = None,
+    ):
+        self.tenants = list(tenants)
+        self.workers = max(1, min(workers or os.cpu_count() or 1, len(self.tenants)))
+        self.tenants_per_worker = tenants_per_worker
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.env = dict(env or {})
+
+    async def stream(self) -> AsyncIterator[Any]:
+        """Yield Batch and TenantDone messages in arrival order."""
+        if not self.tenants:
+            return
+        ctx = mp.get_context("spawn")
+        tasks: "mp.Queue[Optional[Tenant]]" = ctx.Queue()
+        results: "mp.Queue[Any]" = ctx.Queue(maxsize=self.queue_size)
+        for tenant in self.tenants:
+            tasks.put(tenant)
+        for _ in range(self.workers):
+            tasks.put(None)
+        procs = [
+            ctx.Process(
+                target=_worker_main,
+                args=(
+                    n,
+                    tasks,
+                    results,
+                    self.env,
+                    self.batch_size,
+                    self.tenants_per_worker,
+                ),
+                daemon=True,
+            )
+            for n in range(self.workers)
+        ]
+        for proc in procs:
+            proc.start()
+        pending = len(self.tenants)
+        try:
+            while pending:
+                try:
+                    message = await asyncio.to_thread(results.get, True, _POLL)
+                except queue.Empty:
+                    if not any(p.is_alive() for p in procs):
+                        codes = [p.exitcode for p in procs]
+                        raise ShardingError(
+                            f"workers exited (codes {codes}) with {pending} "
+                            "tenant(s) unfinished"
+                        ) from None
+                    continue
+                if isinstance(message, TenantDone):
+                    pending -= 1
+                    if message.error:
+                        logger.warning(
+                            "Tenant %s failed: %s", message.tenant, message.error
+                        )
+                yield message
+        finally:
+            # joining can take seconds: keep it off the event loop
+            await asyncio.to_thread(_reap, procs, bool(pending))
+            tasks.close()
+            results.close()
+
+    async def run(self) -> Dict[str, TenantDone]:
+        """Drain the stream, discarding records; returns per-tenant summaries."""
+        done: Dict[str, TenantDone] = {}
+        async for message in self.stream():
+            if isinstance(message, TenantDone):
+                done[message.tenant] = message
+        return done
@@ -0,0 +1,39 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+"""
+Single-flight call de-duplication.
+
+Concurrent callers asking for the same key share one in-flight call and its
+result (or exception). Nothing is remembered once the call finishes – this is
+not a cache.
+"""
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, "asyncio.Future"] = {}
+        self.shared = 0  # callers that piggy-backed on an in-flight call
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        fut = self._calls.get(key)
+        if fut is None:
+            fut = asyncio.ensure_future(fn())
+            self._calls[key] = fut
+            fut.add_done_callback(lambda f: self._forget(key, f))
+        else:
+            self.shared += 1
+        # shield: one waiter being cancelled must not cancel the others' call
+        return await asyncio.shield(fut)
+
+    def _forget(self, key: Hashable, fut: "asyncio.Future") -> None:
+        if self._calls.get(key) is fut:
+            del self._calls[key]
+        if not fut.cancelled():
+            fut.exception()  # mark retrieved even if every waiter went away
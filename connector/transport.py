@@ -0,0 +1,123 @@
+import asyncio
+from importlib.util import find_spec
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+from .config import Settings
+from .logger import logger
+
+"""
+Pooled HTTP transports shared across APIClient / BaseConnector instances.
+
+One httpx.AsyncClient (and therefore one connection pool and one set of
+TLS sessions) exists per (event loop, base_url, transport settings).
+Connections are bound to the loop that opened them, so clients created in
+another loop (a second asyncio.run(), a worker thread) get their own pool.
+Clients are reference-counted and closed when the last user releases them.
+"""
+
+_Key = Tuple[Any, ...]
+
+
+def build_timeout(s: Settings) -> httpx.Timeout:
+    return httpx.Timeout(
+        connect=s.connect_timeout,
+        read=s.read_timeout,
+        write=s.write_timeout,
+        pool=s.pool_timeout,
+    )
+
+
+def build_limits(s: Settings) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=s.http_max_connections,
+        max_keepalive_connections=s.http_max_keepalive,
+        keepalive_expiry=s.http_keepalive_expiry,
+    )
+
+
+def _http2_available(wanted: bool) -> bool:
+    if wanted and find_spec("h2") is None:
+        logger.warning("HTTP/2 requested but 'h2' is not installed – using HTTP/1.1")
+        return False
+    return wanted
+
+
+class TransportManager:
+    def __init__(self) -> None:
+        self._clients: Dict[_Key, httpx.AsyncClient] = {}
+        self._refs: Dict[int, int] = {}  # id(client) → users
+        self._keys: Dict[int, _Key] = {}
+
+    @staticmethod
+    def _key(base_url: str, s: Settings) -> _Key:
+        try:
+            loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None  # built outside a loop; bound on first request
+        return (
+            loop,
+            base_url,
+            s.http_max_connections,
+            s.http_max_keepalive,
+            s.http_keepalive_expiry,
+            s.http2,
+            s.connect_timeout,
+            s.read_timeout,
+            s.write_timeout,
+            s.pool_timeout,
+        )
+
+    def acquire(self, base_url: str, s: Settings) -> httpx.AsyncClient:
+        key = self._key(base_url, s)
+        client = self._clients.get(key)
+        loop = key[0]
+        if (
+            client is None
+            or client.is_closed
+            or (loop is not None and loop.is_closed())
+        ):
+            client = httpx.AsyncClient(
+                base_url=base_url,
+                timeout=build_timeout(s),
+                limits=build_limits(s),
+                http2=_http2_available(s.http2),
+            )
+            self._clients[key] = client
+            self._refs[id(client)] = 0
+            self._keys[id(client)] = key
+            logger.debug("Opened shared HTTP pool for %s", base_url)
+        self._refs[id(client)] += 1
+        return client
+
+    async def release(self, client: httpx.AsyncClient) -> None:
+        cid = id(client)
+        if cid not in self._refs:
+            return
+        self._refs[cid] -= 1
+        if self._refs[cid] > 0:
+            return
+        del self._refs[cid]
+        key = self._keys.pop(cid)
+        if self._clients.get(key) is client:
+            del self._clients[key]
+        await client.aclose()
+        logger.debug("Closed shared HTTP pool for %s", key[1])
+
+    def users(self, client: httpx.AsyncClient) -> int:
+        return self._refs.get(id(client), 0)
+
+    def stats(self) -> Dict[_Key, int]:
+        """Users per pool, keyed like the pools themselves."""
+        return {key: self._refs[id(c)] for key, c in self._clients.items()}
+
+
+_manager: Optional[TransportManager] = None
+
+
+def get_transport_manager() -> TransportManager:
+    global _manager
+    if _manager is None:
+        _manager = TransportManager()
+    return _manager
@@ -1,13 +1,201 @@
 import asyncio
-from typing import Any, Awaitable, Iterable, List
+import inspect
+import time
+from collections import deque
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
+from . import metrics
+from .concurrency import AdaptiveLimiter
+from .config import get_settings
 
-async def gather_limited(coros: Iterable[Awaitable[Any]], limit: int) -> List[Any]:
-    """Run coroutines concurrently with a concurrency limit."""
-    semaphore = asyncio.Semaphore(limit)
+T = TypeVar("T")
 
-    async def _sem_task(coro: Awaitable[Any]):
-        async with semaphore:
-            return await coro
 
-    return await asyncio.gather(*(_sem_task(c) for c in coros))
+Work = Union[Awaitable[T], Callable[[], Awaitable[T]]]
+Limit = Union[int, AdaptiveLimiter]
+
+
+async def _iterate(
+    work: Union[Iterable[Any], AsyncIterable[Any]],
+) -> AsyncIterator[Any]:
+    if isinstance(work, AsyncIterable):
+        async for item in work:
+            yield item
+    else:
+        for item in work:
+            yield item
+
+
+async def iter_limited(
+    work: Union[Iterable[Work[T]], AsyncIterable[Work[T]]],
+    limit: Limit,
+    *,
+    ordered: bool = False,
+) -> AsyncIterator[Tuple[int, T]]:
+    """
+    Run ``work`` (awaitables, or zero-argument callables returning one) with
+    at most ``limit`` in flight, yielding ``(index, result)`` pairs.
+
+    • work is pulled from the (async) iterable only when a slot is free, so
+      a generator of 200k page fetches never materializes 200k coroutines
+    • ``ordered=False``: results as they complete (as_completed style);
+      ``ordered=True``: in input order, at most ``limit`` results buffered
+    • the first failure – or the caller cancelling / abandoning the
+      iteration – cancels everything still outstanding
+
+    ``limit`` is a fixed size or an AdaptiveLimiter whose size is tuned by
+    request feedback while the work runs.
+    """
+    slots = asyncio.Semaphore(limit) if isinstance(limit, int) else limit
+    results: "asyncio.Queue[Tuple[Optional[int], Any, Optional[BaseException]]]"
+    results = asyncio.Queue()
+    tasks: Dict["asyncio.Task[None]", Work[T]] = {}
+    held = 0  # slots acquired whose result the consumer hasn't taken yet
+    total: Optional[int] = None
+    record_wait = get_settings().metrics_enabled
+
+    async def _run(index: int, item: Work[T]) -> None:
+        try:
+            value = await (item() if callable(item) else item)
+        except BaseException as exc:
+            results.put_nowait((index, None, exc))  # never leave the consumer waiting
+            if not isinstance(exc, Exception):
+                raise
+        else:
+            results.put_nowait((index, value, None))
+
+    def _forget(task: "asyncio.Task[None]") -> None:
+        item = tasks.pop(task)
+        if (
+            task.cancelled()
+            and inspect.iscoroutine(item)
+            and inspect.getcoroutinestate(item) == inspect.CORO_CREATED
+        ):
+            item.close()  # cancelled before it ran – no "never awaited" warning
+
+    async def _dispatch() -> None:
+        nonlocal held, total
+        index = 0
+        source = _iterate(work).__aiter__()
+        try:
+            while True:
+                queued = time.perf_counter()
+                await slots.acquire()
+                held += 1
+                try:
+                    item = await source.__anext__()
+                except StopAsyncIteration:
+                    held -= 1
+                    slots.release()
+                    break
+                if record_wait:
+                    metrics.record_queue_wait(time.perf_counter() - queued)
+                task = asyncio.ensure_future(_run(index, item))
+                tasks[task] = item
+                task.add_done_callback(_forget)
+                index += 1
+        except Exception as exc:  # the work iterable itself failed
+            results.put_nowait((None, None, exc))
+        total = index
+        results.put_nowait((None, None, None))  # wake the consumer
+
+    dispatcher = asyncio.ensure_future(_dispatch())
+    received = next_index = 0
+    buffered: Dict[int, Any] = {}
+    try:
+        while total is None or received < total:
+            index, value, exc = await results.get()
+            if exc is not None:
+                raise exc
+            if index is None:
+                continue  # dispatcher finished; loop condition re-checks
+            received += 1
+            if not ordered:
+                held -= 1
+                slots.release()
+                yield index, value
+                continue
+            # a buffered result keeps its slot until it is yielded, so a slow
+            # head item caps the buffer at ``limit`` instead of letting the
+            # rest of the work pile up behind it
+            buffered[index] = value
+            while next_index in buffered:
+                held -= 1
+                slots.release()
+                yield next_index, buffered.pop(next_index)
+                next_index += 1
+    finally:
+        dispatcher.cancel()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(dispatcher, *tasks, return_exceptions=True)
+        for _ in range(held):  # slots of work that never reported back
+            slots.release()
+
+
+async def gather_limited(
+    work: Union[Iterable[Work[T]], AsyncIterable[Work[T]]], limit: Limit
+) -> List[T]:
+    """
+    Ordered results of iter_limited(); the first error cancels the rest and
+    is raised.
+    """
+    return [value async for _, value in iter_limited(work, limit, ordered=True)]
+
+
+def as_completed_limited(
+    work: Union[Iterable[Work[T]], AsyncIterable[Work[T]]], limit: Limit
+) -> AsyncIterator[Tuple[int, T]]:
+    """``(index, result)`` pairs in completion order – see iter_limited()."""
+    return iter_limited(work, limit, ordered=False)
+
+
+async def iter_prefetched(
+    fetch: Callable[[int], Awaitable[T]], pages: Iterable[int], prefetch: int
+) -> AsyncIterator[T]:
+    """
+    Yield ``fetch(page)`` for every page, in order, keeping at most
+    ``prefetch`` fetches in flight.
+
+    New fetches are only scheduled when the consumer asks for the next
+    result, so a slow consumer naturally throttles the producer.
+    """
+    if prefetch < 1:
+        raise ValueError("prefetch must be >= 1")
+
+    page_iter = iter(pages)
+    pending: Deque["asyncio.Future[T]"] = deque()
+
+    def _fill() -> None:
+        while len(pending) < prefetch:
+            page = next(page_iter, None)
+            if page is None:
+                return
+            pending.append(asyncio.ensure_future(fetch(page)))
+
+    try:
+        _fill()
+        while pending:
+            result = await pending.popleft()
+            _fill()  # keep the pipeline busy while the consumer works
+            yield result
+    finally:
+        # consumer stopped early (break / error) – don't leak fetches
+        for fut in pending:
+            fut.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
@@ -1,7 +1,8 @@
-from typing import List
+from typing import AsyncIterator, Iterable, List, Optional
 
 from connector.base import BaseConnector
-from connector.models import Item
+from connector.export import ExportResult, PathLike
+from connector.models import Item, ItemPage
 
 
 class SimConnector(BaseConnector):
@@ -9,8 +10,28 @@ class SimConnector(BaseConnector):
     ENDPOINTS = {
         "list_users": ("GET", "/items"),  # the mock returns items that look like users
         "get_user": ("GET", "/items/{id}"),
+        "get_users": ("GET", "/items/batch"),
     }
+    BATCH_ENDPOINTS = {"get_user": "get_users"}
+    SINCE_PARAM = "since"  # /items?since= change feed
 
     async def list_users(self, **kw) -> List[Item]:
-        data = await self._call("list_users")
-        return [Item.model_validate(d) for d in data["items"]]
+        page = await self._call("list_users", model=ItemPage)
+        return page.items
+
+    async def get_user(self, user_id: int) -> Item:
+        return await self._get_one("get_user", user_id, model=Item)
+
+    async def get_users(self, user_ids: Iterable[int]) -> List[Item]:
+        return await self._get_many("get_user", user_ids, model=Item)
+
+    async def iter_users(
+        self, prefetch: Optional[int] = None, **kw
+    ) -> AsyncIterator[Item]:
+        async for item in self._iter_pages(
+            "list_users", prefetch=prefetch, model=ItemPage, **kw
+        ):
+            yield item
+
+    async def export_users(self, path: PathLike, **kw) -> ExportResult:
+        return await self._export_pages("list_users", path, **kw)
@@ -0,0 +1,176 @@
+import asyncio
+import random
+import time
+from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+"""
+Runtime knobs for the simulated API.
+
+Read from SIM_* environment variables at start-up and changeable while the
+sim runs via POST /_sim/config (or configure() in-process). Defaults keep
+the original behaviour: five items, two per page, no injected faults.
+"""
+
+LatencyDist = Literal["none", "constant", "uniform", "exponential", "lognormal"]
+
+
+class SimConfig(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="SIM_", extra="ignore")
+
+    # ------------- dataset -------------
+    items: int = Field(5, ge=0)  # generated on demand, never materialized
+    page_size: int = Field(2, ge=1)
+    max_page_size: int = Field(1000, ge=1)
+    token_lifetime: int = Field(30, ge=1)
+
+    # ------------- latency -------------
+    latency: LatencyDist = "none"
+    latency_ms: float = Field(0.0, ge=0)  # mean (median for lognormal)
+    latency_sigma: float = Field(0.5, ge=0)  # lognormal shape
+
+    # ------------- faults -------------
+    error_rate_429: float = Field(0.0, ge=0, le=1)
+    rate_limit_rps: float = Field(0.0, ge=0)  # 0 = unlimited
+    retry_after: float = Field(1.0, ge=0)
+    error_rate_5xx: float = Field(0.0, ge=0, le=1)  # chance a burst starts
+    error_burst: int = Field(1, ge=1)  # consecutive 5xx per burst
+    error_status: int = Field(503, ge=500, le=599)
+    revoke_every: int = Field(0, ge=0)  # revoke the token every N calls
+    slow_body_ms: float = Field(0.0, ge=0)  # spread over slow_body_chunks
+    slow_body_chunks: int = Field(4, ge=1)
+    seed: Optional[int] = None
+
+
+class SimState:
+    """Mutable sim state: current config, token generation, fault counters."""
+
+    def __init__(self, config: SimConfig):
+        self.apply(config)
+
+    def apply(self, config: SimConfig) -> None:
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.generation = 0
+        self.burst_left = 0
+        self.calls = 0
+        self._allowance = config.rate_limit_rps
+        self._checked = time.monotonic()
+        # change feed: every mutation bumps ``seq``; ``changes`` is id → seq
+        # of its last change, kept in seq order (re-inserted on each change)
+        self.seq = 0
+        self.versions: Dict[int, int] = {}
+        self.changes: Dict[int, int] = {}
+        self.stats: Dict[str, int] = {
+            "requests": 0,
+            "injected_429": 0,
+            "injected_5xx": 0,
+            "revocations": 0,
+        }
+
+    # ------------- tokens -------------
+    @property
+    def token(self) -> str:
+        return "simtoken" if not self.generation else f"simtoken-{self.generation}"
+
+    def revoke(self) -> None:
+        self.generation += 1
+        self.stats["revocations"] += 1
+
+    def authorize(self, token: Optional[str]) -> bool:
+        if token != self.token:
+            return False
+        self.calls += 1
+        every = self.config.revoke_every
+        if every and self.calls % every == 0:
+            self.revoke()  # this call still succeeds; the next one gets 401
+        return True
+
+    # ------------- mutations -------------
+    def mutate(self, ids: Iterable[int]) -> int:
+        """Change the given items (new name/value); returns the new seq."""
+        for i in ids:
+            if not 1 <= i <= self.config.items:
+                continue
+            self.seq += 1
+            self.versions[i] = self.versions.get(i, 0) + 1
+            self.changes.pop(i, None)
+            self.changes[i] = self.seq
+        return self.seq
+
+    def changed_since(self, after: int, limit: int) -> Tuple[List[int], int, bool]:
+        """Ids changed after seq ``after`` (oldest first), next seq, has_more."""
+        changed = [(i, seq) for i, seq in self.changes.items() if seq > after]
+        batch = changed[:limit]
+        if len(changed) > limit:
+            return [i for i, _ in batch], batch[-1][1], True
+        return [i for i, _ in batch], self.seq, False
+
+    # ------------- faults -------------
+    def latency(self) -> float:
+        c = self.config
+        mean = c.latency_ms / 1000
+        if c.latency == "none" or mean <= 0:
+            return 0.0
+        if c.latency == "constant":
+            return mean
+        if c.latency == "uniform":
+            return self.rng.uniform(0, 2 * mean)
+        if c.latency == "exponential":
+            return self.rng.expovariate(1 / mean)
+        return self.rng.lognormvariate(0, c.latency_sigma) * mean
+
+    def _rate_limited(self) -> bool:
+        rps = self.config.rate_limit_rps
+        if not rps:
+            return False
+        now = time.monotonic()
+        self._allowance = min(rps, self._allowance + (now - self._checked) * rps)
+        self._checked = now
+        if self._allowance < 1:
+            return True
+        self._allowance -= 1
+        return False
+
+    def fault(self) -> Optional[int]:
+        """Status code to fail this request with, or None to serve it."""
+        c = self.config
+        self.stats["requests"] += 1
+        if self.burst_left:
+            self.burst_left -= 1
+            self.stats["injected_5xx"] += 1
+            return c.error_status
+        if self._rate_limited() or (
+            c.error_rate_429 and self.rng.random() < c.error_rate_429
+        ):
+            self.stats["injected_429"] += 1
+            return 429
+        if c.error_rate_5xx and self.rng.random() < c.error_rate_5xx:
+            self.burst_left = c.error_burst - 1
+            self.stats["injected_5xx"] += 1
+            return c.error_status
+        return None
+
+    async def delay(self) -> None:
+        seconds = self.latency()
+        if seconds:
+            await asyncio.sleep(seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "config": self.config.model_dump(),
+            "token_generation": self.generation,
+            "stats": dict(self.stats),
+        }
+
+
+state = SimState(SimConfig())
+
+
+def configure(**changes: Any) -> SimConfig:
+    """Replace config fields (validated) and reset counters / token state."""
+    config = SimConfig.model_validate({**state.config.model_dump(), **changes})
+    state.apply(config)
+    return config
@@ -1,12 +1,20 @@
+import asyncio
+import base64
+import hashlib
+import json
 import math
 import os
+from typing import Any, AsyncIterator, Dict, List, Optional
 
-from fastapi import Depends, FastAPI, Form, HTTPException
+from fastapi import Body, Depends, FastAPI, Form, HTTPException, Query, Request
 from fastapi.security import OAuth2PasswordBearer
-from starlette.responses import JSONResponse
+from pydantic import ValidationError
+from starlette.responses import JSONResponse, Response, StreamingResponse
 
 from connector.models import Item
 
+from .config import configure, state
+
 # Compatibility shim
 # FastAPI ≤0.109 does not ship OAuth2ClientCredentialsRequestForm.  If it is
 # unavailable we build a minimal replacement that behaves the same for our test
@@ -34,8 +42,6 @@ app = FastAPI(title="Simulated API")
 # Dummy credentials (env‑driven to avoid hard‑coding)
 CLIENT_ID = os.getenv("API_CLIENT_ID", "testclient")
 CLIENT_SECRET = os.getenv("API_CLIENT_SECRET", "testsecret")
-TOKEN_VALUE = "simtoken"  # constant token for simplicity
-TOKEN_LIFETIME = 30  # seconds
 
 
 # OAuth2 token endpoint
@@ -44,36 +50,193 @@ async def token(form: OAuth2ClientCredentialsRequestForm = Depends()):
     if form.client_id != CLIENT_ID or form.client_secret != CLIENT_SECRET:
         return JSONResponse({"error": "invalid_client"}, status_code=401)
     return {
-        "access_token": TOKEN_VALUE,
+        "access_token": state.token,
         "token_type": "Bearer",
-        "expires_in": TOKEN_LIFETIME,
+        "expires_in": state.config.token_lifetime,
     }
 
 
 bearer_scheme = OAuth2PasswordBearer(tokenUrl="/oauth2/token", auto_error=False)
 
-# Sample data – five items
-ITEMS = [{"id": i, "name": f"Item {i}", "value": i * 1.5} for i in range(1, 6)]
-PAGE_SIZE = 2
+
+# ------------- dataset (generated on demand) -------------
+def _item(i: int) -> dict:
+    version = state.versions.get(i)
+    if version:
+        return {"id": i, "name": f"Item {i} v{version}", "value": i * 1.5 + version}
+    return {"id": i, "name": f"Item {i}", "value": i * 1.5}
+
+
+def _items(start: int, stop: int) -> List[dict]:
+    """Items with ids in [start, stop), clipped to the dataset."""
+    return [_item(i) for i in range(max(start, 1), min(stop, state.config.items + 1))]
+
+
+def _encode_cursor(next_id: int) -> str:
+    return base64.urlsafe_b64encode(str(next_id).encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> int:
+    if not cursor:
+        return 1
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return int(base64.urlsafe_b64decode(padded))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from None
 
 
-@app.get("/items")
-async def list_items(page: int = 1, token: str = Depends(bearer_scheme)):
-    if token != TOKEN_VALUE:
+# ------------- fault injection + auth -------------
+async def faults() -> None:
+    """Injected latency, 429s (Retry-After) and 5xx bursts."""
+    await state.delay()
+    status = state.fault()
+    if status == 429:
+        retry_after = state.config.retry_after
+        raise HTTPException(
+            status_code=429,
+            detail="Too Many Requests",
+            headers={"Retry-After": f"{retry_after:g}"},
+        )
+    if status is not None:
+        raise HTTPException(status_code=status, detail="Injected failure")
+
+
+def authorized(token: str = Depends(bearer_scheme)) -> None:
+    if not state.authorize(token):
         raise HTTPException(status_code=401, detail="Unauthorized")
-    start, end = (page - 1) * PAGE_SIZE, page * PAGE_SIZE
-    page_items = ITEMS[start:end]
-    total_pages = math.ceil(len(ITEMS) / PAGE_SIZE)
-    next_page = page + 1 if page < total_pages else None
-    return {
-        "items": page_items,
+
+
+async def _slow_chunks(body: bytes) -> AsyncIterator[bytes]:
+    chunks = state.config.slow_body_chunks
+    pause = state.config.slow_body_ms / 1000 / chunks
+    step = -(-len(body) // chunks) or 1
+    for i in range(0, len(body), step):
+        await asyncio.sleep(pause)
+        yield body[i : i + step]
+
+
+def _respond(request: Request, payload, *, etag: bool = True) -> Response:
+    """JSON response with an ETag (304 on If-None-Match) and optional slow body."""
+    body = json.dumps(payload, sort_keys=True).encode()
+    headers = {}
+    if etag:
+        headers["ETag"] = '"%s"' % hashlib.sha1(body).hexdigest()
+        if request.headers.get("if-none-match") == headers["ETag"]:
+            return Response(status_code=304, headers=headers)
+    if state.config.slow_body_ms:
+        return StreamingResponse(
+            _slow_chunks(body), media_type="application/json", headers=headers
+        )
+    return Response(body, media_type="application/json", headers=headers)
+
+
+_api = [Depends(faults)]
+_authed = [Depends(faults), Depends(authorized)]
+
+
+@app.get("/items", dependencies=_authed)
+async def list_items(
+    request: Request,
+    page: int = Query(1, ge=1),
+    page_size: Optional[int] = Query(None, ge=1),
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    since: Optional[str] = None,
+):
+    """
+    Page mode (default): ?page=N[&page_size=M] → ItemPage.
+    Cursor mode: ?cursor=[token][&limit=M] → {"items", "next_cursor"}.
+    Change feed: ?since=[token][&limit=M] → {"items", "next_since", "has_more"};
+    an empty token returns no items, just the current position.
+    """
+    total = state.config.items
+    if since is not None:
+        if not since:
+            return {"items": [], "next_since": str(state.seq), "has_more": False}
+        try:
+            after = int(since)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid since") from None
+        size = min(limit or state.config.max_page_size, state.config.max_page_size)
+        ids, next_seq, more = state.changed_since(after, size)
+        return {
+            "items": [_item(i) for i in ids],
+            "next_since": str(next_seq),
+            "has_more": more,
+        }
+    if cursor is not None:
+        size = min(limit or state.config.page_size, state.config.max_page_size)
+        start = _decode_cursor(cursor)
+        next_id = start + size
+        payload = {
+            "items": _items(start, next_id),
+            "next_cursor": _encode_cursor(next_id) if next_id <= total else None,
+        }
+        return _respond(request, payload)
+
+    size = min(page_size or state.config.page_size, state.config.max_page_size)
+    total_pages = math.ceil(total / size)
+    start = (page - 1) * size + 1
+    payload = {
+        "items": _items(start, start + size),
         "page": page,
         "total_pages": total_pages,
-        "next_page": next_page,
+        "next_page": page + 1 if page < total_pages else None,
     }
+    return _respond(request, payload)
+
+
+def _lookup(ids: List[int]) -> dict:
+    return {"items": [_item(i) for i in ids if 1 <= i <= state.config.items]}
+
 
-@app.get("/projects/{proj_id}", response_model=Item)
-async def get_project(proj_id: int):
-    if 1 <= proj_id <= 5:
-        return ITEMS[proj_id - 1]
+# batch routes must be declared before their /{id} siblings
+@app.get("/items/batch", dependencies=_authed)
+async def batch_items(request: Request, ids: List[int] = Query(...)):
+    return _respond(request, _lookup(ids), etag=False)
+
+
+@app.get("/items/{item_id}", response_model=Item, dependencies=_authed)
+async def get_item(request: Request, item_id: int):
+    if 1 <= item_id <= state.config.items:
+        return _respond(request, _item(item_id), etag=False)
+    raise HTTPException(status_code=404, detail="Not found")
+
+
+@app.get("/projects/batch", dependencies=_api)
+async def batch_projects(request: Request, ids: List[int] = Query(...)):
+    return _respond(request, _lookup(ids), etag=False)
+
+
+@app.get("/projects/{proj_id}", response_model=Item, dependencies=_api)
+async def get_project(request: Request, proj_id: int):
+    if 1 <= proj_id <= state.config.items:
+        return _respond(request, _item(proj_id))
     raise HTTPException(status_code=404, detail="Not found")
+
+
+# ------------- sim control (no auth, no faults) -------------
+@app.get("/_sim/config")
+async def sim_config():
+    return state.snapshot()
+
+
+@app.post("/_sim/config")
+async def update_sim_config(changes: Dict[str, Any] = Body(...)):
+    try:
+        configure(**changes)
+    except ValidationError as exc:
+        raise HTTPException(status_code=422, detail=exc.errors()) from None
+    return state.snapshot()
+
+
+@app.post("/_sim/mutate")
+async def mutate_items(ids: List[int] = Body(..., embed=True)):
+    return {"seq": state.mutate(ids)}
+
+
+@app.post("/_sim/revoke")
+async def revoke_token():
+    state.revoke()
+    return {"token_generation": state.generation}
@@ -0,0 +1,51 @@
+import asyncio
+
+import pytest
+
+from connector.concurrency import AdaptiveLimiter
+from connector.utils import gather_limited
+
+
+def test_aimd_grows_and_cuts_within_bounds():
+    lim = AdaptiveLimiter(4, min_limit=2, max_limit=6, cooldown=0)
+    for _ in range(100):
+        lim.record(0.01, 200)
+    assert lim.limit == 6  # additive increase, capped at max
+    lim.record(0.01, 429)
+    assert lim.limit == 3  # multiplicative decrease
+    lim.record(None, None)
+    assert lim.limit == 2  # never below min
+
+
+def test_latency_spike_counts_as_overload():
+    lim = AdaptiveLimiter(8, cooldown=0)
+    lim.record(0.01, 200)
+    lim.record(0.5, 200)
+    assert lim.limit == 4
+
+
+@pytest.mark.asyncio
+async def test_gather_limited_respects_adaptive_limit():
+    lim = AdaptiveLimiter(3, max_limit=3)
+    peak = 0
+
+    async def job(i):
+        nonlocal peak
+        peak = max(peak, lim.in_flight)
+        await asyncio.sleep(0.01)
+        return i
+
+    assert await gather_limited([job(i) for i in range(10)], lim) == list(range(10))
+    assert peak == 3
+    assert lim.in_flight == 0
+
+
+def test_baseline_follows_a_lasting_latency_shift():
+    lim = AdaptiveLimiter(14, cooldown=0)
+    for _ in range(20):
+        lim.record(0.05, 200)
+    for _ in range(200):
+        lim.record(0.12, 200)  # slower but healthy from now on
+    assert lim.snapshot()["decreases"] <= 3  # only while the baseline adapts
+    assert lim.limit >= 14
+    assert lim.snapshot()["baseline_latency"] == pytest.approx(0.12, rel=0.01)
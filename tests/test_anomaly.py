@@ -0,0 +1,66 @@
+import logging
+
+from connector.anomaly import AnomalyDetector, BucketCounter, get_detector
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_bucket_counter_slides():
+    clock = _Clock()
+    counter = BucketCounter(window=10, clock=clock)
+    for _ in range(5):
+        counter.add()
+        clock.now += 1
+    assert counter.total == 5
+    clock.now += 6  # seconds 1000 and 1001 fall out of the window
+    assert counter.total == 3
+    clock.now += 100
+    assert counter.total == 0 and counter.add(2) == 2
+
+
+def test_rate_alerts_are_rate_limited(caplog):
+    clock = _Clock()
+    detector = AnomalyDetector(threshold=3, alert_interval=30, clock=clock)
+    with caplog.at_level(logging.WARNING, logger="connector"):
+        for _ in range(50):
+            detector.record_request("/items")
+        clock.now += 31
+        detector.record_request("/items")
+    lines = [r.getMessage() for r in caplog.records]
+    assert len(lines) == 2  # not one per request
+    assert "46 similar alerts suppressed" in lines[1]
+    assert detector.snapshot()["endpoints"] == {"/items": 51}
+
+
+def test_401_needs_a_count(caplog):
+    detector = AnomalyDetector(auth_failure_threshold=3, clock=_Clock())
+    with caplog.at_level(logging.ERROR, logger="connector"):
+        detector.record_401()
+        detector.record_401()
+        assert not caplog.records
+        detector.record_401()
+    assert "3 in last 60s" in caplog.records[0].getMessage()
+
+
+def test_status_classes_and_shared_registry():
+    detector = get_detector("anomaly-test")
+    assert get_detector("anomaly-test") is detector
+    for status in (200, 204, 503, None):
+        detector.record_status(status)
+    assert detector.snapshot()["statuses"] == {"2xx": 2, "5xx": 1, "error": 1}
+
+
+def test_conflicting_settings_for_existing_detector_warn(caplog):
+    detector = get_detector("anomaly-conflict", threshold=10)
+    with caplog.at_level(logging.WARNING, logger="connector"):
+        assert get_detector("anomaly-conflict", threshold=10) is detector
+        assert not caplog.records
+        get_detector("anomaly-conflict", threshold=99)
+    assert detector.threshold == 10
+    assert "ignoring {'threshold': 99}" in caplog.records[0].getMessage()
@@ -1,4 +1,14 @@
+import asyncio
+
 import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from httpx._transports.asgi import ASGITransport
+
+from connector import auth
+from connector.client import APIClient
+from connector.config import reload_settings
+from simapi.main import app as fastapi_app
 
 
 @pytest.mark.asyncio
@@ -7,3 +17,66 @@ async def test_token_refresh_on_expiry(live_client):
     live_client._oauth._expires_at = 1.0
     items = await live_client.list_all_items(concurrent=False)
     assert items  # refresh succeeded
+
+
+class _CountingTransport(ASGITransport):
+    token_posts = 0
+    item_requests = 0
+
+    async def handle_async_request(self, request):
+        if request.url.path == "/oauth2/token":
+            self.token_posts += 1
+        else:
+            self.item_requests += 1
+        return await super().handle_async_request(request)
+
+
+@pytest_asyncio.fixture
+async def counted_client(monkeypatch):
+    # every call must really go out, or there is no concurrent refresh to share
+    monkeypatch.setenv("COALESCE_REQUESTS", "false")
+    reload_settings()
+    transport = _CountingTransport(app=fastapi_app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as ac:
+        client = APIClient(base_url="http://testserver")
+        client._client = ac
+        client._oauth._client = ac
+        yield client, transport
+        await client.close()
+    monkeypatch.undo()
+    reload_settings()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_refresh_is_single_flight(counted_client):
+    client, transport = counted_client
+    await asyncio.gather(*(client.list_items_page(1) for _ in range(20)))
+    assert transport.item_requests == 20
+    assert transport.token_posts == 1
+
+
+@pytest.mark.asyncio
+async def test_revoked_token_refreshed_once(counted_client):
+    client, transport = counted_client
+    client._oauth._token = "revoked"
+    client._oauth._expires_at = 9999999999
+    pages = await asyncio.gather(*(client.list_items_page(1) for _ in range(20)))
+    assert all(p.page == 1 for p in pages)
+    assert transport.item_requests >= 40  # 20 rejected + 20 retried
+    assert transport.token_posts == 1
+
+
+@pytest.mark.asyncio
+async def test_background_refresh_replaces_token(counted_client, monkeypatch):
+    client, transport = counted_client
+    monkeypatch.setattr(auth, "_MIN_BACKGROUND_DELAY", 0.01)
+    client._oauth._settings = client._oauth._settings.model_copy(
+        update={"token_refresh_lead": 1e6}
+    )
+    client._oauth.start_background_refresh()
+    for _ in range(100):
+        if transport.token_posts:
+            break
+        await asyncio.sleep(0.01)
+    assert client._oauth._token == "simtoken"
+    assert transport.token_posts >= 1
@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+from httpx._transports.asgi import ASGITransport
+
+from connector.batching import BatchLoader
+from connector.client import APIClient
+from connector.exceptions import NotFoundError
+from connectors.sim import SimConnector
+from simapi.main import app as fastapi_app
+
+
+class _Counter(ASGITransport):
+    def __init__(self, app):
+        super().__init__(app=app)
+        self.paths = []
+
+    async def handle_async_request(self, request):
+        if request.url.path != "/oauth2/token":
+            self.paths.append(request.url.path)
+        return await super().handle_async_request(request)
+
+
+@pytest.mark.asyncio
+async def test_loader_collects_window_and_splits_by_size():
+    seen = []
+
+    async def batch(keys):
+        seen.append(keys)
+        return {k: k * 10 for k in keys if k != 4}
+
+    loader = BatchLoader(batch, max_batch_size=3, window=0.01)
+    results = await asyncio.gather(
+        *(loader.load(k) for k in (1, 2, 3, 4, 1)), return_exceptions=True
+    )
+    assert results[:3] == [10, 20, 30]
+    assert isinstance(results[3], NotFoundError)
+    assert results[4] == 10
+    assert seen == [[1, 2, 3], [4, 1]]
+
+
+@pytest.mark.asyncio
+async def test_get_projects_uses_batch_endpoint():
+    transport = _Counter(fastapi_app)
+    client = APIClient(base_url="http://testserver", transport=transport)
+    items = await client.get_projects([3, 1, 2])
+    assert [i.id for i in items] == [3, 1, 2]
+    assert transport.paths == ["/projects/batch"]
+    with pytest.raises(NotFoundError):
+        await client.get_projects([1, 42])
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_single_lookups_are_micro_batched():
+    transport = _Counter(fastapi_app)
+    client = SimConnector(base_url="http://testserver", transport=transport)
+    client._batch_lookups = True
+    users = await asyncio.gather(*(client.get_user(i) for i in (1, 2, 5)))
+    assert [u.id for u in users] == [1, 2, 5]
+    assert transport.paths == ["/items/batch"]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_fallback_without_batch_endpoint():
+    transport = _Counter(fastapi_app)
+    client = SimConnector(base_url="http://testserver", transport=transport)
+    client.BATCH_ENDPOINTS = {}
+    users = await client.get_users([2, 4])
+    assert [u.id for u in users] == [2, 4]
+    assert sorted(transport.paths) == ["/items/2", "/items/4"]
+    await client.close()
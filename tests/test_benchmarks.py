@@ -0,0 +1,24 @@
+import copy
+
+import pytest
+
+from benchmarks.run import compare, run_suite
+from benchmarks.scenarios import SCENARIOS
+
+
+@pytest.mark.asyncio
+async def test_benchmark_suite_smoke():
+    report = await run_suite(sizes=[12], concurrency=[3], page_size=5, repeat=1)
+    rows = {r["scenario"]: r for r in report["results"]}
+    assert set(rows) == set(SCENARIOS)
+    assert rows["list_all_concurrent"]["items"] == 12
+    assert rows["get_project_fanout"]["requests"] == 12
+    assert rows["token_refresh_contention"]["requests"] == 50  # one POST per round
+    assert all(r["peak_mem_kb"] for r in rows.values())
+
+    slower = copy.deepcopy(report)
+    for r in slower["results"]:
+        r["items_per_sec"] /= 2
+    flagged = {c["case"] for c in compare(report, slower) if c["regression"]}
+    assert "list_all_concurrent/12/3" in flagged
+    assert not any(c["regression"] for c in compare(report, report))
@@ -0,0 +1,76 @@
+import httpx
+import pytest
+from httpx._transports.asgi import ASGITransport
+
+from connector.cache import ResponseCache
+from connector.client import APIClient
+from simapi.main import app as fastapi_app
+
+
+class _Recorder(ASGITransport):
+    def __init__(self, app):
+        super().__init__(app=app)
+        self.statuses = []
+
+    async def handle_async_request(self, request):
+        resp = await super().handle_async_request(request)
+        if request.url.path != "/oauth2/token":
+            self.statuses.append(resp.status_code)
+        return resp
+
+
+@pytest.fixture()
+def cached_client():
+    transport = _Recorder(fastapi_app)
+    client = APIClient(base_url="http://testserver", transport=transport)
+    client._cache = ResponseCache(max_entries=2, default_ttl=60)
+    return client, transport
+
+
+@pytest.mark.asyncio
+async def test_fresh_hit_skips_network(cached_client):
+    client, transport = cached_client
+    first = await client.get_project(3)
+    second = await client.get_project(3)
+    assert first == second
+    assert transport.statuses == [200]
+    assert client.response_cache.stats()["hits"] == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_revalidates_with_etag(cached_client):
+    client, transport = cached_client
+    client._cache.default_ttl = 0  # always stale, but keep validators
+    await client.get_project(2)
+    again = await client.get_project(2)
+    assert again.id == 2
+    assert transport.statuses == [200, 304]
+    assert client.response_cache.stats()["revalidations"] == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_and_token_scoping(cached_client):
+    client, transport = cached_client
+    for pid in (1, 2, 3):
+        await client.get_project(pid)
+    assert client.response_cache.stats()["evictions"] == 1
+
+    client._oauth._token = "other-token"  # sim ignores it on /projects
+    client._oauth._expires_at = 9999999999
+    await client.get_project(3)
+    assert transport.statuses == [200, 200, 200, 200]
+    await client.close()
+
+
+def test_cache_control_directives():
+    cache = ResponseCache(default_ttl=60, ttls={"/short": 0})
+    req = httpx.Request("GET", "http://x/a")
+    key = cache.key("s", "http://x/a", "t")
+    cache.store(key, httpx.Response(200, headers={"Cache-Control": "no-store"}, request=req), "/a")
+    assert len(cache) == 0
+    cache.store(key, httpx.Response(200, content=b"{}", request=req), "/short")
+    assert len(cache) == 0  # ttl 0 without validators is pointless
+    cache.store(key, httpx.Response(200, headers={"Cache-Control": "max-age=5"}, request=req), "/a")
+    assert cache.lookup(key).fresh
@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+from httpx._transports.asgi import ASGITransport
+
+from connector.client import APIClient
+from connector.exceptions import NotFoundError
+from connectors.sim import SimConnector
+from simapi.main import app as fastapi_app
+
+
+class _Counter(ASGITransport):
+    def __init__(self, app):
+        super().__init__(app=app)
+        self.paths = []
+
+    async def handle_async_request(self, request):
+        if request.url.path != "/oauth2/token":
+            self.paths.append(request.url.path)
+        return await super().handle_async_request(request)
+
+
+@pytest.mark.asyncio
+async def test_identical_gets_share_one_request():
+    transport = _Counter(fastapi_app)
+    client = APIClient(base_url="http://testserver", transport=transport)
+    results = await asyncio.gather(*(client.get_project(2) for _ in range(10)))
+    assert transport.paths == ["/projects/2"]
+    assert all(r is results[0] for r in results)
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_waiter():
+    transport = _Counter(fastapi_app)
+    client = APIClient(base_url="http://testserver", transport=transport)
+    results = await asyncio.gather(
+        *(client.get_project(99) for _ in range(5)), return_exceptions=True
+    )
+    assert all(isinstance(r, NotFoundError) for r in results)
+    assert transport.paths == ["/projects/99"]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_connector_calls_coalesce_per_params():
+    transport = _Counter(fastapi_app)
+    client = SimConnector(base_url="http://testserver", transport=transport)
+    await asyncio.gather(
+        *(client._call("list_users", params={"page": p}) for p in (1, 1, 2, 2))
+    )
+    assert sorted(transport.paths) == ["/items", "/items"]
+    await client.close()
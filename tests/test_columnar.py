@@ -0,0 +1,46 @@
+import pytest
+
+from connector.columnar import ItemColumns
+from connector.models import Item
+
+
+def test_columns_roundtrip_and_footprint():
+    cols = ItemColumns()
+    cols.extend([{"id": 1, "name": "ä", "value": 1.5}, {"id": 2, "name": "", "value": 2}])
+    assert len(cols) == 2
+    assert cols[0] == Item(id=1, name="ä", value=1.5)
+    assert cols[-1].name == ""
+    assert cols.names == ["ä", ""]
+    assert cols.memory_footprint() == {"id": 16, "value": 16, "name": 2 + 16}
+    with pytest.raises(IndexError):
+        cols[2]
+    with pytest.raises(IndexError):
+        cols.name(-3)
+
+
+def test_bad_record_leaves_columns_aligned():
+    cols = ItemColumns()
+    cols.extend([{"id": 1, "name": "a", "value": 1.0}])
+    for bad in (
+        {"id": 2, "name": None, "value": 2.0},
+        {"id": 2, "name": "b", "value": "x"},
+    ):
+        with pytest.raises((AttributeError, TypeError)):
+            cols.extend([bad])
+    assert (len(cols.ids), len(cols.values), len(cols._name_ends)) == (1, 1, 1)
+    assert cols.to_items() == [Item(id=1, name="a", value=1.0)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("concurrent", [True, False])
+async def test_list_all_items_columns(live_client, concurrent):
+    cols = await live_client.list_all_items(concurrent=concurrent, format="columns")
+    assert isinstance(cols, ItemColumns)
+    assert list(cols.ids) == [1, 2, 3, 4, 5]
+    assert cols.to_items() == await live_client.list_all_items()
+
+
+@pytest.mark.asyncio
+async def test_unknown_format_rejected(live_client):
+    with pytest.raises(ValueError):
+        await live_client.list_all_items(format="parquet")
@@ -0,0 +1,23 @@
+import pytest
+from pydantic import ValidationError
+
+from connector.decoding import decode, response_decoder
+from connector.models import Item, ItemPage
+
+PAGE = (
+    b'{"items": [{"id": 1, "name": "a", "value": 1.5},'
+    b' {"id": 2, "name": "b", "value": 3}], "page": 1, "total_pages": 1}'
+)
+
+
+def test_validated_decode_from_bytes():
+    page = decode(ItemPage, PAGE)
+    assert isinstance(page.items[0], Item)
+    assert page.items[1].value == 3.0
+    with pytest.raises(ValidationError):
+        decode(Item, b'{"id": "x", "name": "a", "value": 1}')
+
+
+def test_response_decoder_is_stable():
+    assert response_decoder(Item) is response_decoder(Item)
+    assert response_decoder(Item) is not response_decoder(ItemPage)
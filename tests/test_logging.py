@@ -0,0 +1,82 @@
+import io
+import json
+import logging
+import queue
+import threading
+from logging.handlers import QueueListener
+
+from connector.logger import (
+    JsonFormatter,
+    Redacted,
+    RedactingFilter,
+    SamplingFilter,
+    _DeferredQueueHandler,
+)
+
+
+def _record(msg, *args, **extra):
+    record = logging.makeLogRecord({"msg": msg, "args": args, "levelno": 10})
+    record.__dict__.update(extra)
+    return record
+
+
+def test_json_formatter_redacts_args_and_extras():
+    body = {"access_token": "t0k", "nested": [{"password": "pw", "ok": 1}]}
+    record = _record("token response %s", body, payload={"client_secret": "s"})
+    doc = json.loads(JsonFormatter().format(record))
+    assert "t0k" not in doc["msg"] and "pw" not in doc["msg"]
+    assert doc["payload"] == {"client_secret": "***"}
+
+
+def test_redacted_is_lazy_and_snapshots():
+    headers = {"Authorization": "Bearer secret", "Accept": "json"}
+    arg = Redacted(headers)
+    headers["Authorization"] = "Bearer other"
+    assert str(arg) == "{'Authorization': '***', 'Accept': 'json'}"
+
+
+def test_sampling_keeps_one_in_n():
+    sampler = SamplingFilter(rate=0.25)
+    kept = sum(sampler.filter(_record("x")) for _ in range(100))
+    assert kept == 25
+    warning = logging.makeLogRecord({"levelno": logging.WARNING})
+    assert sampler.filter(warning)
+
+
+def test_records_are_formatted_on_listener_thread():
+    threads = []
+
+    class _Capture(logging.Handler):
+        def emit(self, record):
+            threads.append(threading.current_thread())
+            self.format(record)
+
+    handler = _DeferredQueueHandler(queue.SimpleQueue())
+    listener = QueueListener(handler.queue, _Capture())
+    listener.start()
+    log = logging.getLogger("connector.test-queue")
+    log.propagate = False
+    log.addHandler(handler)
+    log.warning("hello %s", Redacted({"cookie": "c"}))
+    listener.stop()
+    assert threads and threads[0] is not threading.current_thread()
+
+
+def test_text_format_redacts_mapping_args():
+    out = io.StringIO()
+    stream = logging.StreamHandler(out)
+    stream.setFormatter(logging.Formatter("%(levelname)s | %(message)s"))
+    handler = _DeferredQueueHandler(queue.SimpleQueue())
+    handler.addFilter(RedactingFilter())
+    listener = QueueListener(handler.queue, stream)
+    listener.start()
+    log = logging.getLogger("connector.test-text")
+    log.propagate = False
+    log.addHandler(handler)
+    headers = {"Authorization": "Bearer secret", "Accept": "json"}
+    log.warning("request headers %s", headers)
+    log.warning("token %(access_token)s", {"access_token": "t0k"})
+    listener.stop()
+    text = out.getvalue()
+    assert "secret" not in text and "t0k" not in text
+    assert "'Authorization': '***'" in text and "'Accept': 'json'" in text
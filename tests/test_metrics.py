@@ -0,0 +1,71 @@
+import pytest
+from httpx._transports.asgi import ASGITransport
+
+from connector import metrics
+from connector.client import APIClient
+from connector.config import reload_settings
+from simapi.main import app as fastapi_app
+
+
+class _Recorder(metrics.MetricsHook):
+    def __init__(self):
+        self.requests = []
+
+    def on_request(self, method, endpoint, status, latency):
+        self.requests.append((method, endpoint, status))
+
+
+def test_normalize_endpoint():
+    assert metrics.normalize_endpoint("/projects/42?x=1") == "/projects/{id}"
+    assert metrics.normalize_endpoint("/items") == "/items"
+
+
+def test_prometheus_histogram_is_cumulative():
+    reg = metrics.MetricsRegistry(buckets=(0.1, 1.0))
+    for latency in (0.05, 0.5, 5.0):
+        reg.on_request("GET", "/items", "200", latency)
+    text = reg.render_prometheus()
+    assert 'connector_requests_total{method="GET",endpoint="/items",status="200"} 3' in text
+    assert 'request_duration_seconds_bucket{method="GET",endpoint="/items",le="0.1"} 1' in text
+    assert 'request_duration_seconds_bucket{method="GET",endpoint="/items",le="+Inf"} 3' in text
+    assert reg.snapshot()["latency"]["GET|/items"]["p50"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_client_records_requests_and_token_refresh():
+    hook = _Recorder()
+    metrics.add_hook(hook)
+    refreshes = metrics.get_registry().token_refresh.count
+    client = APIClient(
+        base_url="http://testserver", transport=ASGITransport(app=fastapi_app)
+    )
+    try:
+        await client.get_project(3)
+        await client.list_all_items()
+    finally:
+        metrics.remove_hook(hook)
+        await client.close()
+    assert ("GET", "/projects/{id}", "200") in hook.requests
+    assert ("GET", "/items", "200") in hook.requests
+    reg = metrics.get_registry()
+    assert reg.token_refresh.count == refreshes + 1
+    assert reg.queue_wait.count > 0  # concurrent page fan-out
+
+
+@pytest.mark.asyncio
+async def test_metrics_disabled_records_nothing(monkeypatch):
+    monkeypatch.setenv("METRICS_ENABLED", "false")
+    reload_settings()
+    reg = metrics.get_registry()
+    refreshes, waits = reg.token_refresh.count, reg.queue_wait.count
+    client = APIClient(
+        base_url="http://metrics-off", transport=ASGITransport(app=fastapi_app)
+    )
+    try:
+        await client.list_all_items()
+    finally:
+        await client.close()
+        monkeypatch.undo()
+        reload_settings()
+    assert reg.token_refresh.count == refreshes
+    assert reg.queue_wait.count == waits
@@ -0,0 +1,170 @@
+import asyncio
+import time
+
+import pytest
+from httpx._transports.asgi import ASGITransport
+
+from connector.orchestrator import FairScheduler, Orchestrator
+from connector.ratelimit import RateLimiter
+from connectors.sim import SimConnector
+from simapi.main import app as fastapi_app
+
+
+async def _grant_order(scheduler, demands):
+    """Queue ``demands`` ({flow: n}) behind one held slot; return grant order."""
+    order = []
+
+    async def _one(name):
+        await scheduler.acquire(name)
+        order.append(name)
+        await asyncio.sleep(0)
+        scheduler.release(name)
+
+    holder = next(iter(demands))
+    await scheduler.acquire(holder)
+    tasks = [
+        asyncio.ensure_future(_one(name))
+        for name, n in demands.items()
+        for _ in range(n)
+    ]
+    await asyncio.sleep(0)
+    scheduler.release(holder)
+    await asyncio.gather(*tasks)
+    return order
+
+
+@pytest.mark.asyncio
+async def test_weights_share_slots_proportionally():
+    scheduler = FairScheduler(1)
+    scheduler.register("heavy", weight=1)
+    scheduler.register("light", weight=2)
+    order = await _grant_order(scheduler, {"heavy": 30, "light": 30})
+    first = order[:30]
+    assert first.count("light") == 20 and first.count("heavy") == 10
+
+
+@pytest.mark.asyncio
+async def test_priority_is_served_first():
+    scheduler = FairScheduler(1)
+    scheduler.register("batch")
+    scheduler.register("interactive", priority=1)
+    order = await _grant_order(scheduler, {"batch": 3, "interactive": 3})
+    assert order == ["interactive"] * 3 + ["batch"] * 3
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_gives_up_its_place():
+    scheduler = FairScheduler(1)
+    gate = scheduler.register("a")
+    await gate.acquire()
+    waiter = asyncio.ensure_future(gate.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+    gate.release()
+    snap = scheduler.snapshot()
+    assert snap["in_flight"] == 0 and snap["waiting"] == 0
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_runs_providers_under_one_budget():
+    orch = Orchestrator(budget=2)
+    peak = 0
+    grant = orch.scheduler._grant
+
+    def _tracking_grant(flow):
+        nonlocal peak
+        grant(flow)
+        peak = max(peak, orch.scheduler.in_flight)
+
+    orch.scheduler._grant = _tracking_grant
+    connectors = [
+        orch.add(
+            name,
+            SimConnector(
+                base_url="http://testserver",
+                transport=ASGITransport(app=fastapi_app),
+            ),
+        )
+        for name in ("alpha", "beta", "gamma")
+    ]
+
+    async def _users(connector):
+        return await asyncio.gather(*(connector.get_user(i) for i in (1, 2, 3)))
+
+    results = await orch.run(_users)
+    listed = await orch.run("list_users")
+    for connector in connectors:
+        await connector.close()
+
+    assert peak == 2
+    assert all(r.ok and r.records == 3 for r in results.values())
+    assert all(r.requests >= 1 and r.requests_per_second > 0 for r in listed.values())
+    assert orch.snapshot()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_pacing_token_is_taken_after_admission():
+    events = []
+
+    class _Gate:
+        async def acquire(self):
+            events.append("slot")
+
+        def release(self):
+            events.append("release")
+
+    class _Pacer(RateLimiter):
+        async def acquire(self):
+            events.append("token")
+
+    connector = SimConnector(
+        base_url="http://testserver", transport=ASGITransport(app=fastapi_app)
+    )
+    await connector._oauth.get_token()
+    connector.use_scheduler(_Gate())
+    connector._rate_limiter = _Pacer()
+    await connector.list_users()
+    await connector.close()
+    assert events == ["slot", "token", "release"]
+
+
+@pytest.mark.asyncio
+async def test_paused_provider_does_not_hold_slots():
+    orch = Orchestrator(budget=4)
+    paused, other = (
+        orch.add(
+            name,
+            SimConnector(
+                base_url="http://testserver",
+                transport=ASGITransport(app=fastapi_app),
+            ),
+        )
+        for name in ("paused", "other")
+    )
+    for connector in (paused, other):
+        await connector._oauth.get_token()
+    paused._rate_limiter = RateLimiter()
+    paused._rate_limiter.pause(2.0)  # e.g. a 429 with Retry-After: 2
+    stuck = [asyncio.ensure_future(paused.get_user(1)) for _ in range(8)]
+    await asyncio.sleep(0.05)
+    try:
+        assert orch.scheduler.in_flight == 0
+        started = time.monotonic()
+        await other.get_user(1)
+        assert time.monotonic() - started < 0.5
+    finally:
+        for task in stuck:
+            task.cancel()
+        await asyncio.gather(*stuck, return_exceptions=True)
+        await paused.close()
+        await other.close()
+    assert orch.snapshot()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_add_registered_is_not_owned():
+    orch = Orchestrator(budget=1)
+    with pytest.raises(KeyError):
+        orch.add_registered("no-such-connector")
+    await orch.aclose()  # nothing half-registered to close
@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from connector.concurrency import AdaptiveLimiter
+from connector.utils import as_completed_limited, gather_limited, iter_limited
+
+
+@pytest.mark.asyncio
+async def test_work_is_pulled_lazily():
+    pulled = 0
+
+    def jobs():
+        nonlocal pulled
+        for i in range(100_000):
+            pulled += 1
+            yield asyncio.sleep(0, i)
+
+    async for index, value in as_completed_limited(jobs(), 4):
+        assert index == value
+        break
+    assert pulled <= 5  # never the whole generator
+
+
+@pytest.mark.asyncio
+async def test_ordered_results_from_async_iterable_of_callables():
+    async def source():
+        for i in range(20):
+            yield lambda i=i: asyncio.sleep(0.001 * (20 - i), i)
+
+    assert await gather_limited(source(), 5) == list(range(20))
+
+
+@pytest.mark.asyncio
+async def test_first_error_cancels_outstanding():
+    cancelled = 0
+
+    async def slow():
+        nonlocal cancelled
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled += 1
+            raise
+
+    async def boom():
+        raise ValueError("boom")
+
+    lim = AdaptiveLimiter(3, max_limit=3)
+    work = [slow, slow, boom, slow]
+    with pytest.raises(ValueError):
+        await asyncio.wait_for(gather_limited(work, lim), 1)
+    assert cancelled == 2  # the two running; the fourth was never started
+    assert lim.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_completion_order_and_early_exit_release_slots():
+    lim = AdaptiveLimiter(2, max_limit=2)
+    delays = [0.05, 0.01, 0.03]
+    it = iter_limited((asyncio.sleep(d, i) for i, d in enumerate(delays)), lim)
+    first = await it.__anext__()
+    assert first == (1, 1)  # fastest first, not input order
+    await it.aclose()
+    assert lim.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_ordered_buffer_is_bounded_by_slow_head():
+    started = 0
+
+    def jobs():
+        nonlocal started
+        for i in range(50):
+            started += 1
+            yield asyncio.sleep(0.2 if i == 0 else 0, i)
+
+    stream = iter_limited(jobs(), 4, ordered=True)
+    first = await stream.__anext__()
+    await stream.aclose()
+    assert first == (0, 0)
+    assert started <= 5  # head + 3 finished results buffered, not all 50
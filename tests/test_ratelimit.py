@@ -0,0 +1,127 @@
+import logging
+
+import httpx
+import pytest
+
+from connector.client import APIClient
+from connector.ratelimit import (
+    MAX_WAIT,
+    RateLimiter,
+    get_rate_limiter,
+    parse_retry_after,
+)
+
+
+class _Clock:
+    """Fake monotonic clock; sleeping just moves it forward."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = 0.0
+
+    def __call__(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.now += seconds
+        self.slept += seconds
+
+
+def _limiter(clock, rate=None, burst=10):
+    return RateLimiter(rate, burst, clock=clock, sleep=clock.sleep)
+
+
+class _ThrottleOnce(httpx.AsyncBaseTransport):
+    def __init__(self):
+        self.calls = 0
+
+    async def handle_async_request(self, request):
+        self.calls += 1
+        if self.calls == 1:
+            return httpx.Response(429, headers={"Retry-After": "0.2"})
+        return httpx.Response(200, json={"page": 1, "total_pages": 1, "items": []})
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("bogus") is None
+
+
+def test_limiter_shared_per_provider():
+    a = APIClient(base_url="http://shared-rl")
+    b = APIClient(base_url="http://shared-rl")
+    assert a._rate_limiter is b._rate_limiter
+    assert a._rate_limiter is get_rate_limiter("default", "http://shared-rl")
+
+
+def test_conflicting_limiter_settings_warn(caplog):
+    limiter = get_rate_limiter("default", "http://rl-conflict", 5.0, 10)
+    with caplog.at_level(logging.WARNING, logger="connector"):
+        assert get_rate_limiter("default", "http://rl-conflict", 5.0, 10) is limiter
+        assert not caplog.records
+        get_rate_limiter("default", "http://rl-conflict", 50.0, 10)
+    assert limiter.rate == 5.0
+    assert "ignoring 50.0 rps" in caplog.records[0].getMessage()
+
+
+@pytest.mark.asyncio
+async def test_retry_after_is_honored():
+    client = APIClient(
+        base_url="http://retry-after", backoff_factor=30, transport=_ThrottleOnce()
+    )
+    client._oauth._token = "dummy"
+    client._oauth._expires_at = 9999999999
+    clock = _Clock()
+    client._rate_limiter = _limiter(clock)
+    items = await client.list_all_items(concurrent=False)
+    await client.close()
+    assert items == []
+    assert clock.slept == pytest.approx(0.2)  # Retry-After, not backoff_factor
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_requests():
+    clock = _Clock()
+    limiter = _limiter(clock, rate=20, burst=1)
+    for _ in range(5):
+        await limiter.acquire()
+    assert clock.slept == pytest.approx(0.2)  # 4 waits of 1/20 s
+
+
+@pytest.mark.asyncio
+async def test_exhausted_quota_pauses_everyone():
+    clock = _Clock()
+    limiter = _limiter(clock)
+    limiter.observe({"x-ratelimit-remaining": "0", "x-ratelimit-reset": "15"})
+    await limiter.acquire()
+    assert clock.slept == pytest.approx(15)
+
+
+def test_retry_after_is_clamped():
+    assert parse_retry_after("inf") == MAX_WAIT
+    assert parse_retry_after("1e12") == MAX_WAIT
+    assert parse_retry_after("Fri, 01 Jan 9999 00:00:00 GMT") == MAX_WAIT
+    assert parse_retry_after("nan") == 0.0
+
+
+@pytest.mark.asyncio
+async def test_hint_limits_banked_tokens():
+    clock = _Clock()
+    limiter = _limiter(clock, burst=10)
+    limiter.observe({"x-ratelimit-remaining": "2", "x-ratelimit-reset": "1"})
+    assert limiter._tokens == 2
+    for _ in range(3):
+        await limiter.acquire()
+    assert clock.slept == pytest.approx(0.5)  # third request waits for quota
+
+
+@pytest.mark.asyncio
+async def test_wait_unpaused_keeps_the_token():
+    clock = _Clock()
+    limiter = _limiter(clock, rate=1, burst=1)
+    limiter.pause(3)
+    await limiter.wait_unpaused()
+    assert clock.slept == pytest.approx(3)
+    await limiter.acquire()  # the banked token is still there
+    assert clock.slept == pytest.approx(3)
@@ -0,0 +1,187 @@
+import asyncio
+import logging
+
+import httpx
+import pytest
+
+from connector.breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, get_breaker
+from connector.client import APIClient
+from connector.exceptions import APIClientError, CircuitOpenError
+from connector.hedging import Hedger
+
+
+class _Down(httpx.AsyncBaseTransport):
+    def __init__(self):
+        self.calls = 0
+
+    async def handle_async_request(self, request):
+        self.calls += 1
+        return httpx.Response(503)
+
+
+def test_breaker_trips_and_half_opens():
+    br = CircuitBreaker(window=4, min_requests=4, reset_timeout=0)
+    for failure in (False, True, True, False):
+        br.record(failure)
+    assert br._state == OPEN
+    assert br.state == HALF_OPEN  # reset_timeout elapsed
+    assert br.allow() and not br.allow()  # one probe at a time
+    br.record(False)
+    assert br.state == CLOSED
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_fast():
+    client = APIClient(base_url="http://down-host", backoff_factor=0.001)
+    transport = client._client._transport = _Down()
+    client._oauth._token = "dummy"
+    client._oauth._expires_at = 9999999999
+    client._breaker.min_requests = 3
+    with pytest.raises(APIClientError):
+        await client.list_items_page(1)
+    calls = transport.calls
+    with pytest.raises(CircuitOpenError):
+        await client.list_items_page(2)
+    assert transport.calls == calls  # no network traffic while open
+    assert client.resilience_snapshot()["breaker"]["state"] == OPEN
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_hedge_beats_slow_primary():
+    hedger = Hedger(min_delay=0.01, min_samples=0)
+    delays = iter([1.0, 0.0])
+
+    async def send():
+        await asyncio.sleep(next(delays))
+        return "ok"
+
+    started = asyncio.get_running_loop().time()
+    assert await hedger.run(send) == "ok"
+    assert asyncio.get_running_loop().time() - started < 0.5
+    assert hedger.snapshot()["hedge_wins"] == 1
+
+
+@pytest.mark.asyncio
+async def test_no_hedge_without_history():
+    hedger = Hedger(min_samples=5)
+    calls = 0
+
+    async def send():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.02)
+        return calls
+
+    assert await hedger.run(send) == 1
+    assert hedger.hedged == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_cancels_primary():
+    hedger = Hedger(min_samples=0, min_delay=10)
+    cancelled = asyncio.Event()
+
+    async def send():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    task = asyncio.ensure_future(hedger.run(send))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert cancelled.is_set()
+
+
+class _CountingGate:
+    def __init__(self):
+        self.acquired = self.held = self.peak = 0
+
+    async def acquire(self):
+        self.acquired += 1
+        self.held += 1
+        self.peak = max(self.peak, self.held)
+
+    def release(self):
+        self.held -= 1
+
+
+class _SlowFirst(httpx.AsyncBaseTransport):
+    def __init__(self):
+        self.calls = 0
+
+    async def handle_async_request(self, request):
+        self.calls += 1
+        if self.calls == 1:
+            await asyncio.sleep(1)
+        return httpx.Response(200, json={"page": 1, "total_pages": 1, "items": []})
+
+
+@pytest.mark.asyncio
+async def test_hedged_attempt_takes_its_own_slot():
+    client = APIClient(base_url="http://hedge-gate")
+    client._client._transport = _SlowFirst()
+    client._oauth._token = "dummy"
+    client._oauth._expires_at = 9999999999
+    client._hedger = Hedger(min_delay=0.01, min_samples=0)
+    gate = _CountingGate()
+    client.use_scheduler(gate)
+    await client.list_items_page(1)
+    await client.close()
+    assert client._hedger.hedged == 1
+    assert (gate.acquired, gate.peak, gate.held) == (2, 2, 0)
+
+
+def test_conflicting_breaker_settings_warn(caplog):
+    breaker = get_breaker("http://breaker-conflict", min_requests=10)
+    with caplog.at_level(logging.WARNING, logger="connector"):
+        assert get_breaker("http://breaker-conflict", min_requests=10) is breaker
+        assert not caplog.records
+        get_breaker("http://breaker-conflict", min_requests=3, window=20)
+    assert breaker.min_requests == 10
+    assert "ignoring {'min_requests': 3}" in caplog.records[0].getMessage()
+
+
+class _SlowOkFastError(httpx.AsyncBaseTransport):
+    """First request: 200 after a while. Later ones: an immediate 503."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def handle_async_request(self, request):
+        self.calls += 1
+        if self.calls > 1:
+            return httpx.Response(503)
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, json={"page": 1, "total_pages": 1, "items": []})
+
+
+def _hedging_client(base_url):
+    transport = _SlowOkFastError()
+    client = APIClient(base_url=base_url, transport=transport)
+    client._oauth._token = "dummy"
+    client._oauth._expires_at = 9999999999
+    client._hedger = Hedger(min_delay=0.01, min_samples=0)
+    return client, transport
+
+
+@pytest.mark.asyncio
+async def test_failed_hedge_does_not_beat_a_slower_success():
+    client, transport = _hedging_client("http://hedge-503")
+    page = await client.list_items_page(1)
+    await client.close()
+    assert page.page == 1 and transport.calls == 2
+    assert client._hedger.hedge_wins == 0
+
+
+@pytest.mark.asyncio
+async def test_hedge_asks_the_breaker():
+    client, transport = _hedging_client("http://hedge-breaker")
+    client._breaker.allow = lambda: transport.calls == 0  # primary only
+    page = await client.list_items_page(1)
+    await client.close()
+    assert page.page == 1 and transport.calls == 1  # hedge refused, not sent
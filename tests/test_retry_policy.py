@@ -0,0 +1,147 @@
+import asyncio
+
+import httpx
+import pytest
+
+from connector.client import APIClient
+from connector.exceptions import (
+    AuthenticationError,
+    DeadlineExceededError,
+    RateLimitError,
+    ServerError,
+)
+from connector.retry import Deadline, RetryBudget, RetryPolicy
+
+
+class _Status(httpx.AsyncBaseTransport):
+    def __init__(self, status, delay=0.0, headers=None):
+        self.status = status
+        self.delay = delay
+        self.headers = headers or {}
+        self.calls = 0
+
+    async def handle_async_request(self, request):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return httpx.Response(self.status, headers=self.headers)
+
+
+def _client(base_url, transport, **kw):
+    client = APIClient(base_url=base_url, **kw)
+    client._client._transport = transport
+    client._oauth._token = "dummy"
+    client._oauth._expires_at = 9999999999
+    client._breaker = None
+    return client
+
+
+def test_decorrelated_jitter_bounds():
+    policy = RetryPolicy(base_delay=0.5, max_delay=4.0)
+    delay = 0.0
+    for attempt in range(1, 20):
+        nxt = policy.backoff(attempt, delay)
+        assert 0.5 <= nxt <= min(4.0, max(delay, 0.5) * 3)
+        delay = nxt
+    assert policy.backoff(1, delay, retry_after=3.0) == 3.0  # server wins
+    assert policy.backoff(1, delay, retry_after=7.0) == 4.0  # … up to the cap
+
+
+def test_budget_denies_retry_storm():
+    budget = RetryBudget(ratio=0.25, min_per_second=0, burst=2)
+    policy = RetryPolicy(max_attempts=10, budget=budget)
+    allowed = sum(policy.can_retry(1) for _ in range(10))
+    assert allowed == 2 and budget.denied == 8
+    for _ in range(4):
+        policy.record_request()
+    assert policy.can_retry(1)  # 4 requests * 0.25 earned one more
+
+
+def test_deadline_clamps_timeouts():
+    timeout = Deadline(0.5).clamp(httpx.Timeout(10.0, connect=0.1))
+    assert timeout.connect == 0.1
+    assert 0 < timeout.read <= 0.5
+
+
+@pytest.mark.asyncio
+async def test_5xx_retries_stop_at_budget():
+    transport = _Status(503)
+    policy = RetryPolicy(
+        5, 0.001, 0.001, budget=RetryBudget(ratio=0, min_per_second=0, burst=1)
+    )
+    client = _client("http://budget-host", transport, retry_policy=policy)
+    with pytest.raises(ServerError):
+        await client.list_items_page(1)
+    assert transport.calls == 2  # first try + the single budgeted retry
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_deadline_bounds_slow_server():
+    client = _client("http://slow-host", _Status(200, delay=1.0))
+    started = asyncio.get_running_loop().time()
+    with pytest.raises(DeadlineExceededError):
+        await client._request("GET", "/items", deadline=0.1)
+    assert asyncio.get_running_loop().time() - started < 0.5
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_401_refresh_limit():
+    transport = _Status(401)
+    client = _client("http://revoked-host", transport)
+    refreshes = 0
+
+    async def refresh(stale_token=None):
+        nonlocal refreshes
+        refreshes += 1
+        return "still-bad"
+
+    client._oauth.refresh = refresh
+    with pytest.raises(AuthenticationError):
+        await client.list_items_page(1)
+    assert refreshes == 1 and transport.calls == 2
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_deadline_covers_token_fetch():
+    client = _client("http://slow-token", _Status(200, delay=1))
+    client._oauth._expires_at = 1.0  # expired: forces a POST to the slow endpoint
+    started = asyncio.get_running_loop().time()
+    with pytest.raises(DeadlineExceededError):
+        await client._request("GET", "/items", deadline=0.1)
+    assert asyncio.get_running_loop().time() - started < 0.5
+    await client.close()
+
+
+class _SlowGate:
+    async def acquire(self):
+        await asyncio.sleep(0.3)
+
+    def release(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_latency_excludes_admission_wait():
+    client = _client("http://queued", _Status(200))
+    client.use_scheduler(_SlowGate())
+    latencies = []
+    client._feedback = lambda latency, status: latencies.append(latency)
+    await client._request("GET", "/items")
+    await client.close()
+    assert latencies and latencies[0] < 0.1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status,error", [(429, RateLimitError), (503, ServerError)])
+async def test_excessive_retry_after_fails_fast(status, error):
+    transport = _Status(status, headers={"Retry-After": "3600"})
+    client = _client(f"http://retry-after-{status}", transport)
+    started = asyncio.get_running_loop().time()
+    with pytest.raises(error):
+        await client.list_items_page(1)
+    assert asyncio.get_running_loop().time() - started < 1
+    assert transport.calls == 1
+    assert client._rate_limiter.paused_for == 0  # nobody else parked either
+    await client.close()
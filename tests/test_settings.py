@@ -0,0 +1,60 @@
+import asyncio
+import os
+import threading
+
+import pytest
+
+from connector.config import Settings, get_settings, reload_settings
+from connector.secret_provider import CachingSecretProvider, FileProvider
+
+
+def test_settings_are_memoized_until_reload():
+    assert get_settings() is get_settings()
+    old = get_settings()
+    try:
+        assert reload_settings() is not old
+    finally:
+        reload_settings()
+
+
+@pytest.mark.asyncio
+async def test_file_secrets_cached_and_read_off_loop(tmp_path, monkeypatch):
+    monkeypatch.setattr(FileProvider, "_BASE", tmp_path)
+    secret = tmp_path / "acme_client_secret"
+    secret.write_text("one\n")
+    reads = []
+    real_read = FileProvider._read
+
+    def _read(self, path):
+        reads.append(threading.current_thread() is threading.main_thread())
+        return real_read(self, path)
+
+    monkeypatch.setattr(FileProvider, "_read", _read)
+    s = Settings(provider="acme", secret_backend="docker", client_secret=None)
+    values = await asyncio.gather(*(s.client_secret_async() for _ in range(5)))
+    assert values == ["one"] * 5
+    assert reads == [False]  # one read, in a worker thread
+
+    # rotation: picked up once the TTL lapses and the mtime moved
+    s._provider_backend().ttl = 0
+    assert await s.client_secret_async() == "one"
+    assert len(reads) == 1  # unchanged mtime – no re-read
+    secret.write_text("two\n")
+    os.utime(secret, (secret.stat().st_atime, secret.stat().st_mtime + 5))
+    assert await s.client_secret_async() == "two"
+
+
+@pytest.mark.asyncio
+async def test_invalidate_forces_reread(monkeypatch):
+    monkeypatch.setenv("acme_client_id", "a")
+
+    class _Env(FileProvider):
+        async def get(self, name):
+            return os.environ[name]
+
+    cache = CachingSecretProvider(_Env(), ttl=3600)
+    assert await cache.get("acme_client_id") == "a"
+    monkeypatch.setenv("acme_client_id", "b")
+    assert await cache.get("acme_client_id") == "a"
+    cache.invalidate()
+    assert await cache.get("acme_client_id") == "b"
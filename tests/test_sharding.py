@@ -0,0 +1,30 @@
+import pytest
+
+from connector.sharding import Batch, ShardedRunner, Tenant
+
+
+def _sim_tenant(name, **kw):
+    return Tenant(name, options={"base_url": "http://sim"}, app="simapi.main:app", **kw)
+
+
+@pytest.mark.asyncio
+async def test_tenants_are_synced_across_worker_processes():
+    tenants = [_sim_tenant(f"t{n}") for n in range(3)]
+    tenants.append(_sim_tenant("broken", call="no_such_call"))
+    runner = ShardedRunner(
+        tenants, workers=2, batch_size=4, queue_size=2, env={"SIM_ITEMS": "10"}
+    )
+    records, done = {}, {}
+    async for message in runner.stream():
+        if isinstance(message, Batch):
+            assert len(message.records) <= 4
+            records.setdefault(message.tenant, []).extend(message.records)
+        else:
+            done[message.tenant] = message
+
+    for n in range(3):
+        ids = [r["id"] for r in records[f"t{n}"]]
+        assert ids == list(range(1, 11))
+        assert done[f"t{n}"].ok and done[f"t{n}"].records == 10
+    assert not done["broken"].ok and "no_such_call" in done["broken"].error
+    assert {d.worker for d in done.values()} <= {0, 1}
@@ -0,0 +1,87 @@
+import time
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from httpx._transports.asgi import ASGITransport
+
+from connector.client import APIClient
+from simapi.config import configure, state
+from simapi.main import app as fastapi_app
+
+AUTH = {"Authorization": "Bearer simtoken"}
+
+
+@pytest.fixture(autouse=True)
+def restore_sim():
+    saved = state.config
+    yield
+    state.apply(saved)
+
+
+@pytest_asyncio.fixture
+async def sim():
+    transport = ASGITransport(app=fastapi_app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as ac:
+        yield ac
+
+
+@pytest.mark.asyncio
+async def test_huge_dataset_is_generated_lazily(sim):
+    configure(items=2_000_000, page_size=1000)
+    resp = await sim.get("/items", params={"page": 2000}, headers=AUTH)
+    body = resp.json()
+    assert body["total_pages"] == 2000 and body["next_page"] is None
+    assert body["items"][-1]["id"] == 2_000_000
+
+
+@pytest.mark.asyncio
+async def test_cursor_pagination(sim):
+    configure(items=7)
+    ids, cursor = [], ""
+    while cursor is not None:
+        params = {"cursor": cursor, "limit": 3}
+        body = (await sim.get("/items", params=params, headers=AUTH)).json()
+        ids += [i["id"] for i in body["items"]]
+        cursor = body["next_cursor"]
+    assert ids == list(range(1, 8))
+
+
+@pytest.mark.asyncio
+async def test_injected_429_and_config_endpoint(sim):
+    resp = await sim.post(
+        "/_sim/config", json={"error_rate_429": 1, "retry_after": 2}
+    )
+    assert resp.json()["config"]["error_rate_429"] == 1
+    resp = await sim.get("/items", headers=AUTH)
+    assert resp.status_code == 429 and resp.headers["Retry-After"] == "2"
+    bad = await sim.post("/_sim/config", json={"error_rate_5xx": 3})
+    assert bad.status_code == 422
+
+
+def test_5xx_bursts():
+    configure(error_rate_5xx=1, error_burst=3)
+    assert state.fault() == 503
+    state.config = state.config.model_copy(update={"error_rate_5xx": 0})
+    assert [state.fault() for _ in range(3)] == [503, 503, None]
+
+
+@pytest.mark.asyncio
+async def test_slow_body(sim):
+    configure(slow_body_ms=80)
+    started = time.perf_counter()
+    resp = await sim.get("/items", headers=AUTH)
+    assert time.perf_counter() - started >= 0.06
+    assert resp.json()["total_pages"] == 3
+
+
+@pytest.mark.asyncio
+async def test_client_survives_token_revocation():
+    configure(items=12, revoke_every=2)
+    client = APIClient(
+        base_url="http://testserver", transport=ASGITransport(app=fastapi_app)
+    )
+    items = await client.list_all_items(concurrent=False)
+    await client.close()
+    assert [i.id for i in items] == list(range(1, 13))
+    assert state.stats["revocations"] >= 3
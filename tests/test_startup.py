@@ -0,0 +1,69 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+import connector
+from connector import registry
+from connectors.sim import SimConnector
+
+HEAVY = ("httpx", "pydantic", "pydantic_settings", "connector.config")
+
+
+def _loaded_after(code: str) -> list:
+    probe = f"{code}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"
+    out = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, text=True, check=True
+    )
+    return json.loads(out.stdout.splitlines()[-1])
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import connector",
+        "from connector import registry; registry.available_connectors()",
+    ],
+)
+def test_light_imports_skip_heavy_dependencies(code, tmp_path, monkeypatch):
+    monkeypatch.setenv("CONNECTOR_PLUGIN_INDEX", str(tmp_path / "plugins.json"))
+    modules = _loaded_after(code)
+    assert not [m for m in HEAVY if m in modules]
+
+
+def test_package_attributes_are_lazy():
+    from connector.client import APIClient
+
+    assert connector.APIClient is APIClient
+    assert "APIClient" in dir(connector)
+    with pytest.raises(AttributeError):
+        connector.NoSuchThing  # noqa: B018
+
+
+@pytest.fixture
+def index(tmp_path, monkeypatch):
+    monkeypatch.setenv("CONNECTOR_PLUGIN_INDEX", str(tmp_path / "plugins.json"))
+    monkeypatch.setattr(registry, "_discovered", None)
+    yield tmp_path / "plugins.json"
+    registry._discovered = None
+
+
+def test_plugin_index_is_cached_until_sys_path_changes(index, monkeypatch, tmp_path):
+    scans = []
+    found = {"acme": "connectors.sim:SimConnector"}
+    monkeypatch.setattr(registry, "_scan", lambda: scans.append(1) or dict(found))
+
+    assert registry.discovered_plugins() == found
+    assert json.loads(index.read_text())["plugins"] == found
+    registry._discovered = None
+    assert registry.discovered_plugins() == found
+    assert len(scans) == 1  # second process-start equivalent read the index
+
+    registry._discovered = None
+    monkeypatch.syspath_prepend(str(tmp_path))  # e.g. a new install location
+    registry.discovered_plugins()
+    assert len(scans) == 2
+
+    assert registry.get_connector("acme") is SimConnector
+    assert registry.available_connectors()["sim"] == "connectors.sim.SimConnector"
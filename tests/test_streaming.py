@@ -0,0 +1,74 @@
+import asyncio
+
+import httpx
+import pytest
+
+from connector.utils import iter_prefetched
+from connectors.sim import SimConnector
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("prefetch", [1, 3])
+async def test_iter_items_in_order(live_client, prefetch):
+    ids = [i.id async for i in live_client.iter_items(prefetch=prefetch)]
+    assert ids == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.asyncio
+async def test_iter_users_streams_all_pages(live_client):
+    ids = [u.id async for u in live_client.iter_users(prefetch=2)]
+    assert ids == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.asyncio
+async def test_iter_items_early_exit(live_client):
+    stream = live_client.iter_items(prefetch=2)
+    first = await stream.__anext__()  # stop after one item
+    await stream.aclose()
+    assert first.id == 1
+
+
+@pytest.mark.asyncio
+async def test_prefetch_bounds_in_flight_fetches():
+    in_flight = peak = 0
+
+    async def fetch(page):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.005)
+        in_flight -= 1
+        return page
+
+    seen = []
+    async for page in iter_prefetched(fetch, range(1, 21), prefetch=3):
+        seen.append(page)
+        await asyncio.sleep(0.01)  # slow consumer
+        assert in_flight <= 3
+    assert seen == list(range(1, 21))
+    assert peak == 3
+
+
+def _linked_pages(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/oauth2/token":
+        return httpx.Response(
+            200, json={"access_token": "t", "token_type": "Bearer", "expires_in": 600}
+        )
+    page = int(request.url.params["page"])
+    body = {
+        "items": [page * 10, page * 10 + 1],
+        "next_page": page + 1 if page < 4 else None,
+    }
+    return httpx.Response(200, json=body)
+
+
+@pytest.mark.asyncio
+async def test_pages_without_total_follow_next_page():
+    client = SimConnector(
+        base_url="http://linked", transport=httpx.MockTransport(_linked_pages)
+    )
+    try:
+        records = [r async for r in client._iter_pages("list_users", prefetch=2)]
+    finally:
+        await client.close()
+    assert records == [10, 11, 20, 21, 30, 31, 40, 41]
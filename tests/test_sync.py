@@ -0,0 +1,77 @@
+import pytest
+import pytest_asyncio
+from httpx._transports.asgi import ASGITransport
+
+from connector.client import APIClient
+from connector.sync import IncrementalSync, ItemStore
+from connectors.sim import SimConnector
+from simapi.config import configure, state
+from simapi.main import app as fastapi_app
+
+
+@pytest.fixture(autouse=True)
+def sim_items():
+    saved = state.config
+    configure(items=20, page_size=5)
+    yield
+    state.apply(saved)
+
+
+def _client(cls=APIClient):
+    return cls(base_url="http://testserver", transport=ASGITransport(app=fastapi_app))
+
+
+@pytest_asyncio.fixture
+async def client():
+    c = _client()
+    yield c
+    await c.close()
+
+
+@pytest.mark.asyncio
+async def test_unchanged_pages_are_skipped(client):
+    store = ItemStore()
+    sync = IncrementalSync(client, store)
+
+    first = await sync.run()
+    assert (first.mode, first.upserted, first.pages_skipped) == ("full", 20, 0)
+    assert [i.id for i in store.items()] == list(range(1, 21))
+
+    again = await sync.run()
+    assert (again.requests, again.pages_skipped, again.upserted) == (4, 4, 0)
+
+    state.mutate([3, 17])
+    changed = await sync.run()
+    assert (changed.pages_skipped, changed.upserted, changed.unchanged) == (2, 2, 8)
+    assert store.get(3).name == "Item 3 v1"
+
+
+@pytest.mark.asyncio
+async def test_change_feed_after_full_pass(tmp_path):
+    path = tmp_path / "items.db"
+    connector = _client(SimConnector)
+    try:
+        store = ItemStore(path)
+        full = await IncrementalSync(connector, store).run()
+        assert full.mode == "full" and full.since == "0"
+        store.close()
+
+        state.mutate([5, 6, 5])
+        store = ItemStore(path)  # token and validators survive a restart
+        delta = await IncrementalSync(connector, store).run()
+    finally:
+        await connector.close()
+
+    assert (delta.mode, delta.requests, delta.upserted) == ("delta", 1, 2)
+    assert delta.since == "3" and store.get_meta("since") == "3"
+    assert store.get(5).name == "Item 5 v2" and len(store) == 20
+
+
+@pytest.mark.asyncio
+async def test_change_feed_pages_with_limit(client):
+    state.mutate(range(1, 8))
+    body = (
+        await client._request("GET", "/items", params={"since": "2", "limit": 3})
+    ).json()
+    assert [i["id"] for i in body["items"]] == [3, 4, 5]
+    assert body["next_since"] == "5" and body["has_more"]
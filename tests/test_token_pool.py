@@ -0,0 +1,118 @@
+import asyncio
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
+
+from connector.client import APIClient
+from connector.config import reload_settings
+
+
+class _Provider:
+    """Token endpoint issuing tok-<client_id>; items endpoint throttles some."""
+
+    def __init__(self, throttled=(), quota=None):
+        self.throttled = set(throttled)
+        self.quota = quota or {}  # token → (X-RateLimit-Remaining, -Reset)
+        self.token_posts = 0
+        self.seen = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/oauth2/token":
+            self.token_posts += 1
+            form = parse_qs(request.content.decode())
+            token = f"tok-{form['client_id'][0]}"
+            return httpx.Response(
+                200, json={"access_token": token, "token_type": "Bearer", "expires_in": 600}
+            )
+        token = request.headers["Authorization"].split()[1]
+        self.seen.append(token)
+        await asyncio.sleep(0.01)
+        if token in self.throttled:
+            return httpx.Response(429, headers={"Retry-After": "30"})
+        body = {"items": [], "page": 1, "total_pages": 1, "next_page": None}
+        headers = {}
+        if token in self.quota:
+            remaining, reset = self.quota[token]
+            headers = {"X-RateLimit-Remaining": remaining, "X-RateLimit-Reset": reset}
+        return httpx.Response(200, json=body, headers=headers)
+
+
+@pytest.fixture
+def three_credentials(monkeypatch):
+    monkeypatch.setenv("PROVIDER", "pool")
+    monkeypatch.setenv("SECRET_BACKEND", "env")
+    monkeypatch.setenv("CREDENTIAL_COUNT", "3")
+    monkeypatch.setenv("CLIENT_ID", "c1")
+    for n in (2, 3):
+        monkeypatch.setenv(f"pool_client_id_{n}", f"c{n}")
+        monkeypatch.setenv(f"pool_client_secret_{n}", f"s{n}")
+    reload_settings()
+    yield
+    monkeypatch.undo()
+    reload_settings()
+
+
+def _client(provider, base_url):
+    return APIClient(base_url=base_url, transport=httpx.MockTransport(provider))
+
+
+@pytest.mark.asyncio
+async def test_requests_spread_over_credentials(three_credentials):
+    provider = _Provider()
+    client = _client(provider, "http://pool-spread")
+    await asyncio.gather(*(client.list_items_page(p) for p in range(1, 7)))
+    snapshot = client.resilience_snapshot()["credentials"]
+    await client.close()
+    assert provider.token_posts == 3
+    assert sorted(provider.seen) == ["tok-c1", "tok-c1", "tok-c2", "tok-c2", "tok-c3", "tok-c3"]
+    assert [snapshot[n]["requests"] for n in (1, 2, 3)] == [2, 2, 2]
+
+
+@pytest.mark.asyncio
+async def test_throttled_credential_is_skipped(three_credentials):
+    provider = _Provider(throttled={"tok-c1"})
+    client = _client(provider, "http://pool-429")
+    started = asyncio.get_running_loop().time()
+    await client.list_items_page(1)  # lands on c1, switches without waiting
+    await asyncio.gather(*(client.list_items_page(p) for p in range(2, 6)))
+    elapsed = asyncio.get_running_loop().time() - started
+    snapshot = client.resilience_snapshot()["credentials"]
+    await client.close()
+    assert elapsed < 1
+    assert provider.seen.count("tok-c1") == 1
+    assert snapshot[1]["throttles"] == 1 and snapshot[1]["throttled_for"] > 20
+
+
+@pytest.mark.asyncio
+async def test_exhausted_quota_only_sidelines_that_credential(three_credentials):
+    quota = {"tok-c1": ("0", "2"), "tok-c2": ("1000", "60"), "tok-c3": ("1000", "60")}
+    provider = _Provider(quota=quota)
+    client = _client(provider, "http://pool-quota")
+    started = asyncio.get_running_loop().time()
+    for page in range(1, 5):
+        await client.list_items_page(page)
+    elapsed = asyncio.get_running_loop().time() - started
+    snapshot = client.resilience_snapshot()["credentials"]
+    await client.close()
+    assert elapsed < 1  # not one 2s pause of the whole provider
+    assert provider.seen.count("tok-c1") == 1
+    assert snapshot[1]["throttled_for"] > 1
+    assert client._rate_limiter.paused_for == 0
+
+
+@pytest.mark.asyncio
+async def test_file_cache_shares_tokens_across_clients(monkeypatch, tmp_path):
+    monkeypatch.setenv("TOKEN_CACHE_PATH", str(tmp_path / "tokens.json"))
+    reload_settings()
+    try:
+        provider = _Provider()
+        for _ in range(2):  # e.g. a restarted process
+            client = _client(provider, "http://pool-cache")
+            await client.list_items_page(1)
+            await client.close()
+    finally:
+        monkeypatch.undo()
+        reload_settings()
+    assert provider.token_posts == 1
+    assert (tmp_path / "tokens.json").stat().st_mode & 0o777 == 0o600
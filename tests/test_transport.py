@@ -0,0 +1,53 @@
+import asyncio
+
+import httpx
+import pytest
+from httpx._transports.asgi import ASGITransport
+
+from connector.client import APIClient
+from connector.transport import get_transport_manager
+from simapi.main import app as fastapi_app
+
+
+@pytest.mark.asyncio
+async def test_clients_share_one_pool_until_last_close():
+    a = APIClient(base_url="http://pooled")
+    b = APIClient(base_url="http://pooled")
+    assert a._client is b._client
+    shared = a._client
+    assert get_transport_manager().users(shared) == 2
+
+    await a.close()
+    assert not shared.is_closed
+    await a.close()  # idempotent – must not release twice
+    assert get_transport_manager().users(shared) == 1
+
+    await b.close()
+    assert shared.is_closed
+
+
+@pytest.mark.asyncio
+async def test_custom_transport_gets_private_client():
+    client = APIClient(
+        base_url="http://testserver", transport=ASGITransport(app=fastapi_app)
+    )
+    assert get_transport_manager().users(client._client) == 0
+    assert isinstance(client._client.timeout, httpx.Timeout)
+    items = await client.list_all_items()
+    assert len(items) == 5
+    await client.close()
+    assert client._client.is_closed
+
+
+def test_each_event_loop_gets_its_own_pool():
+    async def open_client():
+        return APIClient(base_url="http://per-loop")
+
+    first = asyncio.run(open_client())
+    second = asyncio.run(open_client())
+    assert first._client is not second._client
+    keys = [k for k in get_transport_manager().stats() if k[1] == "http://per-loop"]
+    assert len(keys) == 2
+    asyncio.run(first.close())
+    asyncio.run(second.close())
+    assert first._client.is_closed and second._client.is_closed